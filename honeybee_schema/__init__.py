@@ -1 +1,19 @@
+"""Honeybee Data-Model Objects."""
+from ._lazy import lazy_loader
 
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'Model': 'model',
+    'Room': 'model',
+    'Face': 'model',
+    'Aperture': 'model',
+    'Door': 'model',
+    'Shade': 'model',
+    'ShadeMesh': 'model',
+    'Face3D': 'geometry',
+    'Mesh3D': 'geometry',
+    'ValidationReport': 'validation',
+    'ValidationError': 'validation',
+    'ComparisonReport': 'comparison',
+    'SyncInstructions': 'comparison',
+    'ProjectInfo': 'projectinfo'
+})
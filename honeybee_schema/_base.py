@@ -10,7 +10,7 @@ class NoExtraBaseModel(BaseModel):
     that are assigned to geometry objects.
     """
 
-    model_config = ConfigDict(extra='forbid')
+    model_config = ConfigDict(extra='forbid', defer_build=True)
 
 
 class IDdBaseModel(NoExtraBaseModel):
@@ -0,0 +1,36 @@
+"""Lazy loading of the classes exposed by the honeybee_schema packages."""
+import importlib
+
+
+def lazy_loader(package, classes):
+    """Get module __getattr__ and __dir__ functions that import classes on first use.
+
+    This keeps the import of a package cheap since none of the modules
+    (nor their pydantic validators) are loaded until one of their classes
+    is accessed from the package.
+
+    Args:
+        package: Text for the name of the package (typically __name__).
+        classes: A dictionary with the names of the classes exposed by the
+            package as keys and the names of the modules in the package
+            that define them as values.
+
+    Returns:
+        A tuple with the __getattr__ and __dir__ functions for the package.
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name):
+        try:
+            module_name = classes[name]
+        except KeyError:
+            raise AttributeError(
+                'module {!r} has no attribute {!r}'.format(package, name))
+        module = importlib.import_module('{}.{}'.format(package, module_name))
+        value = namespace[name] = getattr(module, name)
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(classes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,182 @@
+"""Utilities for building ValidationReports from the checks of this package."""
+import re
+import json
+
+from .validation import ValidationReport, ValidationError, ValidationParent
+
+# error code used for objects that do not comply with the schema
+SCHEMA_ERROR_CODE = '000000'
+
+# the ObjectTypes used to report errors for items in the lists of a Model
+_LIST_ELEMENT_TYPES = {
+    'rooms': 'Room',
+    'orphaned_faces': 'Face',
+    'orphaned_shades': 'Shade',
+    'orphaned_apertures': 'Aperture',
+    'orphaned_doors': 'Door',
+    'shade_meshes': 'Shade',
+    'construction_sets': 'ConstructionSet',
+    'constructions': 'Construction',
+    'materials': 'Material',
+    'hvacs': 'HVAC',
+    'shws': 'SHW',
+    'program_types': 'ProgramType',
+    'schedules': 'Schedule',
+    'schedule_type_limits': 'ScheduleTypeLimit',
+    'modifiers': 'Modifier',
+    'modifier_sets': 'ModifierSet',
+    'sensor_grids': 'SensorGrid',
+    'views': 'View'
+}
+# the ObjectTypes of the geometry objects that can be nested inside a Room
+_CHILD_ELEMENT_TYPES = {
+    'faces': 'Face',
+    'apertures': 'Aperture',
+    'doors': 'Door',
+    'indoor_shades': 'Shade',
+    'outdoor_shades': 'Shade'
+}
+# the ExtensionTypes of the elements within the extension properties of a Model
+_EXTENSION_TYPES = {'energy': 'Energy', 'radiance': 'Radiance'}
+_PARENT_ID = re.compile(r'^[.A-Za-z0-9_-]{1,100}$')
+_ELEMENT_ID = re.compile(r'^[^,;!\n\t]{1,100}$')
+
+
+def schema_version():
+    """Get the version of the installed honeybee-schema as major.minor.patch."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        return '.'.join(version('honeybee-schema').split('.')[:3])
+    except (ImportError, PackageNotFoundError, ValueError):
+        return '0.0.0'
+
+
+def validation_report(errors, fatal_error=''):
+    """Get a ValidationReport from a list of ValidationErrors.
+
+    Args:
+        errors: A list of ValidationError objects (or their dictionaries).
+        fatal_error: Text for an exception that prevented the Model from
+            being validated. (Default: '').
+    """
+    version = schema_version()
+    return ValidationReport(
+        app_version=version, schema_version=version,
+        valid=not errors and not fatal_error,
+        fatal_error=fatal_error, errors=errors
+    )
+
+
+def validation_parent(parent_type, obj):
+    """Get a ValidationParent for an object or None if it has no valid identifier.
+
+    Args:
+        parent_type: Text for the ParentTypes of the object (eg. Room).
+        obj: A schema object or a dictionary with an identifier.
+    """
+    if isinstance(obj, dict):
+        identifier, name = obj.get('identifier'), obj.get('display_name')
+    else:
+        identifier, name = obj.identifier, obj.display_name
+    if not isinstance(identifier, str) or not _PARENT_ID.match(identifier):
+        return None
+    return ValidationParent(parent_type=parent_type, id=identifier, name=name)
+
+
+def validation_error(
+        code, error_type, element_type, element_id, message, extension_type='Core',
+        element_name=None, parents=None, top_parents=None, helper_geometry=None):
+    """Get a ValidationError object.
+
+    Args:
+        code: Text with 6 digits for the error code.
+        error_type: A human-readable version of the error code.
+        element_type: Text for the ObjectTypes of the object that caused the error.
+        element_id: A list of identifiers for the objects that caused the error.
+        message: Text for the error message.
+        extension_type: Text for the extension from which the error originated.
+        element_name: An optional list of display names for the objects.
+        parents: An optional list of lists of ValidationParent for each
+            object in the element_id, starting from the nearest parent.
+        top_parents: An optional list of top-level ValidationParents.
+        helper_geometry: An optional list of geometry objects that helps
+            illustrate the error.
+    """
+    optional = {
+        'element_name': element_name, 'parents': parents,
+        'top_parents': top_parents, 'helper_geometry': helper_geometry
+    }
+    return ValidationError(
+        code=code, error_type=error_type, extension_type=extension_type,
+        element_type=element_type, element_id=element_id, message=message,
+        **{key: value for key, value in optional.items() if value is not None}
+    )
+
+
+def _element_id(obj, fallback):
+    """Get an identifier to report for a dictionary that may not be valid."""
+    identifier = obj.get('identifier') if isinstance(obj, dict) else None
+    if isinstance(identifier, str) and _ELEMENT_ID.match(identifier):
+        return identifier
+    return fallback
+
+
+def schema_errors(path, json_text, error):
+    """Get ValidationErrors for an element of a Model that failed schema validation.
+
+    The errors are grouped by the deepest geometry object in which they occur
+    (eg. an Aperture within a Room) such that the reported parents locate
+    each error within the Model.
+
+    Args:
+        path: A tuple for the location of the element in the Model JSON
+            (eg. ('rooms', 0)) as yielded by stream.iter_model_elements.
+        json_text: The raw JSON text of the element.
+        error: The pydantic ValidationError raised for the element.
+
+    Returns:
+        A list of ValidationError objects.
+    """
+    element = json.loads(json_text)
+    list_name, index = path[-2], path[-1]
+    extension_type = _EXTENSION_TYPES.get(path[1], 'Core') \
+        if len(path) > 2 and path[0] == 'properties' else 'Core'
+    top_type = _LIST_ELEMENT_TYPES[list_name]
+    top_id = _element_id(element, '{}[{}]'.format(list_name, index))
+
+    grouped = {}
+    for detail in error.errors():
+        obj, obj_type, obj_id, parents = element, top_type, top_id, []
+        loc = detail['loc']
+        if top_type == 'Room':
+            for i, key in enumerate(loc[:-1]):
+                child_type = _CHILD_ELEMENT_TYPES.get(key)
+                if child_type is None or not isinstance(loc[i + 1], int):
+                    continue
+                try:
+                    child = obj[key][loc[i + 1]]
+                except (KeyError, IndexError, TypeError):
+                    break
+                parent = validation_parent(obj_type, obj)
+                if parent is not None:
+                    parents.insert(0, parent)
+                obj, obj_type = child, child_type
+                obj_id = _element_id(child, '{}[{}]'.format(key, loc[i + 1]))
+        message = '{}: {}'.format('.'.join(str(k) for k in loc), detail['msg']) \
+            if loc else detail['msg']
+        key = (obj_type, obj_id, tuple(p.id for p in parents))
+        if key not in grouped:
+            name = obj.get('display_name') if isinstance(obj, dict) else None
+            grouped[key] = [obj_type, obj_id, name, parents, []]
+        grouped[key][-1].append(message)
+
+    errors = []
+    for obj_type, obj_id, name, parents, messages in grouped.values():
+        errors.append(validation_error(
+            SCHEMA_ERROR_CODE, 'Schema Validation Error', obj_type, [obj_id],
+            '{} "{}" is not valid.\n{}'.format(obj_type, obj_id, '\n'.join(messages)),
+            extension_type=extension_type,
+            element_name=[name] if isinstance(name, str) else None,
+            parents=[parents] if parents else None
+        ))
+    return errors
@@ -0,0 +1,334 @@
+"""Binary sidecar files (.hbbin) for the coordinates of Model JSON files.
+
+A Model is split into two files. The .hbbin file contains all coordinates of
+the Face3Ds, Mesh3Ds, Sensors and Planes of the Model in one contiguous buffer
+of little-endian float64 values. The structural Model JSON file contains all
+other keys of the Model, where each list of coordinates is replaced with a
+reference of the form {"hbbin": index} to an array of the .hbbin file.
+
+The .hbbin file is made of a 16-byte header (the bytes b'HBBIN\\x00', a uint16
+format version and a uint64 count of arrays), an offset table of count + 1
+uint64 values, which give the start and end of each array in the buffer as
+a number of floats, and the float64 buffer itself.
+
+Geometry objects are recognized by their type key such that objects without
+a type are left in the structural JSON. All coordinates are restored to the
+same float64 values, though integer coordinates are restored as floats.
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+from array import array
+from itertools import chain
+
+from .geometry import PointArray
+
+MAGIC = b'HBBIN\x00'
+VERSION = 1
+REFERENCE_KEY = 'hbbin'
+
+_HEADER = struct.Struct('<6sHQ')
+_SENSOR_KEYS = ({'pos', 'dir'}, {'type', 'pos', 'dir'})
+_PLANE_KEYS = ('n', 'o', 'x')
+
+
+def sidecar_path(hbjson_path):
+    """Get the default path of the .hbbin file that accompanies a structural JSON.
+    """
+    return os.path.splitext(hbjson_path)[0] + '.hbbin'
+
+
+class _ArrayWriter:
+    """Collector of the arrays of coordinates written to a .hbbin file."""
+    __slots__ = ('values', 'offsets')
+
+    def __init__(self):
+        self.values = array('d')
+        self.offsets = array('Q', [0])
+
+    def add(self, values):
+        """Add an iterable of floats to the buffer and get a reference to it."""
+        self.values.extend(values)
+        self.offsets.append(len(self.values))
+        return {REFERENCE_KEY: len(self.offsets) - 2}
+
+    def write(self, file_path):
+        values, offsets = self.values, self.offsets
+        if sys.byteorder == 'big':
+            values, offsets = array('d', values), array('Q', offsets)
+            values.byteswap()
+            offsets.byteswap()
+        with open(file_path, 'wb') as bin_file:
+            bin_file.write(_HEADER.pack(MAGIC, VERSION, len(offsets) - 1))
+            offsets.tofile(bin_file)
+            values.tofile(bin_file)
+
+
+def _is_reference(value):
+    return isinstance(value, dict) and REFERENCE_KEY in value
+
+
+def _split_geometry(obj, writer):
+    """Move the coordinates of a geometry object to an _ArrayWriter.
+
+    Returns:
+        A dictionary with the keys of the object that hold coordinates and
+        the references to their arrays, which is empty if the object is not
+        a geometry object.
+    """
+    obj_type, split = obj.get('type'), {}
+    if obj_type == 'Face3D':
+        split['boundary'] = writer.add(chain.from_iterable(obj['boundary']))
+        if obj.get('holes'):
+            split['holes'] = [writer.add(chain.from_iterable(hole))
+                              for hole in obj['holes']]
+    elif obj_type == 'Mesh3D':
+        split['vertices'] = writer.add(chain.from_iterable(obj['vertices']))
+    elif obj_type == 'Plane':
+        for key in _PLANE_KEYS:
+            if obj.get(key) is not None:
+                split[key] = writer.add(obj[key])
+    elif obj_type == 'SensorGrid':
+        sensors = obj['sensors']
+        key_sets = set(frozenset(sensor) for sensor in sensors)
+        if len(key_sets) == 1 and set(key_sets.pop()) in _SENSOR_KEYS:
+            split['sensors'] = writer.add(
+                chain.from_iterable(s['pos'] + s['dir'] for s in sensors))
+            if 'type' in sensors[0]:
+                split['sensors']['type'] = 'Sensor'
+    return split
+
+
+def _split(obj, writer):
+    """Get a copy of a JSON object with all coordinates moved to an _ArrayWriter.
+
+    The keys that hold coordinates are replaced before the other values are
+    copied such that the lists of coordinates are never copied themselves.
+    """
+    if isinstance(obj, list):
+        return [_split(item, writer) for item in obj]
+    if not isinstance(obj, dict):
+        return obj
+    split = _split_geometry(obj, writer)
+    return {key: split[key] if key in split else _split(value, writer)
+            for key, value in obj.items()}
+
+
+def write_binary_model(model_dict, hbjson_path, hbbin_path=None):
+    """Write a Model dictionary to a structural JSON file and a .hbbin file.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+        hbjson_path: Path to the structural JSON file to be written.
+        hbbin_path: Path to the .hbbin file to be written. If None, it will be
+            next to the JSON file with the same name and a .hbbin extension.
+
+    Returns:
+        The number of coordinate arrays in the .hbbin file.
+    """
+    writer = _ArrayWriter()
+    structure = _split(model_dict, writer)
+    writer.write(hbbin_path or sidecar_path(hbjson_path))
+    with open(hbjson_path, 'w', encoding='utf-8') as json_file:
+        json.dump(structure, json_file)
+    return len(writer.offsets) - 1
+
+
+class GeometryBuffer:
+    """A memory-mapped .hbbin file with zero-copy access to its coordinate arrays.
+
+    Args:
+        file_path: Path to a .hbbin file.
+
+    Usage:
+
+    .. code-block:: python
+
+        with GeometryBuffer('model.hbbin') as buffer:
+            boundary = buffer.points(0)
+    """
+    __slots__ = ('file_path', '_file', '_mmap', '_values', '_offsets')
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._values = None
+        self._file = open(file_path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # an empty file cannot be mapped
+            self._file.close()
+            raise ValueError('"{}" is not a valid .hbbin file.'.format(file_path))
+        try:
+            self._read_table()
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_table(self):
+        size = len(self._mmap)
+        if size < _HEADER.size:
+            raise ValueError('"{}" is not a valid .hbbin file.'.format(self.file_path))
+        magic, version, count = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            raise ValueError('"{}" is not a valid .hbbin file.'.format(self.file_path))
+        if version != VERSION:
+            raise ValueError('Unsupported .hbbin format version {} in "{}".'.format(
+                version, self.file_path))
+        start = _HEADER.size + 8 * (count + 1)
+        offsets = array('Q')
+        offsets.frombytes(self._mmap[_HEADER.size:start])
+        if sys.byteorder == 'big':
+            offsets.byteswap()
+        if len(offsets) != count + 1 or size != start + 8 * offsets[-1]:
+            raise ValueError('The size of "{}" does not match its offset '
+                             'table.'.format(self.file_path))
+        self._offsets = offsets
+        if sys.byteorder == 'big':  # the buffer must be copied to swap the bytes
+            values = array('d')
+            values.frombytes(self._mmap[start:])
+            values.byteswap()
+            self._values = memoryview(values)
+        else:
+            self._values = memoryview(self._mmap)[start:].cast('d')
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        """Get a zero-copy memoryview of the float64 values of an array."""
+        return self._values[self._offsets[index]:self._offsets[index + 1]]
+
+    def points(self, index):
+        """Get an array as a PointArray that shares the memory of the file."""
+        return PointArray(self[index])
+
+    def close(self):
+        """Close the file once no PointArrays that share its memory are in use."""
+        if getattr(self, '_values', None) is not None:
+            self._values.release()
+        try:
+            self._mmap.close()
+        except BufferError:  # views of the buffer are still in use
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return 'GeometryBuffer: {} ({} arrays)'.format(self.file_path, len(self))
+
+
+def _points(reference, buffer, compact):
+    point_array = buffer.points(reference[REFERENCE_KEY])
+    return point_array if compact else point_array.tolist()
+
+
+def _join(obj, buffer, compact):
+    """Get a copy of a structural JSON object with all references resolved."""
+    if isinstance(obj, list):
+        return [_join(item, buffer, compact) for item in obj]
+    if not isinstance(obj, dict):
+        return obj
+    new_obj = {key: _join(value, buffer, compact) for key, value in obj.items()}
+    obj_type = obj.get('type')
+    if obj_type == 'Face3D':
+        new_obj['boundary'] = _points(obj['boundary'], buffer, compact)
+        if obj.get('holes'):
+            new_obj['holes'] = [_points(hole, buffer, compact) for hole in obj['holes']]
+    elif obj_type == 'Mesh3D':
+        new_obj['vertices'] = _points(obj['vertices'], buffer, compact)
+    elif obj_type == 'Plane':
+        for key in _PLANE_KEYS:
+            if _is_reference(obj.get(key)):
+                new_obj[key] = buffer[obj[key][REFERENCE_KEY]].tolist()
+    elif obj_type == 'SensorGrid' and _is_reference(obj['sensors']):
+        values = buffer[obj['sensors'][REFERENCE_KEY]].tolist()
+        sensors = [{'pos': values[i:i + 3], 'dir': values[i + 3:i + 6]}
+                   for i in range(0, len(values), 6)]
+        if 'type' in obj['sensors']:
+            sensors = [dict(type='Sensor', **sensor) for sensor in sensors]
+        new_obj['sensors'] = sensors
+    return new_obj
+
+
+def load_binary_model(hbjson_path, hbbin_path=None, compact=True):
+    """Load a Model dictionary from a structural JSON file and a .hbbin file.
+
+    Args:
+        hbjson_path: Path to a structural JSON file written by write_binary_model.
+        hbbin_path: Path to the .hbbin file. If None, it will be the file next to
+            the JSON file with the same name and a .hbbin extension.
+        compact: Boolean to note whether the vertices of Face3Ds and Mesh3Ds
+            are loaded as PointArrays that share the memory-mapped buffer of
+            the .hbbin file, in which case coordinates are only read from
+            disk when they are used. Models validated from such dictionaries
+            with context={'compact_geometry': True} keep sharing the buffer.
+            If False, all coordinates are copied into lists. (Default: True).
+
+    Returns:
+        A tuple with two items.
+
+        -   model_dict: A dictionary of the Model.
+
+        -   buffer: The open GeometryBuffer that is shared by the PointArrays of
+            the model_dict when compact is True, which should be closed once
+            the Model is no longer used (eg. with a with statement). None when
+            compact is False since the buffer is then closed after loading.
+
+    Usage:
+
+    .. code-block:: python
+
+        model_dict, buffer = load_binary_model('model.hbjson')
+        with buffer:
+            model = Model.model_validate(
+                model_dict, context={'compact_geometry': True})
+    """
+    with open(hbjson_path, 'rb') as json_file:
+        structure = json.load(json_file)
+    buffer = GeometryBuffer(hbbin_path or sidecar_path(hbjson_path))
+    if compact:  # the buffer must stay open for as long as the Model uses it
+        try:
+            return _join(structure, buffer, True), buffer
+        except Exception:
+            buffer.close()
+            raise
+    with buffer:
+        return _join(structure, buffer, False), None
+
+
+def binary_to_model(hbjson_path, model_json, hbbin_path=None):
+    """Convert a structural JSON file and a .hbbin file to a plain Model JSON file.
+
+    Args:
+        hbjson_path: Path to a structural JSON file written by write_binary_model.
+        model_json: Path to the Model JSON file to be written.
+        hbbin_path: Path to the .hbbin file. If None, it will be the file next to
+            the JSON file with the same name and a .hbbin extension.
+    """
+    model_dict, _ = load_binary_model(hbjson_path, hbbin_path, compact=False)
+    with open(model_json, 'w', encoding='utf-8') as json_file:
+        json.dump(model_dict, json_file)
+
+
+def model_to_binary(model_json, hbjson_path, hbbin_path=None):
+    """Convert a plain Model JSON file to a structural JSON file and a .hbbin file.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        hbjson_path: Path to the structural JSON file to be written.
+        hbbin_path: Path to the .hbbin file to be written. If None, it will be
+            next to the JSON file with the same name and a .hbbin extension.
+
+    Returns:
+        The number of coordinate arrays in the .hbbin file.
+    """
+    with open(model_json, 'rb') as json_file:
+        model_dict = json.load(json_file)
+    return write_binary_model(model_dict, hbjson_path, hbbin_path)
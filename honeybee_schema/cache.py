@@ -0,0 +1,201 @@
+"""On-disk cache of the ValidationReports of Model JSON files."""
+import os
+import json
+import hashlib
+import time
+import tempfile
+
+from .validation import ValidationReport
+from .parallel import validate_model_parallel
+from .stream import iter_model_list
+from ._report import schema_version
+
+# default maximum size of the cache directory in bytes
+MAX_SIZE = 268435456
+# age in seconds after which a temporary file of an interrupted write is deleted
+TEMP_MAX_AGE = 3600
+
+_EXTERNAL_MARKER = b'"ExternalValues"'
+_SCHEDULES_PATH = ('properties', 'energy', 'schedules')
+_VALUES_HEADER_SIZE = 24
+
+
+def _values_paths(model_json):
+    """Get the sorted paths of the .hbval files referenced by a Model JSON file.
+
+    Only the schedules that reference ExternalValues are parsed.
+    """
+    folder = os.path.dirname(os.path.abspath(model_json))
+    marker, paths = _EXTERNAL_MARKER.decode('utf-8'), set()
+    for json_text in iter_model_list(model_json, _SCHEDULES_PATH):
+        if marker not in json_text:
+            continue
+        schedule = json.loads(json_text)
+        values = schedule.get('values') if isinstance(schedule, dict) else None
+        if isinstance(values, dict) and values.get('type') == 'ExternalValues' \
+                and isinstance(values.get('path'), str):
+            paths.add(os.path.join(folder, *values['path'].split('/')))
+    return sorted(paths)
+
+
+def _update_values_files(file_hash, model_json):
+    """Update a hash with the header, size and modification time of .hbval files."""
+    for values_path in _values_paths(model_json):
+        file_hash.update(values_path.encode('utf-8') + b'\0')
+        try:
+            with open(values_path, 'rb') as values_file:
+                stat = os.fstat(values_file.fileno())
+                file_hash.update(values_file.read(_VALUES_HEADER_SIZE))
+            file_hash.update('{}:{}'.format(stat.st_size, stat.st_mtime_ns).encode())
+        except OSError:
+            file_hash.update(b'missing')
+
+
+class ValidationCache:
+    """A directory of ValidationReports keyed by the content of Model JSON files.
+
+    Each report is stored under a hash of the bytes of the Model JSON file
+    together with the version of honeybee-schema that produced it (and the
+    headers of any .hbval files referenced by ExternalValues). So a report is
+    only ever reused for identical files validated by the same schema version.
+    When the directory grows beyond its maximum size, the least recently used
+    reports are deleted along with any temporary files of interrupted writes
+    that are older than TEMP_MAX_AGE.
+
+    Args:
+        directory: Path to a directory in which the reports will be stored.
+            It will be created if it does not exist.
+        max_size: The maximum size of all reports in the directory in bytes.
+            (Default: 268435456, 256 MB).
+    """
+    __slots__ = ('directory', 'max_size')
+
+    def __init__(self, directory, max_size=MAX_SIZE):
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        self.directory = directory
+        self.max_size = max_size
+
+    @staticmethod
+    def key(model_json):
+        """Get the cache key for a Model JSON file.
+
+        When the Model references ExternalValues, the header, size and
+        modification time of each referenced .hbval file are also part of
+        the key since the validation of the Model depends on them.
+
+        Args:
+            model_json: Path to a Model JSON file.
+        """
+        file_hash = hashlib.sha256(schema_version().encode('utf-8') + b'\0')
+        external, tail = False, b''
+        with open(model_json, 'rb') as json_file:
+            for chunk in iter(lambda: json_file.read(1048576), b''):
+                file_hash.update(chunk)
+                if not external:  # the marker may span two chunks
+                    external = _EXTERNAL_MARKER in tail + chunk
+                    tail = chunk[-len(_EXTERNAL_MARKER):]
+        if external:
+            _update_values_files(file_hash, model_json)
+        return file_hash.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, '{}.json'.format(key))
+
+    def get(self, key):
+        """Get the ValidationReport for a cache key or None if it is not cached."""
+        report_path = self._path(key)
+        try:
+            with open(report_path, 'rb') as report_file:
+                report = ValidationReport.model_validate_json(report_file.read())
+        except (OSError, ValueError):
+            return None
+        try:
+            os.utime(report_path)  # mark the report as recently used
+        except OSError:
+            pass
+        return report
+
+    def set(self, key, report):
+        """Store a ValidationReport in the cache under a key.
+
+        Args:
+            key: Text for the cache key as returned by the key method.
+            report: The ValidationReport to be stored.
+        """
+        report_json = report.model_dump_json(exclude_none=True).encode('utf-8')
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(report_json)
+        os.replace(temp_path, self._path(key))
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used reports until the cache fits its max_size.
+
+        Temporary files of writes that were interrupted (eg. by a crash) are
+        deleted first once they are older than TEMP_MAX_AGE. More recent
+        temporary files count towards the size of the cache but they are not
+        deleted since they may belong to a write in progress.
+        """
+        entries, total_size = [], 0
+        stale_time = time.time() - TEMP_MAX_AGE
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            if entry.name.endswith('.json'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+            elif entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                total_size += stat.st_size
+                if stat.st_mtime < stale_time:  # evicted before all reports
+                    entries.append((float('-inf'), stat.st_size, entry.path))
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+
+    def clear(self):
+        """Delete all reports from the cache."""
+        self.max_size, max_size = -1, self.max_size
+        try:
+            self.evict()
+        finally:
+            self.max_size = max_size
+
+    def __repr__(self):
+        return 'ValidationCache: {}'.format(self.directory)
+
+
+def validate_model_cached(model_json, cache_dir, jobs=None, max_size=MAX_SIZE):
+    """Validate a Model JSON file, reusing any report cached for identical files.
+
+    When the file has been validated before with the same version of
+    honeybee-schema, the cached ValidationReport is returned without
+    parsing the file.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        cache_dir: Path to a directory in which ValidationReports are cached.
+        jobs: An integer for the number of processes used to validate the
+            Model when it is not found in the cache. (Default: None).
+        max_size: The maximum size of the cache directory in bytes.
+            (Default: 268435456, 256 MB).
+
+    Returns:
+        A ValidationReport for the Model.
+    """
+    cache = ValidationCache(cache_dir, max_size)
+    key = cache.key(model_json)
+    report = cache.get(key)
+    if report is None:
+        report = validate_model_parallel(model_json, jobs=jobs)
+        cache.set(key, report)
+    return report
@@ -0,0 +1,31 @@
+"""Checks of Model dictionaries that span several objects of the Model."""
+
+
+def check_model(model_dict, values_folder=None):
+    """Run all of the checks of this package on a Model dictionary.
+
+    This includes the uniqueness of identifiers, the existence of all
+    referenced resources, the reciprocity of Surface boundary conditions,
+    the planarity and non-degeneracy of all Face3Ds and the limits of all
+    schedule values.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+        values_folder: The folder of the Model JSON file, which is used to check
+            the values of the .hbval files referenced by ExternalValues.
+
+    Returns:
+        A single ValidationReport with the errors of all checks.
+    """
+    from .._report import validation_report
+    from .identifiers import check_duplicate_identifiers
+    from .references import check_references
+    from .adjacency import check_adjacencies
+    from .geometry import check_face_geometry
+    from .schedules import check_schedule_limits
+    errors = check_duplicate_identifiers(model_dict)
+    errors.extend(check_references(model_dict))
+    errors.extend(check_adjacencies(model_dict))
+    errors.extend(check_face_geometry(model_dict))
+    errors.extend(check_schedule_limits(model_dict, values_folder))
+    return validation_report(errors)
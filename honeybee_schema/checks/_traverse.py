@@ -0,0 +1,145 @@
+"""Traversal of the objects of Model dictionaries that is shared by the checks."""
+from .._report import _LIST_ELEMENT_TYPES, _element_id, validation_parent, \
+    validation_error
+
+# Model keys for the lists of geometry objects along with their ObjectTypes
+_MODEL_GEOMETRY = (
+    ('rooms', 'Room'),
+    ('orphaned_faces', 'Face'),
+    ('orphaned_shades', 'Shade'),
+    ('orphaned_apertures', 'Aperture'),
+    ('orphaned_doors', 'Door'),
+    ('shade_meshes', 'Shade')
+)
+_SHADES = (('indoor_shades', 'Shade'), ('outdoor_shades', 'Shade'))
+# keys for the geometry objects that are nested within each type of object
+_CHILDREN = {
+    'Room': (('faces', 'Face'),) + _SHADES,
+    'Face': (('apertures', 'Aperture'), ('doors', 'Door')) + _SHADES,
+    'Aperture': _SHADES,
+    'Door': _SHADES,
+    'Shade': ()
+}
+# extension properties of the Model that hold lists of resources
+_EXTENSIONS = (('energy', 'Energy'), ('radiance', 'Radiance'))
+
+
+def _iter_object(obj_type, obj, parents):
+    yield obj_type, obj, parents
+    child_parents = ((obj_type, obj),) + parents
+    for key, child_type in _CHILDREN[obj_type]:
+        for child in obj.get(key) or ():
+            for item in _iter_object(child_type, child, child_parents):
+                yield item
+
+
+def iter_geometry(model_dict):
+    """Iterate over all of the geometry objects of a Model dictionary.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+
+    Yields:
+        A tuple for each Room, Face, Aperture, Door and Shade with three items.
+
+        -   obj_type: Text for the ObjectTypes of the object (eg. Face).
+            ShadeMeshes are yielded as Shades.
+
+        -   obj: The dictionary of the object.
+
+        -   parents: A tuple of (parent_type, parent_dict) tuples for the
+            parents of the object, starting from the nearest parent.
+    """
+    for key, obj_type in _MODEL_GEOMETRY:
+        for obj in model_dict.get(key) or ():
+            for item in _iter_object(obj_type, obj, ()):
+                yield item
+
+
+def iter_resources(model_dict):
+    """Iterate over the resources of the extension properties of a Model dictionary.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+
+    Yields:
+        A tuple for each resource (eg. each Construction or Modifier) with
+        four items.
+
+        -   key: Text for the key of the list of the resource (eg. constructions).
+
+        -   obj_type: Text for the ObjectTypes of the resource (eg. Construction).
+
+        -   extension_type: Text for the extension of the resource (eg. Energy).
+
+        -   obj: The dictionary of the resource.
+    """
+    properties = model_dict.get('properties') or {}
+    for extension, extension_type in _EXTENSIONS:
+        ext_properties = properties.get(extension) or {}
+        for key, resources in ext_properties.items():
+            obj_type = _LIST_ELEMENT_TYPES.get(key)
+            if obj_type is None or not isinstance(resources, list):
+                continue
+            for obj in resources:
+                yield key, obj_type, extension_type, obj
+
+
+def parent_list(parents):
+    """Get a list of ValidationParents from the parents yielded by iter_geometry."""
+    validation_parents = []
+    for parent_type, parent in parents:
+        v_parent = validation_parent(parent_type, parent)
+        if v_parent is not None:
+            validation_parents.append(v_parent)
+    return validation_parents
+
+
+def objects_error(code, error_type, obj_type, objects, message,
+                  extension_type='Core', helper_geometry=None):
+    """Get a ValidationError for one or more objects of a Model dictionary.
+
+    Args:
+        code: Text with 6 digits for the error code.
+        error_type: A human-readable version of the error code.
+        obj_type: Text for the ObjectTypes of the objects.
+        objects: A list of (obj, parents) tuples for each object that caused
+            the error, where parents is a tuple of (parent_type, parent_dict)
+            tuples as yielded by iter_geometry.
+        message: Text for the error message.
+        extension_type: Text for the extension from which the error originated.
+        helper_geometry: An optional list of geometry objects that helps
+            illustrate the error.
+    """
+    ids, names, all_parents = [], [], []
+    for obj, parents in objects:
+        ids.append(_element_id(obj, obj_type))
+        names.append(obj.get('display_name'))
+        all_parents.append(parent_list(parents))
+    return validation_error(
+        code, error_type, obj_type, ids, message, extension_type=extension_type,
+        element_name=names if all(isinstance(n, str) for n in names) else None,
+        parents=all_parents if any(all_parents) else None,
+        helper_geometry=helper_geometry
+    )
+
+
+def object_error(code, error_type, obj_type, obj, message, extension_type='Core',
+                 parents=(), helper_geometry=None):
+    """Get a ValidationError for a single object of a Model dictionary.
+
+    Args:
+        code: Text with 6 digits for the error code.
+        error_type: A human-readable version of the error code.
+        obj_type: Text for the ObjectTypes of the object.
+        obj: The dictionary of the object that caused the error.
+        message: Text for the error message.
+        extension_type: Text for the extension from which the error originated.
+        parents: A tuple of (parent_type, parent_dict) tuples for the parents
+            of the object as yielded by iter_geometry.
+        helper_geometry: An optional list of geometry objects that helps
+            illustrate the error.
+    """
+    return objects_error(
+        code, error_type, obj_type, [(obj, parents)], message, extension_type,
+        helper_geometry)
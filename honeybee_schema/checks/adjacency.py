@@ -0,0 +1,133 @@
+"""Check that the Surface boundary conditions of a Model are reciprocal.
+
+The check builds a single index of the Faces, Apertures and Doors of the Model
+by namespace and identifier (using the same namespaces as the check for duplicate
+identifiers, where Apertures and Doors share the SubFace namespace) and then
+resolves the boundary_condition_objects of every Surface boundary condition
+against it. So the check runs in linear time with the number of objects in the
+Model rather than comparing each pair of objects.
+"""
+from ._traverse import iter_geometry, object_error, objects_error
+from .identifiers import _GEOMETRY_NAMESPACE
+
+# error codes for missing and mismatched adjacencies
+MISSING_ADJACENCY_CODE = '000201'
+MISMATCHED_ADJACENCY_CODE = '000202'
+
+# types of objects that can have a Surface boundary condition
+_ADJACENT_TYPES = ('Face', 'Aperture', 'Door')
+
+
+def _parent_ids(parents):
+    return tuple(parent.get('identifier') for _, parent in parents)
+
+
+def _surface_objects(obj):
+    """Get the boundary_condition_objects of an object or None if it is not a Surface.
+    """
+    bc = obj.get('boundary_condition')
+    if bc is None or bc.get('type') != 'Surface':
+        return None
+    return tuple(bc['boundary_condition_objects'])
+
+
+def adjacency_index(model_dict):
+    """Get an index of the objects of a Model that can have Surface boundary conditions.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+
+    Returns:
+        A dictionary with (namespace, identifier) tuples of all Faces, Apertures
+        and Doors in the Model as keys, where the namespace is either Face or
+        SubFace. Each value is a list of (obj_type, obj, parents) tuples as
+        yielded by checks._traverse.iter_geometry, which has more than one
+        item when several objects of the namespace share the identifier.
+    """
+    index = {}
+    for obj_type, obj, parents in iter_geometry(model_dict):
+        if obj_type in _ADJACENT_TYPES:
+            key = (_GEOMETRY_NAMESPACE[obj_type], obj['identifier'])
+            index.setdefault(key, []).append((obj_type, obj, parents))
+    return index
+
+
+def _adjacent(items, bc_objects):
+    """Get the item of an index that best matches the boundary_condition_objects."""
+    for item in items:
+        if _parent_ids(item[2]) == bc_objects[1:]:
+            return item
+    return items[0]
+
+
+def _adjacency_error(index, namespace, obj_type, obj, parents):
+    """Get a ValidationError for the Surface boundary condition of an object or None.
+    """
+    bc_objects = _surface_objects(obj)
+    if bc_objects is None:
+        return None
+    obj_id, adj_id = obj['identifier'], bc_objects[0]
+    try:
+        adj_type, adj, adj_parents = _adjacent(index[(namespace, adj_id)], bc_objects)
+    except KeyError:
+        message = '{} "{}" has a Surface boundary condition with the adjacent ' \
+            'object "{}" but this object is not in the Model.'.format(
+                obj_type, obj_id, adj_id)
+        return object_error(
+            MISSING_ADJACENCY_CODE, 'Missing Adjacency', obj_type, obj,
+            message, parents=parents
+        )
+
+    obj_parent_ids, adj_parent_ids = _parent_ids(parents), _parent_ids(adj_parents)
+    if adj is obj:
+        reason = 'the object is adjacent to itself'
+    elif adj_type != obj_type:
+        reason = 'the adjacent object is a {}'.format(adj_type)
+    elif bc_objects[1:] != adj_parent_ids:
+        reason = 'the parents of the adjacent object are ({}) instead of ' \
+            '({})'.format(', '.join(adj_parent_ids), ', '.join(bc_objects[1:]))
+    else:
+        adj_bc_objects = _surface_objects(adj)
+        if adj_bc_objects is None:
+            reason = 'the adjacent object does not have a Surface boundary ' \
+                'condition'
+        elif adj_bc_objects != (obj_id,) + obj_parent_ids:
+            reason = 'the boundary condition of the adjacent object points ' \
+                'to ({}) instead of ({})'.format(
+                    ', '.join(adj_bc_objects),
+                    ', '.join((obj_id,) + obj_parent_ids))
+        else:
+            return None
+    message = '{} "{}" is not correctly adjacent to {} "{}" because {}.'.format(
+        obj_type, obj_id, adj_type, adj_id, reason)
+    return objects_error(
+        MISMATCHED_ADJACENCY_CODE, 'Mismatched Adjacency', obj_type,
+        [(obj, parents), (adj, adj_parents)], message
+    )
+
+
+def check_adjacencies(model_dict):
+    """Check that all Surface boundary conditions in a Model dictionary are reciprocal.
+
+    For each Face, Aperture and Door with a Surface boundary condition, this
+    checks that the adjacent object exists, that it is of the same type, that
+    its parents match the rest of the boundary_condition_objects and that it
+    has a Surface boundary condition that points back to the original object.
+    The adjacent object of a Face is searched among the Faces of the Model and
+    that of an Aperture or Door is searched among the Apertures and Doors.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+
+    Returns:
+        A list of ValidationErrors with one error for each object with an
+        invalid Surface boundary condition.
+    """
+    index = adjacency_index(model_dict)
+    errors = []
+    for (namespace, _), items in index.items():
+        for obj_type, obj, parents in items:
+            error = _adjacency_error(index, namespace, obj_type, obj, parents)
+            if error is not None:
+                errors.append(error)
+    return errors
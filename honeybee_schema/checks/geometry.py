@@ -0,0 +1,165 @@
+"""Check the planarity, area and vertices of all Face3Ds of a Model.
+
+The checks run on the vertices of the Model dictionary with the tolerance and
+angle_tolerance of the Model, which avoids building any geometry objects
+except for the helper_geometry of the errors that are found.
+"""
+import math
+
+from ..geometry import Point3D, Face3D, newell_normal
+from ._traverse import iter_geometry, object_error
+
+# error codes for the geometry of Face3Ds
+NON_PLANAR_CODE = '000101'
+ZERO_AREA_CODE = '000103'
+DUPLICATE_VERTEX_CODE = '000110'
+
+
+def _face3ds(model_dict):
+    """Get the Face3Ds of all Faces, Apertures, Doors and Shades of a Model.
+
+    Yields:
+        A (obj_type, obj, parents, boundary, holes) tuple for each Face3D,
+        where the boundary is a list of (x, y, z) tuples for its vertices and
+        the holes are a list of such lists.
+    """
+    for obj_type, obj, parents in iter_geometry(model_dict):
+        geometry = obj.get('geometry')
+        if not geometry or 'boundary' not in geometry:
+            continue  # ShadeMeshes are not Face3Ds
+        boundary = [tuple(point) for point in geometry['boundary']]
+        holes = [[tuple(point) for point in hole]
+                 for hole in geometry.get('holes') or ()]
+        yield obj_type, obj, parents, boundary, holes
+
+
+def _duplicate_vertices(points, tolerance):
+    """Get the consecutive vertices of a loop that are within the tolerance."""
+    duplicates = []
+    x_1, y_1, z_1 = points[-1]
+    for x_2, y_2, z_2 in points:
+        if abs(x_1 - x_2) <= tolerance and abs(y_1 - y_2) <= tolerance and \
+                abs(z_1 - z_2) <= tolerance:
+            duplicates.append((x_2, y_2, z_2))
+        x_1, y_1, z_1 = x_2, y_2, z_2
+    return duplicates
+
+
+def _remove_duplicates(points, duplicates):
+    """Get the vertices of a loop without the duplicate vertices."""
+    if not duplicates:
+        return points
+    duplicates = set(duplicates)
+    return [point for point in points if point not in duplicates]
+
+
+def _corner_count(points, sin_angle):
+    """Get the number of vertices of a loop that are not colinear with their neighbors.
+    """
+    count = 0
+    (x_0, y_0, z_0), (x_1, y_1, z_1) = points[-2], points[-1]
+    for x_2, y_2, z_2 in points:
+        ax, ay, az = x_1 - x_0, y_1 - y_0, z_1 - z_0
+        bx, by, bz = x_2 - x_1, y_2 - y_1, z_2 - z_1
+        cx, cy, cz = ay * bz - az * by, az * bx - ax * bz, ax * by - ay * bx
+        cross = math.sqrt(cx * cx + cy * cy + cz * cz)
+        if cross > sin_angle * math.sqrt(
+                (ax * ax + ay * ay + az * az) * (bx * bx + by * by + bz * bz)):
+            count += 1
+        x_0, y_0, z_0, x_1, y_1, z_1 = x_1, y_1, z_1, x_2, y_2, z_2
+    return count
+
+
+def _point3d(point):
+    return Point3D(x=point[0], y=point[1], z=point[2])
+
+
+def check_face_geometry(model_dict):
+    """Check that all Face3Ds of a Model dictionary are planar and not degenerate.
+
+    For the Face3D of each Face, Aperture, Door and Shade in the Model, this
+    checks that no two consecutive vertices of the boundary or holes are
+    within the tolerance of one another, that the Face3D does not have an
+    area of zero and that all vertices are within the tolerance of the plane
+    of the Face3D. A Face3D has an area of zero if its area is not larger than
+    the square of the tolerance or if fewer than 3 of its vertices are corners,
+    where a vertex is a corner when its edges meet at an angle larger than the
+    angle_tolerance. So long and thin Face3Ds (eg. a window sill) are valid as
+    long as their vertices form at least 3 corners.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+            The tolerance and angle_tolerance of the Model are used for all
+            checks and checks are skipped when the tolerance is zero.
+
+    Returns:
+        A list of ValidationErrors with one error for each invalid Face3D.
+        The helper_geometry of each error contains the duplicated or
+        out-of-plane vertices or the Face3D with zero area.
+    """
+    tolerance = model_dict.get('tolerance', 0.01)
+    angle_tolerance = model_dict.get('angle_tolerance', 1.0)
+    if not tolerance:
+        return []
+    sin_angle = math.sin(math.radians(angle_tolerance)) if angle_tolerance else None
+    errors = []
+    for obj_type, obj, parents, boundary, holes in _face3ds(model_dict):
+        original = boundary
+
+        # check that none of the vertices are duplicated
+        duplicates = _duplicate_vertices(boundary, tolerance)
+        boundary = _remove_duplicates(boundary, duplicates)
+        for i, hole in enumerate(holes):
+            hole_duplicates = _duplicate_vertices(hole, tolerance)
+            holes[i] = _remove_duplicates(hole, hole_duplicates)
+            duplicates.extend(hole_duplicates)
+        if duplicates:
+            message = '{} "{}" has {} duplicate vertices, which are within the ' \
+                'tolerance ({}) of the previous vertex.'.format(
+                    obj_type, obj['identifier'], len(duplicates), tolerance)
+            errors.append(object_error(
+                DUPLICATE_VERTEX_CODE, 'Duplicate Vertices', obj_type, obj, message,
+                parents=parents, helper_geometry=[_point3d(p) for p in duplicates]))
+
+        # check that the face does not have an area of zero
+        area, nx, ny, nz = 0, 0, 0, 0
+        if len(boundary) >= 3:
+            nx, ny, nz = newell_normal(boundary)
+            normal_length = math.sqrt(nx * nx + ny * ny + nz * nz)
+            area = normal_length / 2
+        if area > 0:
+            nx, ny, nz = nx / normal_length, ny / normal_length, nz / normal_length
+            for hole in holes:
+                if len(hole) >= 3:
+                    hx, hy, hz = newell_normal(hole)
+                    area -= abs(hx * nx + hy * ny + hz * nz) / 2
+        if area <= tolerance * tolerance or (
+                sin_angle is not None and _corner_count(boundary, sin_angle) < 3):
+            message = '{} "{}" has an area of zero at the tolerance ({}). Its ' \
+                'area is {}.'.format(obj_type, obj['identifier'], tolerance, area)
+            errors.append(object_error(
+                ZERO_AREA_CODE, 'Zero-Area Geometry', obj_type, obj, message,
+                parents=parents,
+                helper_geometry=[Face3D(boundary=[list(p) for p in original])]))
+            continue
+
+        # check that all vertices are in the plane of the boundary
+        xs, ys, zs = zip(*boundary)
+        cx, cy, cz = sum(xs) / len(xs), sum(ys) / len(ys), sum(zs) / len(zs)
+        out_of_plane, max_distance = [], 0
+        for loop in [boundary] + holes:
+            for point in loop:
+                distance = abs((point[0] - cx) * nx + (point[1] - cy) * ny +
+                               (point[2] - cz) * nz)
+                if distance > tolerance:
+                    out_of_plane.append(point)
+                    max_distance = max(distance, max_distance)
+        if out_of_plane:
+            message = '{} "{}" is not planar. {} of its vertices are more than the ' \
+                'tolerance ({}) from its plane, up to a distance of {}.'.format(
+                    obj_type, obj['identifier'], len(out_of_plane), tolerance,
+                    max_distance)
+            errors.append(object_error(
+                NON_PLANAR_CODE, 'Non-Planar Geometry', obj_type, obj, message,
+                parents=parents, helper_geometry=[_point3d(p) for p in out_of_plane]))
+    return errors
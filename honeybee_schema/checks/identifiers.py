@@ -0,0 +1,120 @@
+"""Check that the identifiers of the objects of a Model are unique.
+
+All identifiers are collected in a single traversal of the Model with one
+dictionary for each namespace in which identifiers must be unique (eg. all
+Faces of the Model or all Constructions of the energy properties). So the
+check runs in linear time with the number of objects in the Model.
+"""
+from ._traverse import iter_geometry, iter_resources, objects_error, \
+    parent_list
+
+# the namespaces of the geometry objects with their error codes and types
+GEOMETRY_NAMESPACES = {
+    'Shade': ('000001', 'Duplicate Shade Identifier'),
+    'SubFace': ('000002', 'Duplicate Sub-Face Identifier'),
+    'Face': ('000003', 'Duplicate Face Identifier'),
+    'Room': ('000004', 'Duplicate Room Identifier')
+}
+# the namespaces of the resources of the Model properties with their error codes
+RESOURCE_NAMESPACES = {
+    'materials': '020001',
+    'constructions': '020002',
+    'construction_sets': '020003',
+    'schedule_type_limits': '020004',
+    'schedules': '020005',
+    'program_types': '020006',
+    'hvacs': '020007',
+    'shws': '020008',
+    'modifiers': '010001',
+    'modifier_sets': '010002',
+    'sensor_grids': '010003',
+    'views': '010004'
+}
+# Apertures and Doors share the same namespace
+_GEOMETRY_NAMESPACE = {
+    'Shade': 'Shade',
+    'Aperture': 'SubFace',
+    'Door': 'SubFace',
+    'Face': 'Face',
+    'Room': 'Room'
+}
+
+
+def _add(namespace, duplicates, key, identifier, item):
+    """Add an item to a namespace, recording it in duplicates if it is not unique.
+
+    Only the first object with each identifier is stored in the namespace such
+    that lists of objects are only built for the identifiers that are duplicated.
+    """
+    first = namespace.setdefault(identifier, item)
+    if first is not item:
+        try:
+            duplicates[(key, identifier)].append(item)
+        except KeyError:
+            duplicates[(key, identifier)] = [first, item]
+
+
+def _duplicate_error(code, error_type, obj_type, identifier, items, extension_type):
+    """Get a ValidationError for all of the objects that share an identifier."""
+    objects = [(obj, parents) for _, obj, parents in items]
+    types = set(item_type for item_type, _, _ in items)
+    element_type = obj_type if len(types) != 1 else types.pop()
+    message = 'There are {} {} objects in the Model with the identifier "{}".'.format(
+        len(items), element_type, identifier)
+    error = objects_error(code, error_type, element_type, objects, message,
+                          extension_type)
+    top_parents, top_ids = [], set()
+    for _, _, parents in items:
+        if parents:
+            top = parent_list(parents[-1:])
+            if top and top[0].id not in top_ids:
+                top_ids.add(top[0].id)
+                top_parents.extend(top)
+    if len(top_parents) > 1:
+        error.top_parents = top_parents
+    return error
+
+
+def check_duplicate_identifiers(model_dict):
+    """Check that the identifiers of all objects in a Model dictionary are unique.
+
+    Rooms, Faces, sub-faces (Apertures and Doors together) and Shades (including
+    ShadeMeshes) must each have identifiers that are unique across the Model.
+    Each list of resources in the energy and radiance properties of the Model
+    must also have unique identifiers.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+
+    Returns:
+        A list of ValidationErrors with one error for each identifier that is
+        shared by several objects of the same namespace. The element_id and
+        parents of the error contain an item for each of these objects.
+    """
+    geometry = {namespace: {} for namespace in GEOMETRY_NAMESPACES}
+    duplicates = {}
+    for obj_type, obj, parents in iter_geometry(model_dict):
+        namespace = _GEOMETRY_NAMESPACE[obj_type]
+        _add(geometry[namespace], duplicates, namespace, obj['identifier'],
+             (obj_type, obj, parents))
+
+    resources = {key: {} for key in RESOURCE_NAMESPACES}
+    resource_types = {}
+    for key, obj_type, extension_type, obj in iter_resources(model_dict):
+        if key in resources:
+            resource_types[key] = (obj_type, extension_type)
+            _add(resources[key], duplicates, key, obj['identifier'], (obj_type, obj, ()))
+
+    errors = []
+    for (namespace, identifier), items in duplicates.items():
+        if namespace in GEOMETRY_NAMESPACES:
+            code, error_type = GEOMETRY_NAMESPACES[namespace]
+            errors.append(_duplicate_error(
+                code, error_type, namespace, identifier, items, 'Core'))
+        else:
+            obj_type, extension_type = resource_types[namespace]
+            errors.append(_duplicate_error(
+                RESOURCE_NAMESPACES[namespace],
+                'Duplicate {} Identifier'.format(obj_type), obj_type,
+                identifier, items, extension_type))
+    return errors
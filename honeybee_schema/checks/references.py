@@ -0,0 +1,263 @@
+"""Check that the identifiers referenced by abridged objects exist in the Model.
+
+Abridged objects (eg. OpaqueConstructionAbridged or the energy properties of
+a Face) refer to the resources of the Model extension properties using their
+identifiers. The check builds one set of identifiers for each list of resources
+and then looks up every reference in the Model such that it runs in linear
+time with the size of the Model.
+"""
+from ._traverse import iter_geometry, iter_resources, object_error
+
+# resources that can be referenced by identifier with the ObjectTypes, the
+# extension and the error code that is used when a reference to them is missing
+RESOURCES = {
+    'materials': ('Material', 'Energy', '020011'),
+    'constructions': ('Construction', 'Energy', '020012'),
+    'construction_sets': ('ConstructionSet', 'Energy', '020013'),
+    'schedule_type_limits': ('ScheduleTypeLimit', 'Energy', '020014'),
+    'schedules': ('Schedule', 'Energy', '020015'),
+    'program_types': ('ProgramType', 'Energy', '020016'),
+    'hvacs': ('HVAC', 'Energy', '020017'),
+    'shws': ('SHW', 'Energy', '020018'),
+    'modifiers': ('Modifier', 'Radiance', '010011'),
+    'modifier_sets': ('ModifierSet', 'Radiance', '010012')
+}
+# error code used for the references to the day schedules of ScheduleRulesets
+DAY_SCHEDULE_CODE = '020019'
+
+_SCHEDULE = {'schedule': 'schedules'}
+_SUB_SET = {
+    'interior_construction': 'constructions',
+    'exterior_construction': 'constructions',
+    'ground_construction': 'constructions'
+}
+_SUB_MODIFIER_SET = {
+    'exterior_modifier': 'modifiers',
+    'interior_modifier': 'modifiers'
+}
+_GEOMETRY_MODIFIERS = {
+    'modifier': 'modifiers',
+    'modifier_blk': 'modifiers'
+}
+_STATE_MODIFIERS = {
+    'modifier': 'modifiers',
+    'modifier_direct': 'modifiers'
+}
+_DOAS = {'doas_availability_schedule': 'schedules'}
+
+# fields of abridged objects that reference resources, keyed by the object type
+REFERENCES = {
+    # energy constructions and construction sets
+    'OpaqueConstructionAbridged': {'materials': 'materials'},
+    'WindowConstructionAbridged': {'materials': 'materials', 'frame': 'materials'},
+    'WindowConstructionShadeAbridged': {
+        'shade_material': 'materials', 'schedule': 'schedules'
+    },
+    'WindowConstructionDynamicAbridged': _SCHEDULE,
+    'AirBoundaryConstructionAbridged': {'air_mixing_schedule': 'schedules'},
+    'ConstructionSetAbridged': {
+        'shade_construction': 'constructions',
+        'air_boundary_construction': 'constructions'
+    },
+    'WallConstructionSetAbridged': _SUB_SET,
+    'FloorConstructionSetAbridged': _SUB_SET,
+    'RoofCeilingConstructionSetAbridged': _SUB_SET,
+    'ApertureConstructionSetAbridged': {
+        'interior_construction': 'constructions',
+        'window_construction': 'constructions',
+        'skylight_construction': 'constructions',
+        'operable_construction': 'constructions'
+    },
+    'DoorConstructionSetAbridged': {
+        'interior_construction': 'constructions',
+        'exterior_construction': 'constructions',
+        'overhead_construction': 'constructions',
+        'exterior_glass_construction': 'constructions',
+        'interior_glass_construction': 'constructions'
+    },
+    # energy schedules
+    'ScheduleRulesetAbridged': {'schedule_type_limit': 'schedule_type_limits'},
+    'ScheduleFixedIntervalAbridged': {'schedule_type_limit': 'schedule_type_limits'},
+    # energy loads and program types
+    'PeopleAbridged': {
+        'occupancy_schedule': 'schedules', 'activity_schedule': 'schedules'
+    },
+    'LightingAbridged': _SCHEDULE,
+    'ElectricEquipmentAbridged': _SCHEDULE,
+    'GasEquipmentAbridged': _SCHEDULE,
+    'ServiceHotWaterAbridged': _SCHEDULE,
+    'InfiltrationAbridged': _SCHEDULE,
+    'VentilationAbridged': _SCHEDULE,
+    'ProcessAbridged': _SCHEDULE,
+    'SetpointAbridged': {
+        'cooling_schedule': 'schedules',
+        'heating_schedule': 'schedules',
+        'humidifying_schedule': 'schedules',
+        'dehumidifying_schedule': 'schedules'
+    },
+    'VentilationControlAbridged': _SCHEDULE,
+    'InternalMassAbridged': {'construction': 'constructions'},
+    # energy HVAC systems
+    'IdealAirSystemAbridged': {
+        'heating_availability': 'schedules', 'cooling_availability': 'schedules'
+    },
+    'FCUwithDOASAbridged': _DOAS,
+    'WSHPwithDOASAbridged': _DOAS,
+    'VRFwithDOASAbridged': _DOAS,
+    'RadiantwithDOASAbridged': _DOAS,
+    # energy properties of geometry objects
+    'RoomEnergyPropertiesAbridged': {
+        'construction_set': 'construction_sets',
+        'program_type': 'program_types',
+        'hvac': 'hvacs',
+        'shw': 'shws'
+    },
+    'FaceEnergyPropertiesAbridged': {'construction': 'constructions'},
+    'ApertureEnergyPropertiesAbridged': {'construction': 'constructions'},
+    'DoorEnergyPropertiesAbridged': {'construction': 'constructions'},
+    'ShadeEnergyPropertiesAbridged': {
+        'construction': 'constructions', 'transmittance_schedule': 'schedules'
+    },
+    'ShadeMeshEnergyPropertiesAbridged': {
+        'construction': 'constructions', 'transmittance_schedule': 'schedules'
+    },
+    # radiance modifier sets
+    'ModifierSetAbridged': {'air_boundary_modifier': 'modifiers'},
+    'WallModifierSetAbridged': _SUB_MODIFIER_SET,
+    'FloorModifierSetAbridged': _SUB_MODIFIER_SET,
+    'RoofCeilingModifierSetAbridged': _SUB_MODIFIER_SET,
+    'ShadeModifierSetAbridged': _SUB_MODIFIER_SET,
+    'ApertureModifierSetAbridged': {
+        'window_modifier': 'modifiers',
+        'interior_modifier': 'modifiers',
+        'skylight_modifier': 'modifiers',
+        'operable_modifier': 'modifiers'
+    },
+    'DoorModifierSetAbridged': {
+        'exterior_modifier': 'modifiers',
+        'interior_modifier': 'modifiers',
+        'interior_glass_modifier': 'modifiers',
+        'exterior_glass_modifier': 'modifiers',
+        'overhead_modifier': 'modifiers'
+    },
+    # radiance properties of geometry objects
+    'RoomRadiancePropertiesAbridged': {'modifier_set': 'modifier_sets'},
+    'FaceRadiancePropertiesAbridged': _GEOMETRY_MODIFIERS,
+    'ApertureRadiancePropertiesAbridged': _GEOMETRY_MODIFIERS,
+    'DoorRadiancePropertiesAbridged': _GEOMETRY_MODIFIERS,
+    'ShadeRadiancePropertiesAbridged': _GEOMETRY_MODIFIERS,
+    'ShadeMeshRadiancePropertiesAbridged': _GEOMETRY_MODIFIERS,
+    'RadianceShadeStateAbridged': _STATE_MODIFIERS,
+    'RadianceSubFaceStateAbridged': _STATE_MODIFIERS,
+    'StateGeometryAbridged': _STATE_MODIFIERS
+}
+# fields of ScheduleRulesets that reference the day schedules of the ruleset
+_DAY_SCHEDULE_FIELDS = (
+    'default_day_schedule', 'holiday_schedule',
+    'summer_designday_schedule', 'winter_designday_schedule'
+)
+
+
+def _iter_references(obj, path=()):
+    """Iterate over the references to resources in a dictionary and its children.
+
+    Yields:
+        A tuple with the path to the reference in the dictionary, the key of
+        the referenced list of resources and the referenced identifier.
+    """
+    fields = REFERENCES.get(obj.get('type'), {})
+    for key, value in obj.items():
+        if key in fields:
+            if isinstance(value, str):
+                yield path + (key,), fields[key], value
+            elif isinstance(value, list):
+                for i, identifier in enumerate(value):
+                    yield path + (key, i), fields[key], identifier
+        elif isinstance(value, dict):
+            for item in _iter_references(value, path + (key,)):
+                yield item
+        elif isinstance(value, list) and value and isinstance(value[0], dict):
+            for i, item in enumerate(value):
+                for ref in _iter_references(item, path + (key, i)):
+                    yield ref
+
+
+def _iter_day_references(schedule):
+    """Iterate over the references of a ScheduleRuleset to its day schedules."""
+    for key in _DAY_SCHEDULE_FIELDS:
+        identifier = schedule.get(key)
+        if identifier is not None:
+            yield (key,), identifier
+    for i, rule in enumerate(schedule.get('schedule_rules') or ()):
+        yield ('schedule_rules', i, 'schedule_day'), rule['schedule_day']
+
+
+def resource_indexes(model_dict):
+    """Get a dictionary with a set of the resource identifiers for each resource list.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+    """
+    indexes = {key: set() for key in RESOURCES}
+    for key, _, _, obj in iter_resources(model_dict):
+        if key in indexes:
+            indexes[key].add(obj['identifier'])
+    return indexes
+
+
+def _missing_error(obj_type, obj, path, key, identifier, parents=()):
+    res_type, extension_type, code = RESOURCES[key]
+    message = '{} "{}" references the {} "{}" with its {} but this {} is not ' \
+        'in the Model {}.'.format(
+            obj_type, obj.get('identifier'), res_type, identifier,
+            '.'.join(str(k) for k in path), res_type, key)
+    return object_error(
+        code, 'Missing {}'.format(res_type), obj_type, obj, message,
+        extension_type, parents
+    )
+
+
+def check_references(model_dict):
+    """Check that all resource identifiers referenced in a Model dictionary exist.
+
+    This includes the references of the energy and radiance properties of
+    all geometry objects (eg. the construction of a Face or the program_type
+    of a Room) as well as the references between the resources themselves
+    (eg. the materials of an OpaqueConstructionAbridged, the schedules of a
+    ProgramTypeAbridged or the day schedules of a ScheduleRulesetAbridged).
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+
+    Returns:
+        A list of ValidationErrors with one error for each reference that
+        could not be found in the Model. The errors are reported for the
+        object that holds the reference (eg. the Face or the Construction).
+    """
+    indexes = resource_indexes(model_dict)
+    errors = []
+    for obj_type, obj, parents in iter_geometry(model_dict):
+        properties = obj.get('properties') or {}
+        for path, key, identifier in _iter_references(properties, ('properties',)):
+            if identifier not in indexes[key]:
+                errors.append(
+                    _missing_error(obj_type, obj, path, key, identifier, parents))
+
+    for _, obj_type, _, obj in iter_resources(model_dict):
+        for path, key, identifier in _iter_references(obj):
+            if identifier not in indexes[key]:
+                errors.append(_missing_error(obj_type, obj, path, key, identifier))
+        if obj.get('type') in ('ScheduleRulesetAbridged', 'ScheduleRuleset'):
+            day_ids = {day['identifier'] for day in obj['day_schedules']}
+            for path, identifier in _iter_day_references(obj):
+                if identifier not in day_ids:
+                    message = 'Schedule "{}" references the day schedule "{}" with ' \
+                        'its {} but this day schedule is not in its ' \
+                        'day_schedules.'.format(
+                            obj['identifier'], identifier,
+                            '.'.join(str(k) for k in path))
+                    errors.append(object_error(
+                        DAY_SCHEDULE_CODE, 'Missing Day Schedule', obj_type, obj,
+                        message, 'Energy'
+                    ))
+    return errors
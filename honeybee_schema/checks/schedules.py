@@ -0,0 +1,150 @@
+"""Check that the values of the schedules of a Model are within their type limits.
+
+The ScheduleTypeLimits of the Model are indexed by identifier such that the
+schedule_type_limit of each schedule is resolved in constant time. The values
+of all ScheduleDays of a ScheduleRuleset are then gathered into a single array
+of floats with the offsets of each ScheduleDay and each schedule is checked with
+one pass of min, max and float.is_integer over its array of values. The values
+are only searched for the first offending index when the pass finds an error.
+The ExternalValues of ScheduleFixedIntervals are checked through the memory-map
+of their .hbval file, which is not copied into the array.
+"""
+from array import array
+from bisect import bisect_right
+
+from ._traverse import object_error
+from ..energy.schedule import EncodedValues, ExternalValues
+
+# error codes for schedule values outside of the limits, non-integer values and
+# ExternalValues that could not be checked
+OUT_OF_RANGE_CODE = '020021'
+NON_INTEGER_CODE = '020022'
+UNCHECKED_VALUES_CODE = '020023'
+
+_RULESET_TYPES = ('ScheduleRulesetAbridged', 'ScheduleRuleset')
+_FIXED_INTERVAL_TYPES = ('ScheduleFixedIntervalAbridged', 'ScheduleFixedInterval')
+
+
+def _limit(value, default):
+    """Get a limit of a ScheduleTypeLimit, which may be a NoLimit dictionary."""
+    return default if value is None or isinstance(value, dict) else value
+
+
+def _schedule_values(schedule, values_folder=None):
+    """Get an array of the values of a schedule and the offsets of its ScheduleDays.
+
+    The values of ExternalValues are a memoryview of their .hbval file, which
+    raises a ValueError if the file cannot be loaded from the values_folder.
+    """
+    if schedule['type'] in _RULESET_TYPES:
+        values, offsets = array('d'), [0]
+        for day in schedule['day_schedules']:
+            values.extend(day['values'])
+            offsets.append(len(values))
+        return values, offsets
+    values = schedule['values']
+    if isinstance(values, dict) and values.get('type') == 'ExternalValues':
+        if values_folder is None:
+            raise ValueError('The folder of the Model JSON file is not known.')
+        return ExternalValues.model_validate(values).load(values_folder), None
+    if isinstance(values, dict):
+        return EncodedValues.model_validate(values).decode(), None
+    return array('d', values), None
+
+
+def _location(schedule, offsets, index):
+    """Get text for the location of a value in a schedule."""
+    if offsets is None:
+        return 'index {} of its values'.format(index)
+    day = bisect_right(offsets, index) - 1
+    return 'index {} of its ScheduleDay "{}"'.format(
+        index - offsets[day], schedule['day_schedules'][day]['identifier'])
+
+
+def schedule_type_limit_index(model_dict):
+    """Get a dictionary of the ScheduleTypeLimits of a Model keyed by identifier.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+    """
+    energy = (model_dict.get('properties') or {}).get('energy') or {}
+    return {type_limit['identifier']: type_limit
+            for type_limit in energy.get('schedule_type_limits') or ()}
+
+
+def check_schedule_limits(model_dict, values_folder=None):
+    """Check that all schedule values of a Model dictionary are within their limits.
+
+    The values of each ScheduleRuleset (including the values of all of its
+    ScheduleDays) and each ScheduleFixedInterval must be between the
+    lower_limit and upper_limit of its schedule_type_limit and they must be
+    integers if the numeric_type of the ScheduleTypeLimit is Discrete.
+    Schedules without a schedule_type_limit or with one that is not in the
+    Model are not checked.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+        values_folder: The folder of the Model JSON file, which is used to load
+            the .hbval files of the ExternalValues of ScheduleFixedIntervals.
+            If None or if a file cannot be loaded, an error is reported for
+            each schedule with ExternalValues to note that it was not checked.
+
+    Returns:
+        A list of ValidationErrors with at most one error for the values
+        outside of the limits and one error for the non-integer values of
+        each schedule. The message of each error contains the first offending
+        index along with the number of offending values.
+    """
+    type_limits = schedule_type_limit_index(model_dict)
+    energy = (model_dict.get('properties') or {}).get('energy') or {}
+    errors = []
+    for schedule in energy.get('schedules') or ():
+        if schedule.get('type') not in _RULESET_TYPES + _FIXED_INTERVAL_TYPES:
+            continue
+        type_limit = schedule.get('schedule_type_limit')
+        if not isinstance(type_limit, dict):
+            type_limit = type_limits.get(type_limit)
+        if type_limit is None:
+            continue
+        try:
+            values, offsets = _schedule_values(schedule, values_folder)
+        except ValueError as error:
+            message = 'The ExternalValues of schedule "{}" could not be checked ' \
+                'against its ScheduleTypeLimit "{}". {}'.format(
+                    schedule['identifier'], type_limit['identifier'], error)
+            errors.append(object_error(
+                UNCHECKED_VALUES_CODE, 'Unchecked Schedule Values', 'Schedule',
+                schedule, message, 'Energy'))
+            continue
+        if not values:
+            continue
+        lower = _limit(type_limit.get('lower_limit'), float('-inf'))
+        upper = _limit(type_limit.get('upper_limit'), float('inf'))
+
+        # check that all values are within the limits
+        if min(values) < lower or max(values) > upper:
+            invalid = [i for i, value in enumerate(values)
+                       if not lower <= value <= upper]
+            message = 'Schedule "{}" has {} values outside of the limits ({} to {}) ' \
+                'of its ScheduleTypeLimit "{}". The first is {} at {}.'.format(
+                    schedule['identifier'], len(invalid), lower, upper,
+                    type_limit['identifier'], values[invalid[0]],
+                    _location(schedule, offsets, invalid[0]))
+            errors.append(object_error(
+                OUT_OF_RANGE_CODE, 'Schedule Value Out of Range', 'Schedule',
+                schedule, message, 'Energy'))
+
+        # check that all values are integers for Discrete schedules
+        if type_limit.get('numeric_type') == 'Discrete':
+            integers = list(map(float.is_integer, values))
+            if False in integers:
+                first = integers.index(False)
+                message = 'Schedule "{}" has {} values that are not integers but its ' \
+                    'ScheduleTypeLimit "{}" is Discrete. The first is {} at {}.'.format(
+                        schedule['identifier'], integers.count(False),
+                        type_limit['identifier'], values[first],
+                        _location(schedule, offsets, first))
+                errors.append(object_error(
+                    NON_INTEGER_CODE, 'Non-Integer Schedule Value', 'Schedule',
+                    schedule, message, 'Energy'))
+    return errors
@@ -7,6 +7,7 @@ except ImportError:
         'click module is not installed. Try `pip install honeybee-schema[cli]` command.'
     )
 
+import os
 import sys
 import logging
 import json
@@ -111,5 +112,115 @@ def update_model(model_json, version, output_file):
         sys.exit(0)
 
 
+@main.command('validate-model')
+@click.argument('model-json', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.option('--jobs', '-j', help='An integer for the number of processes to be '
+              'used to validate the Model. If unspecified, all of the CPUs of the '
+              'machine will be used.', type=int, default=None)
+@click.option('--cache-dir', help='Optional path to a directory in which '
+              'ValidationReports are cached. When the same Model JSON has already '
+              'been validated with this version of honeybee-schema, the cached '
+              'report is output without parsing the Model.', type=click.Path(
+                  file_okay=False, dir_okay=True, resolve_path=True), default=None)
+@click.option('--output-file', help='Optional file to output the JSON string of '
+              'the ValidationReport. By default, it will be printed out to stdout',
+              type=click.File('w'), default='-', show_default=True)
+def validate_model(model_json, jobs, cache_dir, output_file):
+    """Validate a Honeybee Model JSON against honeybee-schema in parallel.
+
+    \b
+    Args:
+        model_json: Full path to a Model JSON file.
+    """
+    try:
+        # import the validators here so that they are only loaded when used
+        from honeybee_schema.parallel import validate_model_parallel
+        from honeybee_schema.cache import validate_model_cached
+        if cache_dir is None:
+            report = validate_model_parallel(model_json, jobs=jobs)
+        else:
+            report = validate_model_cached(model_json, cache_dir, jobs=jobs)
+        output_file.write(report.model_dump_json(exclude_none=True))
+    except Exception as e:
+        _logger.exception('Failed to validate Honeybee Model JSON.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
+@main.command('check-model')
+@click.argument('model-json', type=click.Path(
+    exists=True, file_okay=True, dir_okay=False, resolve_path=True))
+@click.option('--output-file', help='Optional file to output the JSON string of '
+              'the ValidationReport. By default, it will be printed out to stdout',
+              type=click.File('w'), default='-', show_default=True)
+def check_model(model_json, output_file):
+    """Check the identifiers, references and adjacencies of a Honeybee Model JSON.
+
+    This checks that the identifiers of the Model objects are unique, that all
+    resources referenced by identifier exist and that all Surface boundary
+    conditions are reciprocal. The Model JSON should already comply with
+    the schema (eg. as checked by the validate-model command).
+
+    \b
+    Args:
+        model_json: Full path to a Model JSON file.
+    """
+    try:
+        from honeybee_schema.checks import check_model as _check_model
+        with open(model_json, encoding='utf-8') as json_file:
+            model_dict = json.load(json_file)
+        report = _check_model(model_dict, os.path.dirname(model_json))
+        output_file.write(report.model_dump_json(exclude_none=True))
+    except Exception as e:
+        _logger.exception('Failed to check Honeybee Model JSON.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
+@main.command('synthetic-model')
+@click.argument('output-file', type=click.Path(
+    file_okay=True, dir_okay=False, resolve_path=True))
+@click.option('--rooms', '-r', help='An integer for the number of Rooms in the '
+              'Model.', type=int, default=100, show_default=True)
+@click.option('--faces-per-room', '-f', help='An integer for the number of Faces in '
+              'each Room. This must be 2 plus a multiple of 4.',
+              type=int, default=6, show_default=True)
+@click.option('--apertures-per-face', '-a', help='An integer for the number of '
+              'Apertures in each exterior wall.', type=int, default=1,
+              show_default=True)
+@click.option('--shades-per-aperture', '-s', help='An integer for the number of '
+              'outdoor Shades above each Aperture.', type=int, default=1,
+              show_default=True)
+@click.option('--sensor-grids', '-g', help='An integer for the number of '
+              'SensorGrids in the Model. By default, each Room gets a SensorGrid.',
+              type=int, default=None)
+@click.option('--schedules', help='An integer for the number of schedules used by '
+              'the ProgramTypes.', type=int, default=4, show_default=True)
+@click.option('--program-types', help='An integer for the number of ProgramTypes.',
+              type=int, default=2, show_default=True)
+def synthetic_model(output_file, rooms, faces_per_room, apertures_per_face,
+                    shades_per_aperture, sensor_grids, schedules, program_types):
+    """Write a synthetic Honeybee Model JSON of any size for scale testing.
+
+    \b
+    Args:
+        output_file: Full path to the Model JSON file to be written.
+    """
+    try:
+        from honeybee_schema.synthetic import write_synthetic_model
+        counts = write_synthetic_model(
+            output_file, rooms, faces_per_room, apertures_per_face,
+            shades_per_aperture, sensor_grids, schedules, program_types)
+        print(json.dumps(counts), file=sys.stderr)
+    except Exception as e:
+        _logger.exception('Failed to write synthetic Model JSON.\n{}'.format(e))
+        sys.exit(1)
+    else:
+        sys.exit(0)
+
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,7 @@
 """Schema for the comparison object returned by the comparison command"""
 from typing import List, Literal, Union
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class GeometryObjectTypes(str, Enum):
@@ -15,6 +15,8 @@ class GeometryObjectTypes(str, Enum):
 
 class _DiffObjectBase(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     element_type: GeometryObjectTypes = Field(
         ...,
         description='Text for the type of object that has been changed.'
@@ -121,6 +123,8 @@ class AddedObject(_DiffObjectBase):
 
 class ComparisonReport(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ComparisonReport'] = 'ComparisonReport'
 
     changed_objects: Union[List[ChangedObject], None] = Field(
@@ -186,6 +190,8 @@ class AddedInstruction(_DiffObjectBase):
 
 class SyncInstructions(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['SyncInstructions'] = 'SyncInstructions'
 
     changed_objects: Union[List[ChangedInstruction], None] = Field(
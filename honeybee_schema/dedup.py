@@ -0,0 +1,171 @@
+"""Merge the equivalent schedules of a Model dictionary.
+
+Each ScheduleDay and schedule is reduced to a canonical form that excludes its
+identifier, display_name and user_data (eg. the consecutive times of a
+ScheduleDay with the same value are merged and the ScheduleDays of a
+ScheduleRuleset are replaced with their canonical form). Schedules with the
+same hash of their canonical form are equivalent and only the first one is
+kept in the Model. All references to the removed schedules are then rewritten
+in a single traversal of the Model using the same table of references that is
+used to check that the references of the Model exist.
+"""
+import json
+import hashlib
+
+from .checks._traverse import iter_geometry, iter_resources
+from .checks.references import _iter_references
+from .energy.schedule import EncodedValues
+
+_RULESET_TYPES = ('ScheduleRulesetAbridged', 'ScheduleRuleset')
+_FIXED_INTERVAL_TYPES = ('ScheduleFixedIntervalAbridged', 'ScheduleFixedInterval')
+_DAY_SCHEDULE_FIELDS = (
+    'default_day_schedule', 'holiday_schedule',
+    'summer_designday_schedule', 'winter_designday_schedule'
+)
+_APPLY_KEYS = ('apply_sunday', 'apply_monday', 'apply_tuesday', 'apply_wednesday',
+               'apply_thursday', 'apply_friday', 'apply_saturday')
+
+
+def _hash(canonical):
+    content = json.dumps(canonical, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _type_limit(schedule):
+    type_limit = schedule.get('schedule_type_limit')
+    return type_limit.get('identifier') if isinstance(type_limit, dict) else type_limit
+
+
+def canonical_day(schedule_day):
+    """Get a canonical list for the values of a ScheduleDay dictionary.
+
+    Args:
+        schedule_day: A dictionary of a ScheduleDay.
+
+    Returns:
+        A list with the interpolate value of the ScheduleDay followed by a
+        [minute, value] list for each time of the ScheduleDay. Times that
+        have the same value as the previous time are removed when the
+        ScheduleDay is not interpolated.
+    """
+    interpolate = bool(schedule_day.get('interpolate', False))
+    times = schedule_day.get('times') or [[0, 0]]
+    steps = []
+    for (hour, minute), value in zip(times, schedule_day['values']):
+        if interpolate or not steps or float(value) != steps[-1][1]:
+            steps.append([hour * 60 + minute, float(value)])
+    return [interpolate] + steps
+
+
+def canonical_schedule(schedule):
+    """Get a canonical list for the values of a schedule dictionary.
+
+    Args:
+        schedule: A dictionary of a ScheduleRuleset or a ScheduleFixedInterval,
+            which can be abridged.
+
+    Returns:
+        A list that is equal for all equivalent schedules and that does not
+        include the identifiers of the schedule or its ScheduleDays. The
+        ExternalValues of a ScheduleFixedInterval are compared by the range
+        of the file that they reference.
+    """
+    if schedule['type'] in _RULESET_TYPES:
+        days = {day['identifier']: canonical_day(day)
+                for day in schedule['day_schedules']}
+        rules = []
+        for rule in schedule.get('schedule_rules') or ():
+            rules.append([days.get(rule['schedule_day']),
+                          [bool(rule.get(key, False)) for key in _APPLY_KEYS],
+                          list(rule.get('start_date', [1, 1])[:2]),
+                          list(rule.get('end_date', [12, 31])[:2])])
+        return ['ScheduleRuleset', _type_limit(schedule),
+                [days.get(schedule.get(key)) for key in _DAY_SCHEDULE_FIELDS], rules]
+    values = schedule['values']
+    if isinstance(values, dict) and values.get('type') == 'ExternalValues':
+        values = [values['path'], values.get('offset', 0), values['length']]
+    elif isinstance(values, dict):
+        values = [float(value) for value in EncodedValues.model_validate(values).decode()]
+    else:
+        values = [float(value) for value in values]
+    start_date = list(schedule.get('start_date', [1, 1]))
+    leap_year = len(start_date) == 3 and bool(start_date[2])
+    return ['ScheduleFixedInterval', _type_limit(schedule),
+            values, schedule.get('timestep', 1),
+            start_date[:2] + [leap_year], float(schedule.get('placeholder_value', 0)),
+            bool(schedule.get('interpolate', False))]
+
+
+def _merge_day_schedules(schedule):
+    """Remove the duplicated ScheduleDays of a ScheduleRuleset dictionary."""
+    kept, renamed, day_schedules = {}, {}, []
+    for day in schedule['day_schedules']:
+        key = _hash(canonical_day(day))
+        if key in kept:
+            renamed[day['identifier']] = kept[key]
+        else:
+            kept[key] = day['identifier']
+            day_schedules.append(day)
+    if not renamed:
+        return
+    schedule['day_schedules'] = day_schedules
+    for key in _DAY_SCHEDULE_FIELDS:
+        if schedule.get(key) in renamed:
+            schedule[key] = renamed[schedule[key]]
+    for rule in schedule.get('schedule_rules') or ():
+        rule['schedule_day'] = renamed.get(rule['schedule_day'], rule['schedule_day'])
+
+
+def _set_path(obj, path, value):
+    """Set the value at a path of keys and indices within a dictionary."""
+    for key in path[:-1]:
+        obj = obj[key]
+    obj[path[-1]] = value
+
+
+def deduplicate_schedules(model_dict):
+    """Merge the equivalent ScheduleDays and schedules of a Model dictionary in place.
+
+    The duplicated ScheduleDays within each ScheduleRuleset are removed first.
+    Schedules of the Model with equivalent values and the same
+    schedule_type_limit are then merged into the first of them and all
+    references to the removed schedules are rewritten (eg. the schedules of
+    the loads of Rooms and ProgramTypes, the setpoints, the availability
+    schedules of HVACs and the transmittance schedules of Shades).
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+
+    Returns:
+        A dictionary that maps the identifier of each removed schedule to the
+        identifier of the schedule that replaces it.
+    """
+    energy = (model_dict.get('properties') or {}).get('energy') or {}
+    kept, renamed, schedules = {}, {}, []
+    for schedule in energy.get('schedules') or ():
+        if schedule['type'] in _RULESET_TYPES:
+            _merge_day_schedules(schedule)
+        elif schedule['type'] not in _FIXED_INTERVAL_TYPES:
+            schedules.append(schedule)
+            continue
+        key = _hash(canonical_schedule(schedule))
+        if key not in kept:
+            kept[key] = schedule['identifier']
+            schedules.append(schedule)
+        elif kept[key] != schedule['identifier']:
+            renamed[schedule['identifier']] = kept[key]
+    if len(schedules) != len(energy.get('schedules') or ()):
+        energy['schedules'] = schedules
+    if not renamed:
+        return renamed
+
+    for _, obj, _ in iter_geometry(model_dict):
+        properties = obj.get('properties') or {}
+        for path, key, identifier in _iter_references(properties):
+            if key == 'schedules' and identifier in renamed:
+                _set_path(properties, path, renamed[identifier])
+    for _, _, _, obj in iter_resources(model_dict):
+        for path, key, identifier in _iter_references(obj):
+            if key == 'schedules' and identifier in renamed:
+                _set_path(obj, path, renamed[identifier])
+    return renamed
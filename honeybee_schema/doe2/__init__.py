@@ -0,0 +1,7 @@
+"""DOE-2 schema objects."""
+from .._lazy import lazy_loader
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'ModelDoe2Properties': 'properties',
+    'RoomDoe2Properties': 'properties'
+})
@@ -0,0 +1,23 @@
+"""Energy schema objects."""
+from .._lazy import lazy_loader
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'ModelEnergyProperties': 'properties',
+    'SimulationParameter': 'simulation',
+    'ConstructionSet': 'constructionset',
+    'ConstructionSetAbridged': 'constructionset',
+    'GlobalConstructionSet': 'global_constructionset',
+    'OpaqueConstruction': 'construction',
+    'OpaqueConstructionAbridged': 'construction',
+    'WindowConstruction': 'construction',
+    'WindowConstructionAbridged': 'construction',
+    'ProgramType': 'programtype',
+    'ProgramTypeAbridged': 'programtype',
+    'ScheduleTypeLimit': 'schedule',
+    'ScheduleRuleset': 'schedule',
+    'ScheduleRulesetAbridged': 'schedule',
+    'ScheduleFixedInterval': 'schedule',
+    'ScheduleFixedIntervalAbridged': 'schedule',
+    'DesignDay': 'designday',
+    'SHWSystem': 'shw'
+})
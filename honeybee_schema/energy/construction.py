@@ -31,9 +31,10 @@ class OpaqueConstruction(OpaqueConstructionAbridged):
 
     type: Literal['OpaqueConstruction'] = 'OpaqueConstruction'
 
-    materials: List[
-        Union[EnergyMaterial, EnergyMaterialNoMass, EnergyMaterialVegetation]
-    ] = Field(
+    materials: List[Annotated[
+        Union[EnergyMaterial, EnergyMaterialNoMass, EnergyMaterialVegetation],
+        Field(discriminator='type')
+    ]] = Field(
         ...,
         description='List of opaque material definitions. The order '
         'of the materials is from exterior to interior.',
@@ -72,13 +73,14 @@ class WindowConstruction(WindowConstructionAbridged):
 
     type: Literal['WindowConstruction'] = 'WindowConstruction'
 
-    materials: List[
+    materials: List[Annotated[
         Union[
             EnergyWindowMaterialSimpleGlazSys, EnergyWindowMaterialGlazing,
             EnergyWindowMaterialGas, EnergyWindowMaterialGasCustom,
             EnergyWindowMaterialGasMixture
-        ]
-    ] = Field(
+        ],
+        Field(discriminator='type')
+    ]] = Field(
         ...,
         description='List of glazing and gas material definitions. The order '
         'of the materials is from exterior to interior. If a SimpleGlazSys '
@@ -190,6 +192,7 @@ class WindowConstructionShade(WindowConstructionShadeAbridged):
         EnergyWindowMaterialGlazing
     ] = Field(
         ...,
+        discriminator='type',
         description='Identifier of a An EnergyWindowMaterialShade or an '
         'EnergyWindowMaterialBlind that serves as the shading layer for this '
         'construction. This can also be an EnergyWindowMaterialGlazing, which '
@@ -199,6 +202,7 @@ class WindowConstructionShade(WindowConstructionShadeAbridged):
 
     schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         None,
+        discriminator='type',
         description='An optional ScheduleRuleset or ScheduleFixedInterval to be '
         'applied on top of the control_type. If None, the control_type will govern '
         'all behavior of the construction.'
@@ -245,6 +249,7 @@ class WindowConstructionDynamic(IDdEnergyBaseModel):
 
     schedule: Union[ScheduleRuleset, ScheduleFixedInterval] = Field(
         ...,
+        discriminator='type',
         description='A control schedule that dictates which constructions '
         'are active at given times throughout the simulation. The values of the '
         'schedule should be integers and range from 0 to one less then the number '
@@ -314,6 +319,7 @@ class AirBoundaryConstruction(AirBoundaryConstructionAbridged):
 
     air_mixing_schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='A fractional schedule as a ScheduleRuleset or '
         'ScheduleFixedInterval for the air mixing schedule across '
         'the construction. If unspecified, an Always On schedule will be assumed.'
@@ -142,14 +142,18 @@ class ApertureConstructionSet(NoExtraBaseModel):
     interior_construction: Union[
         WindowConstruction, WindowConstructionShade, WindowConstructionDynamic, None
     ] = Field(
-        default=None, description='A WindowConstruction for all apertures with a '
+        default=None,
+        discriminator='type',
+        description='A WindowConstruction for all apertures with a '
         'Surface boundary condition.'
     )
 
     window_construction: Union[
         WindowConstruction, WindowConstructionShade, WindowConstructionDynamic, None
     ] = Field(
-        default=None, description='A WindowConstruction for apertures with an '
+        default=None,
+        discriminator='type',
+        description='A WindowConstruction for apertures with an '
         'Outdoors boundary condition, False is_operable property, and a Wall '
         'face type for their parent face.'
     )
@@ -158,6 +162,7 @@ class ApertureConstructionSet(NoExtraBaseModel):
         WindowConstruction, WindowConstructionShade, WindowConstructionDynamic, None
     ] = Field(
         default=None,
+        discriminator='type',
         description='A WindowConstruction for apertures with a Outdoors boundary '
         'condition, False is_operable property, and a RoofCeiling or '
         'Floor face type for their parent face.'
@@ -167,6 +172,7 @@ class ApertureConstructionSet(NoExtraBaseModel):
         WindowConstruction, WindowConstructionShade, WindowConstructionDynamic, None
     ] = Field(
         default=None,
+        discriminator='type',
         description='A WindowConstruction for all apertures with an '
         'Outdoors boundary condition and True is_operable property.'
     )
@@ -247,6 +253,7 @@ class DoorConstructionSet(NoExtraBaseModel):
         WindowConstruction, WindowConstructionShade, WindowConstructionDynamic, None
     ] = Field(
         default=None,
+        discriminator='type',
         description='A WindowConstruction for all glass doors with an '
         'Outdoors boundary condition.'
     )
@@ -255,6 +262,7 @@ class DoorConstructionSet(NoExtraBaseModel):
         WindowConstruction, WindowConstructionShade, WindowConstructionDynamic, None
     ] = Field(
         default=None,
+        discriminator='type',
         description='A WindowConstruction for all glass doors with a '
         'Surface boundary condition.'
     )
@@ -350,6 +358,7 @@ class ConstructionSet(ConstructionSetAbridged):
         AirBoundaryConstruction, OpaqueConstruction, None
     ] = Field(
         default=None,
+        discriminator='type',
         description='An AirBoundaryConstruction or OpaqueConstruction to set '
         'the properties of Faces with an AirBoundary type.'
     )
@@ -211,4 +211,4 @@ class DesignDay(NoExtraBaseModel):
         description='A WindCondition describing wind conditions on the design day.'
     )
 
-    sky_condition: Union[ASHRAEClearSky, ASHRAETau]
+    sky_condition: Union[ASHRAEClearSky, ASHRAETau] = Field(..., discriminator='type')
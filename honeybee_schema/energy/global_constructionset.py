@@ -2,7 +2,7 @@
 import pathlib
 import json
 
-from typing import List, Union, Literal
+from typing import List, Union, Literal, Annotated
 from pydantic import Field
 
 from honeybee_standards import energy_default
@@ -62,19 +62,19 @@ class GlobalConstructionSet(NoExtraBaseModel):
 
     type: Literal['GlobalConstructionSet'] = 'GlobalConstructionSet'
 
-    materials: List[Union[
+    materials: List[Annotated[Union[
         EnergyMaterial, EnergyMaterialNoMass,
         EnergyWindowMaterialGlazing, EnergyWindowMaterialGas
-    ]] = Field(
+    ], Field(discriminator='type')]] = Field(
         default=_MATERIALS,
         description='Global Honeybee Energy materials.',
         json_schema_extra={'readOnly': True}
     )
 
-    constructions: List[Union[
+    constructions: List[Annotated[Union[
         OpaqueConstructionAbridged, WindowConstructionAbridged,
         ShadeConstruction, AirBoundaryConstructionAbridged
-    ]] = Field(
+    ], Field(discriminator='type')]] = Field(
         default=_CONSTRUCTIONS,
         description='Global Honeybee Energy constructions.',
         json_schema_extra={'readOnly': True}
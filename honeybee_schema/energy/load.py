@@ -69,6 +69,7 @@ class People(PeopleAbridged):
 
     occupancy_schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='A schedule for the occupancy over the course of the '
         'year. The type of this schedule should be Fractional and the fractional '
         'values will get multiplied by the people_per_area to yield a complete '
@@ -77,6 +78,7 @@ class People(PeopleAbridged):
 
     activity_schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='A schedule for the activity of the occupants over the '
         'course of the year. The type of this schedule should be ActivityLevel '
         'and the values of the schedule equal to the number of Watts given off by an '
@@ -155,6 +157,7 @@ class Lighting(LightingAbridged):
 
     schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='The schedule for the use of lights over the course of '
         'the year. The type of this schedule should be Fractional and the '
         'fractional values will get multiplied by the watts_per_area to yield a '
@@ -224,6 +227,7 @@ class ElectricEquipment(ElectricEquipmentAbridged):
 
     schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='The schedule for the use of equipment over the course '
         'of the year. The type of this schedule should be Fractional and the '
         'fractional values will get multiplied by the watts_per_area to yield '
@@ -242,6 +246,7 @@ class GasEquipment(GasEquipmentAbridged):
 
     schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='The schedule for the use of equipment over the course '
         'of the year. The type of this schedule should be Fractional and the '
         'fractional values will get multiplied by the watts_per_area to yield '
@@ -310,6 +315,7 @@ class ServiceHotWater(ServiceHotWaterAbridged):
 
     schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='The schedule for the use of hot water over the course of '
         'the year. The type of this schedule should be Fractional and the '
         'fractional values will get multiplied by the flow_per_area to yield a '
@@ -360,6 +366,7 @@ class Infiltration(InfiltrationAbridged):
 
     schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='The schedule for the infiltration over the course of '
         'the year. The type of this schedule should be Fractional and the '
         'fractional values will get multiplied by the flow_per_exterior_area '
@@ -470,6 +477,7 @@ class Ventilation(VentilationAbridged):
 
     schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='Schedule for the ventilation over the course of '
         'the year. The type of this schedule should be Fractional and the '
         'fractional values will get multiplied by the total design flow rate '
@@ -554,24 +562,28 @@ class Setpoint(SetpointAbridged):
 
     cooling_schedule: Union[ScheduleRuleset, ScheduleFixedInterval] = Field(
         ...,
+        discriminator='type',
         description='Schedule for the cooling setpoint. The values in '
         'this schedule should be temperature in [C].'
     )
 
     heating_schedule: Union[ScheduleRuleset, ScheduleFixedInterval] = Field(
         ...,
+        discriminator='type',
         description='Schedule for the heating setpoint. The values in '
         'this schedule should be temperature in [C].'
     )
 
     humidifying_schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='Schedule for the humidification setpoint. The values '
         'in this schedule should be in [%].'
     )
 
     dehumidifying_schedule: Union[ScheduleRuleset, ScheduleFixedInterval, None] = Field(
         default=None,
+        discriminator='type',
         description='Schedule for the dehumidification setpoint. The values '
         'in this schedule should be in [%].'
     )
@@ -1,6 +1,6 @@
 """Model energy properties."""
 from pydantic import Field
-from typing import List, Union, Literal
+from typing import List, Union, Literal, Annotated
 
 from .._base import NoExtraBaseModel
 from .constructionset import ConstructionSetAbridged, ConstructionSet
@@ -280,13 +280,13 @@ class RoomEnergyPropertiesAbridged(NoExtraBaseModel):
     )
 
 
-ConstructionSetType = Union[
+ConstructionSetType = Annotated[Union[
     ConstructionSetAbridged,
     ConstructionSet,
-]
+], Field(discriminator='type')]
 
 
-ConstructionType = Union[
+ConstructionType = Annotated[Union[
     OpaqueConstructionAbridged,
     WindowConstructionAbridged,
     WindowConstructionShadeAbridged,
@@ -298,10 +298,10 @@ ConstructionType = Union[
     WindowConstructionDynamic,
     AirBoundaryConstruction,
     ShadeConstruction,
-]
+], Field(discriminator='type')]
 
 
-MaterialType = Union[
+MaterialType = Annotated[Union[
     EnergyMaterial,
     EnergyMaterialNoMass,
     EnergyMaterialVegetation,
@@ -313,10 +313,10 @@ MaterialType = Union[
     EnergyWindowFrame,
     EnergyWindowMaterialBlind,
     EnergyWindowMaterialShade,
-]
+], Field(discriminator='type')]
 
 
-HVACType = Union[
+HVACType = Annotated[Union[
     IdealAirSystemAbridged,
     VAV,
     PVAV,
@@ -337,21 +337,21 @@ HVACType = Union[
     GasUnitHeater,
     Radiant,
     DetailedHVAC,
-]
+], Field(discriminator='type')]
 
 
-ProgramTypeUnion = Union[
+ProgramTypeUnion = Annotated[Union[
     ProgramTypeAbridged,
     ProgramType,
-]
+], Field(discriminator='type')]
 
 
-ScheduleTypeUnion = Union[
+ScheduleTypeUnion = Annotated[Union[
     ScheduleRulesetAbridged,
     ScheduleFixedIntervalAbridged,
     ScheduleRuleset,
     ScheduleFixedInterval,
-]
+], Field(discriminator='type')]
 
 
 class ModelEnergyProperties(NoExtraBaseModel):
@@ -0,0 +1,275 @@
+"""Resolution of the constructions of all Faces, Apertures and Doors of a Model.
+
+The construction of each Face, Aperture and Door is either assigned to the
+object itself or it is set by the construction_set of its parent Room, which
+falls back to the global_construction_set of the Model for each construction
+that the ConstructionSet does not specify. The construction that each
+ConstructionSet assigns to every combination of object type, face type,
+boundary condition and sub-face kind (eg. operable Apertures or glass Doors)
+is computed once into a single table. The constructions of all objects of a
+Model are then found with one lookup in the table per object.
+
+The table entries of each ConstructionSet are recomputed only when the content
+of the ConstructionSet changes, which is tracked with a hash of its content.
+"""
+import json
+import hashlib
+from itertools import product
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from ..checks._traverse import iter_geometry
+
+FACE_TYPES = ('Wall', 'Floor', 'RoofCeiling', 'AirBoundary')
+BOUNDARY_CONDITIONS = ('Outdoors', 'Surface', 'Ground', 'Adiabatic',
+                       'OtherSideTemperature')
+# Apertures and Doors can only have Outdoors or Surface boundary conditions
+SUB_FACE_BOUNDARY_CONDITIONS = ('Outdoors', 'Surface')
+_FACE_SETS = {'Wall': 'wall_set', 'Floor': 'floor_set', 'RoofCeiling': 'roof_ceiling_set'}
+
+
+def _slot_field(obj_type, face_type, boundary_condition, flag):
+    """Get the (sub-set, field) of a ConstructionSet for a table slot.
+
+    The flag is the is_operable property of Apertures, the is_glass property
+    of Doors and it is always False for Faces. The face_type is the type of
+    the parent Face for Apertures and Doors, which only have slots for the
+    SUB_FACE_BOUNDARY_CONDITIONS.
+    """
+    if obj_type == 'Face':
+        if face_type == 'AirBoundary':
+            return None, 'air_boundary_construction'
+        field = 'exterior_construction' if boundary_condition == 'Outdoors' else \
+            'ground_construction' if boundary_condition == 'Ground' else \
+            'interior_construction'
+        return _FACE_SETS[face_type], field
+    if obj_type == 'Aperture':
+        field = 'interior_construction' if boundary_condition == 'Surface' else \
+            'operable_construction' if flag else \
+            'window_construction' if face_type == 'Wall' else 'skylight_construction'
+        return 'aperture_set', field
+    if boundary_condition == 'Surface':
+        field = 'interior_glass_construction' if flag else 'interior_construction'
+    else:
+        field = 'exterior_glass_construction' if flag else \
+            'exterior_construction' if face_type == 'Wall' else 'overhead_construction'
+    return 'door_set', field
+
+
+# all slots of the table along with the field of the ConstructionSet for each slot
+SLOTS = {
+    slot: _slot_field(*slot) for slot in
+    product(('Face',), FACE_TYPES, BOUNDARY_CONDITIONS, (False,))
+}
+SLOTS.update({
+    slot: _slot_field(*slot) for slot in
+    product(('Aperture', 'Door'), FACE_TYPES, SUB_FACE_BOUNDARY_CONDITIONS,
+            (False, True))
+})
+_FLAGS = {'Aperture': 'is_operable', 'Door': 'is_glass'}
+
+
+def _dict(obj):
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json', exclude_none=True)
+    return obj
+
+
+def _content_hash(obj):
+    content = json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _field(construction_set, sub_set, field):
+    """Get the identifier of a construction of a ConstructionSet dictionary or None.
+    """
+    if sub_set is not None:
+        construction_set = construction_set.get(sub_set) or {}
+    construction = construction_set.get(field)
+    return construction.get('identifier') if isinstance(construction, dict) \
+        else construction
+
+
+@lru_cache(maxsize=None)
+def _default_global_set():
+    from .global_constructionset import GlobalConstructionSet
+    return _dict(GlobalConstructionSet())
+
+
+class ConstructionResolver:
+    """Resolver of the constructions of Faces, Apertures and Doors.
+
+    The table of constructions is keyed by (construction_set, obj_type,
+    face_type, boundary_condition, flag) tuples, where construction_set is
+    the identifier of a ConstructionSet or None for the global construction
+    set. The table entries of a ConstructionSet are computed the first time
+    that it is used and they are dropped whenever the content of the
+    ConstructionSet changes in the update method.
+
+    Args:
+        construction_sets: A list of ConstructionSet objects or dictionaries
+            (eg. the construction_sets of ModelEnergyProperties).
+        global_construction_set: An optional GlobalConstructionSet object or
+            dictionary. If None, the default GlobalConstructionSet is used.
+    """
+    __slots__ = ('_sets', '_hashes', '_table')
+
+    def __init__(self, construction_sets=None, global_construction_set=None):
+        self._sets, self._hashes, self._table = {}, {}, {}
+        self.update(construction_sets, global_construction_set)
+
+    def update(self, construction_sets=None, global_construction_set=None):
+        """Update the ConstructionSets, invalidating the entries of changed sets.
+
+        Args:
+            construction_sets: A list of ConstructionSet objects or dictionaries
+                that replaces all of the ConstructionSets of the resolver.
+            global_construction_set: An optional GlobalConstructionSet object or
+                dictionary. If None, the default GlobalConstructionSet is used.
+                When the global construction set changes, the entries of all
+                ConstructionSets are invalidated since they fall back to it.
+
+        Returns:
+            A list of the identifiers of the ConstructionSets whose entries were
+            invalidated, where None denotes the global construction set.
+        """
+        sets = {c_set['identifier']: c_set for c_set in
+                (_dict(c_set) for c_set in construction_sets or ())}
+        sets[None] = _dict(global_construction_set) \
+            if global_construction_set is not None else _default_global_set()
+        hashes = {identifier: _content_hash(c_set) for identifier, c_set in sets.items()}
+        if hashes[None] != self._hashes.get(None):
+            changed = list(set(self._hashes) | set(hashes))
+        else:
+            changed = [identifier for identifier in set(self._hashes) | set(hashes)
+                       if hashes.get(identifier) != self._hashes.get(identifier)]
+        for identifier in changed:
+            for slot in SLOTS:
+                self._table.pop((identifier,) + slot, None)
+        self._sets, self._hashes = sets, hashes
+        return changed
+
+    def _fill(self, identifier):
+        """Compute all table entries of a ConstructionSet."""
+        try:
+            construction_set = self._sets[identifier]
+        except KeyError:
+            raise ValueError('ConstructionSet "{}" was not found.'.format(identifier))
+        global_set = self._sets[None]
+        for slot, (sub_set, field) in SLOTS.items():
+            self._table[(identifier,) + slot] = \
+                _field(construction_set, sub_set, field) or \
+                _field(global_set, sub_set, field)
+
+    def construction(self, construction_set, obj_type, face_type, boundary_condition,
+                     flag=False):
+        """Get the identifier of the construction that a ConstructionSet assigns.
+
+        Args:
+            construction_set: The identifier of a ConstructionSet or None for
+                the global construction set.
+            obj_type: Text for the type of object (Face, Aperture or Door).
+            face_type: Text for the face type of the Face or the parent Face.
+            boundary_condition: Text for the type of boundary condition.
+            flag: The is_operable property of Apertures or the is_glass
+                property of Doors. (Default: False).
+        """
+        key = (construction_set, obj_type, face_type, boundary_condition, bool(flag))
+        try:
+            return self._table[key]
+        except KeyError:
+            if key[1:] not in SLOTS:
+                raise ValueError('No construction for {} with face type {} and '
+                                 '{} boundary condition.'.format(*key[1:4]))
+        self._fill(construction_set)
+        return self._table[key]
+
+    def keys(self, model_dict):
+        """Get the table keys and the assigned constructions of all objects of a Model.
+
+        Args:
+            model_dict: A dictionary of a Model that complies with the schema.
+
+        Returns:
+            A tuple with three lists that have one item for each Face, Aperture
+            and Door of the Model.
+
+            -   identifiers: An (obj_type, identifier) tuple for each object
+                since Faces and sub-faces are separate namespaces.
+
+            -   keys: The table key of each object.
+
+            -   assigned: The identifier of the construction assigned to each
+                object itself or None when it is set by a ConstructionSet.
+        """
+        identifiers, keys, assigned = [], [], []
+        for obj_type, obj, parents in iter_geometry(model_dict):
+            if obj_type not in ('Face', 'Aperture', 'Door'):
+                continue
+            parent_face, room = None, None
+            for parent_type, parent in parents:
+                if parent_type == 'Face':
+                    parent_face = parent
+                elif parent_type == 'Room':
+                    room = parent
+            face_type = obj['face_type'] if obj_type == 'Face' else \
+                parent_face['face_type'] if parent_face is not None else 'Wall'
+            room_energy = ((room or {}).get('properties') or {}).get('energy') or {}
+            obj_energy = (obj.get('properties') or {}).get('energy') or {}
+            identifiers.append((obj_type, obj['identifier']))
+            keys.append((
+                room_energy.get('construction_set'), obj_type, face_type,
+                obj['boundary_condition']['type'],
+                bool(obj.get(_FLAGS[obj_type])) if obj_type in _FLAGS else False))
+            assigned.append(obj_energy.get('construction'))
+        return identifiers, keys, assigned
+
+    def resolve(self, model_dict):
+        """Get the construction of all Faces, Apertures and Doors of a Model.
+
+        Args:
+            model_dict: A dictionary of a Model that complies with the schema.
+                Its ConstructionSets are not used by this method so the update
+                method should be called with them whenever they change.
+
+        Returns:
+            A dictionary with an (obj_type, identifier) tuple of each Face,
+            Aperture and Door as keys and the identifier of its construction
+            as values.
+        """
+        identifiers, keys, assigned = self.keys(model_dict)
+        for construction_set in set(key[0] for key in keys):
+            if (construction_set, 'Face', 'Wall', 'Outdoors', False) not in self._table:
+                self._fill(construction_set)
+        table = self._table
+        # keys without a table entry are sub-faces with unsupported boundary
+        # conditions, for which the construction method raises a ValueError
+        constructions = [a or table.get(k) or self.construction(*k)
+                         for k, a in zip(keys, assigned)]
+        return dict(zip(identifiers, constructions))
+
+
+def resolve_constructions(model_dict, resolver=None):
+    """Get the construction of all Faces, Apertures and Doors of a Model dictionary.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema.
+        resolver: An optional ConstructionResolver to be used, which can be
+            reused across Models to reuse the table entries of any
+            ConstructionSets that are unchanged. The resolver is updated with
+            the ConstructionSets of the model_dict. If None, a new
+            ConstructionResolver will be used.
+
+    Returns:
+        A dictionary with an (obj_type, identifier) tuple of each Face, Aperture
+        and Door as keys and the identifier of its construction as values.
+    """
+    energy = (model_dict.get('properties') or {}).get('energy') or {}
+    if resolver is None:
+        resolver = ConstructionResolver(energy.get('construction_sets'),
+                                        energy.get('global_construction_set'))
+    else:
+        resolver.update(energy.get('construction_sets'),
+                        energy.get('global_construction_set'))
+    return resolver.resolve(model_dict)
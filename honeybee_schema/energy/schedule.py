@@ -1,11 +1,24 @@
 """Schedule Type Limit Schema"""
-from pydantic import Field, field_validator, model_validator
+from pydantic import Field, field_validator, field_serializer, model_validator, \
+    PrivateAttr, ValidationInfo, Discriminator, Tag
 from typing import List, Union, Literal, Annotated
 from enum import Enum
+from array import array
 import datetime
+import binascii
+import base64
+import sys
+import os
 
 from ._base import IDdEnergyBaseModel, DatedBaseModel, EnergyBaseModel
+from .._base import NoExtraBaseModel
 from ..altnumber import NoLimit
+from .values_file import ValuesFile, read_header
+
+# key of the serialization context that requests EncodedValues for schedule values
+ENCODE_VALUES = 'encode_values'
+# key of the validation context for the folder of the files of ExternalValues
+VALUES_FOLDER = 'values_folder'
 
 
 class ScheduleNumericType (str, Enum):
@@ -242,17 +255,190 @@ class ScheduleRuleset(ScheduleRulesetAbridged):
     )
 
 
+class ValueDataTypes(str, Enum):
+    """Binary data types of the numbers of EncodedValues."""
+    float32 = 'Float32'
+    float64 = 'Float64'
+
+
+_TYPECODES = {ValueDataTypes.float32: 'f', ValueDataTypes.float64: 'd'}
+
+
+class EncodedValues(NoExtraBaseModel):
+    """A list of numbers encoded as a base64 string of little-endian binary numbers."""
+
+    type: Literal['EncodedValues'] = 'EncodedValues'
+
+    data_type: ValueDataTypes = Field(
+        ValueDataTypes.float64,
+        description='Text for the binary data type of each number. Float32 takes '
+        'half of the space of Float64 but it only has about 7 significant digits.'
+    )
+
+    data: str = Field(
+        ...,
+        description='Base64 string of the numbers written one after the other as '
+        'little-endian binary numbers of the data_type.'
+    )
+
+    def decode(self):
+        """Get an array of the numbers of these EncodedValues."""
+        try:
+            buffer = base64.b64decode(self.data, validate=True)
+        except binascii.Error as e:
+            raise ValueError('EncodedValues data is not valid base64. {}'.format(e))
+        values = array(_TYPECODES[self.data_type])
+        if len(buffer) % values.itemsize != 0:
+            raise ValueError('EncodedValues data of {} bytes is not a whole number '
+                             'of {} values.'.format(len(buffer), self.data_type.value))
+        values.frombytes(buffer)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    @classmethod
+    def encode(cls, values, data_type=ValueDataTypes.float64):
+        """Create EncodedValues from a list of numbers.
+
+        Args:
+            values: A list or an array of numbers.
+            data_type: Text for the binary data type of each number (Float32
+                or Float64). (Default: Float64).
+        """
+        data_type = ValueDataTypes(data_type)
+        values = array(_TYPECODES[data_type], values)
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return cls(data_type=data_type,
+                   data=base64.b64encode(values.tobytes()).decode('ascii'))
+
+
+class ExternalValues(NoExtraBaseModel):
+    """A reference to a range of the values of an external .hbval file."""
+
+    type: Literal['ExternalValues'] = 'ExternalValues'
+
+    path: str = Field(
+        ...,
+        min_length=1,
+        description='Path to the .hbval file relative to the folder of the Model '
+        'JSON file, which must be inside of this folder and use / as the separator. '
+        'The .hbval file contains a header with the timestep and the number of '
+        'values followed by the values as little-endian float64 numbers.'
+    )
+
+    offset: int = Field(
+        0,
+        ge=0,
+        description='Index of the first value of the range in the .hbval file.'
+    )
+
+    length: int = Field(
+        ...,
+        ge=24,
+        le=527040,
+        description='Number of values in the range of the .hbval file.'
+    )
+
+    _file_path: Union[str, None] = PrivateAttr(None)
+
+    @field_validator('path')
+    @classmethod
+    def check_path(cls, v: str) -> str:
+        """Ensure the path is relative and does not leave the Model folder."""
+        parts = v.split('/')
+        assert not v.startswith('/') and '\\' not in v and ':' not in parts[0] \
+            and '..' not in parts, 'ExternalValues path "{}" must be a relative ' \
+            'path inside of the folder of the Model JSON file.'.format(v)
+        return v
+
+    def __len__(self):
+        return self.length
+
+    def file_path(self, folder=None):
+        """Get the path to the .hbval file.
+
+        Args:
+            folder: The folder of the Model JSON file. If None, the folder that
+                was used to validate the ExternalValues is used and an exception
+                is raised if the ExternalValues were validated without a folder.
+        """
+        if folder is None:
+            if self._file_path is None:
+                raise ValueError(
+                    'The folder of the Model JSON file is required to locate "{}". '
+                    'Validate the Model with context={{"{}": folder}} or pass the '
+                    'folder.'.format(self.path, VALUES_FOLDER))
+            return self._file_path
+        folder = os.path.realpath(folder)
+        file_path = os.path.realpath(os.path.join(folder, *self.path.split('/')))
+        if os.path.commonpath([folder, file_path]) != folder:
+            raise ValueError('The values file "{}" is not inside of the folder of the '
+                             'Model JSON file.'.format(self.path))
+        return file_path
+
+    def check_file(self, folder=None, timestep=None):
+        """Check the range and timestep of the values against the header of the file.
+
+        Only the header of the file is read such that the check does not depend
+        on the number of values.
+
+        Args:
+            folder: The folder of the Model JSON file.
+            timestep: An optional integer for the timestep of the schedule,
+                which must match the timestep of the file.
+        """
+        file_path = self.file_path(folder)
+        file_timestep, count = read_header(file_path)
+        if timestep is not None and file_timestep != timestep:
+            raise ValueError('The timestep of the schedule ({}) does not match the '
+                             'timestep of "{}" ({}).'.format(
+                                 timestep, self.path, file_timestep))
+        if self.offset + self.length > count:
+            raise ValueError('Values {} to {} are outside of the {} values of '
+                             '"{}".'.format(self.offset, self.offset + self.length,
+                                            count, self.path))
+        self._file_path = file_path
+
+    def load(self, folder=None):
+        """Get a memoryview of the values that shares the memory-mapped file.
+
+        Args:
+            folder: The folder of the Model JSON file. If None, the folder that
+                was used to validate the ExternalValues is used if it exists.
+        """
+        return ValuesFile.open(self.file_path(folder)).values(self.offset, self.length)
+
+
+def _values_tag(v):
+    """Get the tag of the values of a ScheduleFixedInterval for their Discriminator.
+
+    Lists of numbers are tagged List and dictionaries or objects are tagged
+    with their type such that invalid EncodedValues or ExternalValues are only
+    validated against their own schema.
+    """
+    if isinstance(v, dict):
+        return v.get('type')
+    return getattr(v, 'type', 'List')
+
+
 class ScheduleFixedIntervalAbridged(IDdEnergyBaseModel):
     """Used to specify a start date and a list of values for a period of analysis."""
 
     type: Literal['ScheduleFixedIntervalAbridged'] = 'ScheduleFixedIntervalAbridged'
 
-    values: List[float] = Field(
+    values: Union[
+        Annotated[List[float], Field(min_length=24, max_length=527040), Tag('List')],
+        Annotated[EncodedValues, Tag('EncodedValues')],
+        Annotated[ExternalValues, Tag('ExternalValues')]
+    ] = Field(
         ...,
-        min_length=24,
-        max_length=527040,
+        discriminator=Discriminator(_values_tag),
         description='A list of timeseries values occurring at each timestep over '
-        'the course of the simulation.'
+        'the course of the simulation. The values can also be EncodedValues, '
+        'which are decoded into an array of numbers upon validation, or '
+        'ExternalValues, which reference the values of a .hbval file that '
+        'is only read when the values are loaded.'
     )
 
     schedule_type_limit: Union[str, None] = Field(
@@ -319,6 +505,25 @@ class ScheduleFixedIntervalAbridged(IDdEnergyBaseModel):
         'immediately upon the beginning time corresponding to them.'
     )
 
+    @field_validator('values')
+    @classmethod
+    def decode_values(cls, v):
+        """Decode EncodedValues to an array of numbers."""
+        return v.decode() if isinstance(v, EncodedValues) else v
+
+    @field_serializer('values', mode='wrap')
+    def serialize_values(self, v, handler, info):
+        """Serialize the values to a list or to EncodedValues if requested.
+
+        EncodedValues are requested with the data type in the serialization
+        context (eg. model_dump_json(context={'encode_values': 'Float32'})).
+        """
+        context = info.context
+        data_type = context.get(ENCODE_VALUES) if isinstance(context, dict) else None
+        if data_type and not isinstance(v, ExternalValues):
+            return EncodedValues.encode(v, data_type).model_dump()
+        return handler(v.tolist() if isinstance(v, array) else v)
+
     @model_validator(mode='after')
     def check_number_of_values(self) -> 'ScheduleFixedIntervalAbridged':
         "Ensure an acceptable number of schedule values."
@@ -335,6 +540,23 @@ class ScheduleFixedIntervalAbridged(IDdEnergyBaseModel):
                 'Number of schedule values must be for a whole number of days.')
         return self
 
+    @model_validator(mode='after')
+    def check_external_values(
+            self, info: ValidationInfo) -> 'ScheduleFixedIntervalAbridged':
+        """Ensure ExternalValues match the header of their file.
+
+        The folder of the Model JSON file is taken from the validation context
+        (eg. model_validate(data, context={'values_folder': folder})). The file
+        is not checked when the context has no folder, in which case the folder
+        must be passed to load the values.
+        """
+        if isinstance(self.values, ExternalValues):
+            context = info.context
+            folder = context.get(VALUES_FOLDER) if isinstance(context, dict) else None
+            if folder is not None:
+                self.values.check_file(folder, self.timestep)
+        return self
+
 
 class ScheduleFixedInterval(ScheduleFixedIntervalAbridged):
     """Used to specify a start date and a list of values for a period of analysis."""
@@ -0,0 +1,200 @@
+"""Expansion of ScheduleRulesets into annual timeseries of values.
+
+The values of each ScheduleDay of a ScheduleRuleset are computed only once per
+timestep. An index of the ScheduleDay that applies to each day of the year is
+then built with one extended slice assignment per rule and day of the week
+(eg. every Monday from the start_date to the end_date), after which the annual
+values are assembled by copying the arrays of the ScheduleDays into a single
+array of floats. Annual values are kept in a least-recently-used cache that
+is keyed by the identifier of the schedule and a hash of its contents such
+that edited schedules are never served from the cache.
+"""
+import json
+import hashlib
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+
+from pydantic import BaseModel
+
+DAYS_OF_WEEK = ('Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday',
+                'Saturday')
+# maximum number of annual timeseries kept in the cache
+CACHE_SIZE = 128
+
+_APPLY_KEYS = tuple('apply_{}'.format(day.lower()) for day in DAYS_OF_WEEK)
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_CACHE = OrderedDict()
+
+
+def _get(obj, key, default=None):
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    value = getattr(obj, key, default)
+    return default if value is None else value
+
+
+def _day_of_year(date, leap_year):
+    """Get the 0-based day of the year for a [month, day] date.
+
+    The 29th of February is moved to the 28th when the year is not a leap year.
+    """
+    month, day = date[0], date[1]
+    if not leap_year and month == 2 and day == 29:
+        day = 28
+    doy = sum(_MONTH_DAYS[:month - 1]) + day - 1
+    return doy + 1 if leap_year and month > 2 else doy
+
+
+def day_values(schedule_day, timestep=1):
+    """Get the values of a ScheduleDay at each timestep of the day.
+
+    Args:
+        schedule_day: A ScheduleDay object or a dictionary of one.
+        timestep: An integer for the number of steps per hour, which must be
+            a divisor of 60. (Default: 1).
+
+    Returns:
+        An array of 24 * timestep floats for the values at the beginning of
+        each timestep. When the ScheduleDay is interpolated, the values are
+        linearly interpolated between the values of successive times and
+        the last value is held until the end of the day.
+    """
+    if timestep < 1 or 60 % timestep != 0:
+        raise ValueError('Schedule timestep must be a divisor of 60. '
+                         'Got {}.'.format(timestep))
+    values = _get(schedule_day, 'values')
+    times = [h * 60 + m for h, m in _get(schedule_day, 'times', [[0, 0]])]
+    interpolate = _get(schedule_day, 'interpolate', False)
+    step, last = 60 // timestep, len(times) - 1
+    result = array('d', bytes(8 * 24 * timestep))
+    for i in range(24 * timestep):
+        minute = i * step
+        j = max(bisect_right(times, minute) - 1, 0)
+        if interpolate and j < last and minute >= times[j]:
+            fraction = (minute - times[j]) / (times[j + 1] - times[j])
+            result[i] = values[j] + (values[j + 1] - values[j]) * fraction
+        else:
+            result[i] = values[j]
+    return result
+
+
+def _day_schedule_index(schedule, leap_year, start_day_of_week, holidays):
+    """Get an array with the index of the ScheduleDay used on each day of the year."""
+    try:
+        first_dow = DAYS_OF_WEEK.index(start_day_of_week)
+    except ValueError:
+        raise ValueError('Invalid start_day_of_week "{}". Choose from: {}.'.format(
+            start_day_of_week, ', '.join(DAYS_OF_WEEK)))
+    day_count = 366 if leap_year else 365
+    identifiers = [_get(day, 'identifier') for day in _get(schedule, 'day_schedules')]
+    ids = {identifier: i for i, identifier in enumerate(identifiers)}
+    try:
+        index = array('H', [ids[_get(schedule, 'default_day_schedule')]]) * day_count
+        # apply the rules from lowest to highest priority to let the first rule win
+        for rule in reversed(_get(schedule, 'schedule_rules') or ()):
+            start = _day_of_year(_get(rule, 'start_date', [1, 1]), leap_year)
+            end = _day_of_year(_get(rule, 'end_date', [12, 31]), leap_year)
+            periods = ((start, end + 1),) if start <= end else \
+                ((start, day_count), (0, end + 1))  # rules can wrap around the year
+            day_id = ids[_get(rule, 'schedule_day')]
+            for dow, key in enumerate(_APPLY_KEYS):
+                if not _get(rule, key, False):
+                    continue
+                for period_start, period_end in periods:
+                    first = period_start + (dow - first_dow - period_start) % 7
+                    count = len(range(first, period_end, 7))
+                    if count:
+                        index[first:period_end:7] = array('H', [day_id]) * count
+        holiday = ids[_get(schedule, 'holiday_schedule') or
+                      _get(schedule, 'default_day_schedule')]
+    except KeyError as e:
+        raise ValueError('ScheduleDay {} is not in the day_schedules of '
+                         'ScheduleRuleset "{}".'.format(e, _get(schedule, 'identifier')))
+    for date in holidays or ():
+        index[_day_of_year(date, leap_year)] = holiday
+    return index
+
+
+def _content_hash(schedule):
+    if isinstance(schedule, BaseModel):
+        schedule = schedule.model_dump(mode='json', exclude_none=True)
+    content = json.dumps(schedule, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def ruleset_values(schedule, timestep=1, leap_year=False, start_day_of_week='Sunday',
+                   holidays=None):
+    """Get the annual timeseries of values of a ScheduleRuleset.
+
+    Args:
+        schedule: A ScheduleRulesetAbridged or ScheduleRuleset object or a
+            dictionary of one.
+        timestep: An integer for the number of steps per hour, which must be
+            a divisor of 60. (Default: 1).
+        leap_year: Boolean to note whether the values are for a leap year
+            with 366 days. (Default: False).
+        start_day_of_week: Text for the day of the week on which the year
+            starts. (Default: Sunday).
+        holidays: An optional list of [month, day] dates on which the
+            holiday_schedule is used instead of the rules. The default_day_schedule
+            is used on holidays when the schedule has no holiday_schedule.
+
+    Returns:
+        An array of 8760 * timestep floats (or 8784 * timestep for a leap year)
+        for the values at each timestep of the year. The summer and winter
+        design day schedules are not used in the annual values.
+    """
+    holidays = tuple(tuple(date[:2]) for date in holidays or ())
+    key = (_get(schedule, 'identifier'), _content_hash(schedule), timestep,
+           bool(leap_year), start_day_of_week, holidays)
+    try:
+        _CACHE.move_to_end(key)
+        return array('d', _CACHE[key])
+    except KeyError:
+        pass
+
+    index = _day_schedule_index(
+        schedule, leap_year, start_day_of_week, holidays)
+    used = set(index)
+    days = [day_values(day, timestep) if i in used else None
+            for i, day in enumerate(_get(schedule, 'day_schedules'))]
+    values = array('d')
+    for i in index:
+        values.extend(days[i])
+
+    _CACHE[key] = values
+    if len(_CACHE) > CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return array('d', values)
+
+
+def design_day_values(schedule, design_day='summer', timestep=1):
+    """Get the values of the summer or winter design day of a ScheduleRuleset.
+
+    Args:
+        schedule: A ScheduleRulesetAbridged or ScheduleRuleset object or a
+            dictionary of one.
+        design_day: Text for the design day, which is either summer or winter.
+            The default_day_schedule is used when the schedule has no
+            ScheduleDay for the design day. (Default: summer).
+        timestep: An integer for the number of steps per hour. (Default: 1).
+
+    Returns:
+        An array of 24 * timestep floats for the values of the design day.
+    """
+    if design_day not in ('summer', 'winter'):
+        raise ValueError('Design day must be summer or winter. '
+                         'Got "{}".'.format(design_day))
+    identifier = _get(schedule, '{}_designday_schedule'.format(design_day)) or \
+        _get(schedule, 'default_day_schedule')
+    for day in _get(schedule, 'day_schedules'):
+        if _get(day, 'identifier') == identifier:
+            return day_values(day, timestep)
+    raise ValueError('ScheduleDay "{}" is not in the day_schedules of ScheduleRuleset '
+                     '"{}".'.format(identifier, _get(schedule, 'identifier')))
+
+
+def clear_cache():
+    """Remove all annual timeseries from the cache of ruleset_values."""
+    _CACHE.clear()
@@ -0,0 +1,223 @@
+"""Thermal properties of the opaque constructions of a Model.
+
+The R-value, heat capacity and emissivity of each material layer are computed
+once and memoized by the identifier of the material until the content of the
+material changes, which is tracked with a hash of its content. The properties
+of each construction are then sums over its memoized layers, which makes the
+cost of evaluating thousands of constructions proportional to the number of
+layers rather than to the number of material evaluations.
+
+The U-factor of a construction includes the resistances of the air films on
+both sides of the construction using the simple film coefficients of EN 673,
+where the interior film coefficient depends on the emissivity of the interior
+layer and the exterior film coefficient is constant.
+"""
+import json
+import hashlib
+
+from pydantic import BaseModel
+
+# exterior film coefficient of EN 673 [W/m2-K]
+EXTERIOR_FILM_COEFFICIENT = 23.0
+# default thermal_absorptance (emissivity) of opaque materials
+DEFAULT_EMISSIVITY = 0.9
+
+_OPAQUE_CONSTRUCTION_TYPES = ('OpaqueConstructionAbridged', 'OpaqueConstruction')
+# default values of the properties of EnergyMaterialVegetation
+_VEGETATION_DEFAULTS = {
+    'thickness': 0.1, 'conductivity': 0.35, 'density': 1100, 'specific_heat': 1200
+}
+
+
+def _get(obj, key, default=None):
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    value = getattr(obj, key, default)
+    return default if value is None else value
+
+
+def _content_hash(obj):
+    if isinstance(obj, BaseModel):
+        obj = obj.model_dump(mode='json', exclude_none=True)
+    content = json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def _type(obj):
+    obj_type = _get(obj, 'type')
+    return getattr(obj_type, 'value', obj_type)
+
+
+def interior_film_coefficient(emissivity=DEFAULT_EMISSIVITY):
+    """Get the interior film coefficient of EN 673 for the emissivity of a surface.
+
+    Args:
+        emissivity: The emissivity of the interior surface. (Default: 0.9).
+
+    Returns:
+        The film coefficient in W/m2-K.
+    """
+    return 3.6 + 4.4 * emissivity / 0.84
+
+
+def material_properties(material):
+    """Get the thermal properties of an opaque material.
+
+    Args:
+        material: An EnergyMaterial, EnergyMaterialNoMass or
+            EnergyMaterialVegetation object or a dictionary of one.
+
+    Returns:
+        A tuple with the R-value of the layer [m2-K/W], its heat capacity
+        per unit area [J/m2-K] and the emissivity of its surface.
+    """
+    mat_type = _type(material)
+    if mat_type == 'EnergyMaterialNoMass':
+        return _get(material, 'r_value'), 0.0, \
+            _get(material, 'thermal_absorptance', DEFAULT_EMISSIVITY)
+    if mat_type == 'EnergyMaterial':
+        thickness = _get(material, 'thickness')
+        return thickness / _get(material, 'conductivity'), \
+            thickness * _get(material, 'density') * _get(material, 'specific_heat'), \
+            _get(material, 'thermal_absorptance', DEFAULT_EMISSIVITY)
+    if mat_type == 'EnergyMaterialVegetation':
+        values = {key: _get(material, key, default)
+                  for key, default in _VEGETATION_DEFAULTS.items()}
+        return values['thickness'] / values['conductivity'], \
+            values['thickness'] * values['density'] * values['specific_heat'], \
+            _get(material, 'soil_thermal_absorptance', DEFAULT_EMISSIVITY)
+    raise ValueError('Material "{}" of type {} is not an opaque material.'.format(
+        _get(material, 'identifier'), mat_type))
+
+
+class ThermalCalculator:
+    """Calculator of the thermal properties of opaque constructions.
+
+    The properties of each material are computed the first time that the
+    material is used and they are reused for all other constructions until
+    the content of the material changes in the update method.
+
+    Args:
+        materials: A list of material objects or dictionaries that are
+            referenced by the abridged constructions (eg. the materials of
+            ModelEnergyProperties).
+        exterior_film: The exterior film coefficient in W/m2-K. (Default: 23).
+        interior_film: An optional interior film coefficient in W/m2-K. If None,
+            the coefficient of EN 673 for the emissivity of the interior layer
+            of each construction is used.
+    """
+    __slots__ = ('exterior_film', 'interior_film', '_materials', '_hashes', '_memo')
+
+    def __init__(self, materials=None, exterior_film=EXTERIOR_FILM_COEFFICIENT,
+                 interior_film=None):
+        self.exterior_film = exterior_film
+        self.interior_film = interior_film
+        self._materials, self._hashes, self._memo = {}, {}, {}
+        self.update(materials)
+
+    def update(self, materials=None):
+        """Update the materials, dropping the memoized properties of changed materials.
+
+        Args:
+            materials: A list of material objects or dictionaries that replaces
+                all of the materials of the calculator (eg. the materials of the
+                ModelEnergyProperties of the next Model).
+
+        Returns:
+            A list of the identifiers of the materials whose memoized properties
+            were dropped.
+        """
+        materials = {_get(mat, 'identifier'): mat for mat in materials or ()}
+        hashes = {identifier: _content_hash(mat) for identifier, mat in materials.items()}
+        changed = [identifier for identifier in self._memo
+                   if hashes.get(identifier) != self._hashes.get(identifier)]
+        for identifier in changed:
+            del self._memo[identifier]
+        self._materials, self._hashes = materials, hashes
+        return changed
+
+    def material(self, material):
+        """Get the memoized thermal properties of a material.
+
+        Args:
+            material: The identifier of a material of this calculator or a
+                material object or dictionary. The properties of material
+                objects are only memoized when they are one of the materials
+                of this calculator since other objects can share the
+                identifier of a material with a different content.
+
+        Returns:
+            A tuple as returned by the material_properties function.
+        """
+        if isinstance(material, str):
+            identifier = material
+        else:
+            identifier = _get(material, 'identifier')
+            if self._materials.get(identifier) is not material:
+                return material_properties(material)
+        try:
+            return self._memo[identifier]
+        except KeyError:
+            pass
+        try:
+            material = self._materials[identifier]
+        except KeyError:
+            raise ValueError('Material "{}" was not found.'.format(identifier))
+        properties = self._memo[identifier] = material_properties(material)
+        return properties
+
+    def construction(self, construction):
+        """Get the thermal properties of an opaque construction.
+
+        Args:
+            construction: An OpaqueConstructionAbridged or OpaqueConstruction
+                object or a dictionary of one.
+
+        Returns:
+            A dictionary with the r_value [m2-K/W] and u_value [W/m2-K] of the
+            layers of the construction, the u_factor [W/m2-K] of the
+            construction including the air films and its heat_capacity
+            per unit area [J/m2-K].
+        """
+        r_value = heat_capacity = 0.0
+        emissivity = DEFAULT_EMISSIVITY
+        for material in _get(construction, 'materials'):
+            layer_r, layer_capacity, emissivity = self.material(material)
+            r_value += layer_r
+            heat_capacity += layer_capacity
+        interior_film = self.interior_film or interior_film_coefficient(emissivity)
+        total_r = r_value + 1 / self.exterior_film + 1 / interior_film
+        return {
+            'r_value': r_value,
+            'u_value': 1 / r_value,
+            'u_factor': 1 / total_r,
+            'heat_capacity': heat_capacity
+        }
+
+
+def opaque_construction_properties(energy_properties, calculator=None):
+    """Get the thermal properties of all opaque constructions of a Model.
+
+    Args:
+        energy_properties: A ModelEnergyProperties object or a dictionary of one.
+        calculator: An optional ThermalCalculator to be used, which can be
+            reused across Models to reuse the properties of their unchanged
+            materials. The calculator is updated with the materials of the
+            energy_properties. If None, a new ThermalCalculator will be used.
+
+    Returns:
+        A dictionary with the identifier of each opaque construction as keys
+        and a dictionary of the thermal properties of the construction as
+        values, as returned by ThermalCalculator.construction.
+    """
+    if isinstance(energy_properties, BaseModel):
+        energy_properties = energy_properties.__dict__
+    if calculator is None:
+        calculator = ThermalCalculator(energy_properties.get('materials'))
+    else:
+        calculator.update(energy_properties.get('materials'))
+    return {
+        _get(construction, 'identifier'): calculator.construction(construction)
+        for construction in energy_properties.get('constructions') or ()
+        if _type(construction) in _OPAQUE_CONSTRUCTION_TYPES
+    }
@@ -0,0 +1,261 @@
+"""Binary files (.hbval) for the values of ScheduleFixedIntervals.
+
+The values of many ScheduleFixedIntervals can be written one after the other
+into a single .hbval file next to the Model JSON file, which then references
+them with ExternalValues of the form {"type": "ExternalValues", "path":
+"model.hbval", "offset": 0, "length": 35040}.
+
+The .hbval file is made of a 24-byte header (the bytes b'HBVAL\\x00', a uint16
+format version, a uint16 timestep of all values, 6 bytes of padding and a
+uint64 count of values) followed by the little-endian float64 values. So the
+length and timestep of the values can be validated by reading the header only.
+The files are memory-mapped when the values are accessed and all schedules
+that reference the same file share a single mapping, the pages of which are
+shared by the operating system across all processes that read the file.
+"""
+import os
+import sys
+import json
+import mmap
+import struct
+import tempfile
+from array import array
+
+MAGIC = b'HBVAL\x00'
+VERSION = 1
+EXTENSION = '.hbval'
+
+_HEADER = struct.Struct('<6sHH6xQ')
+_FIXED_INTERVAL_TYPES = ('ScheduleFixedIntervalAbridged', 'ScheduleFixedInterval')
+_OPEN_FILES = {}
+
+
+def _signature(stat):
+    """Get a tuple that changes whenever a file is rewritten from its stat result."""
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def values_file_path(hbjson_path):
+    """Get the default path of the .hbval file that accompanies a Model JSON file."""
+    return os.path.splitext(hbjson_path)[0] + EXTENSION
+
+
+def read_header(file_path):
+    """Read the header of a .hbval file without reading any of its values.
+
+    Args:
+        file_path: Path to a .hbval file.
+
+    Returns:
+        A tuple with the timestep of the values and the number of values.
+    """
+    try:
+        with open(file_path, 'rb') as values_file:
+            header = values_file.read(_HEADER.size)
+            size = os.fstat(values_file.fileno()).st_size
+    except OSError:
+        raise ValueError('The values file "{}" could not be found.'.format(file_path))
+    if len(header) < _HEADER.size:
+        raise ValueError('"{}" is not a valid .hbval file.'.format(file_path))
+    magic, version, timestep, count = _HEADER.unpack(header)
+    if magic != MAGIC:
+        raise ValueError('"{}" is not a valid .hbval file.'.format(file_path))
+    if version != VERSION:
+        raise ValueError('Unsupported .hbval format version {} in "{}".'.format(
+            version, file_path))
+    if size != _HEADER.size + 8 * count:
+        raise ValueError('The size of "{}" does not match the count of values in '
+                         'its header.'.format(file_path))
+    return timestep, count
+
+
+def write_values_file(file_path, value_lists, timestep=1):
+    """Write lists of values with the same timestep to a .hbval file.
+
+    Args:
+        file_path: Path to the .hbval file to be written.
+        value_lists: A list of lists or arrays of numbers.
+        timestep: An integer for the number of values per hour of all of the
+            lists of values. (Default: 1).
+
+    Returns:
+        A list with an (offset, length) tuple for each list of values, where
+        the offset is the index of the first value in the file.
+    """
+    values, positions = array('d'), []
+    for value_list in value_lists:
+        positions.append((len(values), len(value_list)))
+        values.extend(value_list)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    file_path = os.path.abspath(file_path)
+    if file_path in _OPEN_FILES:  # drop the mapping of the file being replaced
+        _OPEN_FILES[file_path].close()
+    # write a new file such that any memoryviews of the old one remain valid
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as values_file:
+            values_file.write(_HEADER.pack(MAGIC, VERSION, timestep, len(values)))
+            values.tofile(values_file)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return positions
+
+
+class ValuesFile:
+    """A memory-mapped .hbval file with zero-copy access to its values.
+
+    Instances should be obtained with ValuesFile.open such that all schedules
+    that reference the same file share one mapping. The mapping is replaced
+    with a new one when the file has been rewritten since it was mapped.
+
+    Args:
+        file_path: Path to a .hbval file.
+    """
+    __slots__ = ('file_path', 'timestep', '_signature', '_file', '_mmap', '_values')
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.timestep, count = read_header(file_path)
+        self._file = open(file_path, 'rb')
+        self._signature = _signature(os.fstat(self._file.fileno()))
+        if count == 0:  # an empty buffer cannot be mapped
+            self._mmap, self._values = None, memoryview(array('d'))
+        else:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if sys.byteorder == 'big':  # the buffer must be copied to swap the bytes
+                values = array('d')
+                values.frombytes(self._mmap[_HEADER.size:])
+                values.byteswap()
+                self._values = memoryview(values)
+            else:
+                self._values = memoryview(self._mmap)[_HEADER.size:].cast('d')
+
+    @classmethod
+    def open(cls, file_path):
+        """Get the shared ValuesFile of a file path, mapping the file if necessary.
+
+        The file is stat-ed on every call and it is mapped again (with its
+        header read again) when its inode, size or modification time changed.
+        """
+        file_path = os.path.abspath(file_path)
+        values_file = _OPEN_FILES.get(file_path)
+        if values_file is not None:
+            try:
+                if _signature(os.stat(file_path)) == values_file._signature:
+                    return values_file
+            except OSError:
+                pass
+            values_file.close()  # the file was rewritten or deleted
+        values_file = _OPEN_FILES[file_path] = cls(file_path)
+        return values_file
+
+    def __len__(self):
+        return len(self._values)
+
+    def values(self, offset, length):
+        """Get a zero-copy memoryview of a range of the float64 values of the file."""
+        if offset + length > len(self._values):
+            raise ValueError('Values {} to {} are outside of the {} values of '
+                             '"{}".'.format(offset, offset + length,
+                                            len(self._values), self.file_path))
+        return self._values[offset:offset + length]
+
+    def close(self):
+        """Close the file once no memoryviews of its values are in use."""
+        if _OPEN_FILES.get(self.file_path) is self:
+            del _OPEN_FILES[self.file_path]
+        self._values.release()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:  # views of the buffer are still in use
+                pass
+        self._file.close()
+
+    def __repr__(self):
+        return 'ValuesFile: {} ({} values)'.format(self.file_path, len(self))
+
+
+def close_values_files():
+    """Close all .hbval files that have been opened with ValuesFile.open."""
+    for values_file in list(_OPEN_FILES.values()):
+        values_file.close()
+
+
+def _decode(values):
+    """Get the list of numbers of a list or of a dictionary of EncodedValues."""
+    if not isinstance(values, dict):
+        return values
+    from .schedule import EncodedValues  # the schedule module imports this module
+    return EncodedValues.model_validate(values).decode()
+
+
+def write_external_values(model_dict, hbjson_path, values_path=None, timestep=None):
+    """Move the values of the ScheduleFixedIntervals of a Model to a .hbval file.
+
+    The values of each ScheduleFixedInterval of the Model dictionary with
+    the timestep are replaced with ExternalValues that reference the .hbval
+    file by its path relative to the folder of the Model JSON file.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema,
+            which will be edited in place.
+        hbjson_path: Path to the Model JSON file to which the Model dictionary
+            will be written.
+        values_path: Path to the .hbval file to be written, which must be inside
+            of the folder of the Model JSON file. If None, it will be next to
+            the Model JSON file with the same name and a .hbval extension.
+        timestep: An integer for the timestep of the schedules to be moved to
+            the file. Schedules with other timesteps keep their values. If None,
+            the timestep of the first ScheduleFixedInterval is used.
+
+    Returns:
+        The number of schedules with values in the .hbval file.
+    """
+    energy = (model_dict.get('properties') or {}).get('energy') or {}
+    schedules = [schedule for schedule in energy.get('schedules') or ()
+                 if schedule.get('type') in _FIXED_INTERVAL_TYPES and
+                 not (isinstance(schedule['values'], dict) and
+                      schedule['values'].get('type') == 'ExternalValues')]
+    if timestep is None and schedules:
+        timestep = schedules[0].get('timestep', 1)
+    schedules = [s for s in schedules if s.get('timestep', 1) == timestep]
+    if not schedules:
+        return 0
+    values_path = values_path or values_file_path(hbjson_path)
+    relative_path = os.path.relpath(
+        os.path.abspath(values_path), os.path.dirname(os.path.abspath(hbjson_path)))
+    if relative_path.split(os.sep)[0] == os.pardir or os.path.isabs(relative_path):
+        raise ValueError('The values file "{}" must be inside of the folder of the '
+                         'Model JSON file.'.format(values_path))
+    relative_path = relative_path.replace(os.sep, '/')
+    positions = write_values_file(
+        values_path, [_decode(s['values']) for s in schedules], timestep)
+    for schedule, (offset, length) in zip(schedules, positions):
+        schedule['values'] = {'type': 'ExternalValues', 'path': relative_path,
+                              'offset': offset, 'length': length}
+    return len(schedules)
+
+
+def model_to_external_values(model_json, hbjson_path, values_path=None):
+    """Write a copy of a Model JSON file with its schedule values in a .hbval file.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        hbjson_path: Path to the Model JSON file to be written.
+        values_path: Path to the .hbval file to be written. If None, it will be
+            next to the new Model JSON file with the same name and a .hbval
+            extension.
+
+    Returns:
+        The number of schedules with values in the .hbval file.
+    """
+    with open(model_json, 'rb') as json_file:
+        model_dict = json.load(json_file)
+    count = write_external_values(model_dict, hbjson_path, values_path)
+    with open(hbjson_path, 'w', encoding='utf-8') as json_file:
+        json.dump(model_dict, json_file)
+    return count
@@ -0,0 +1,417 @@
+"""Center-of-glass U-factor, SHGC and VT of the window constructions of a Model.
+
+The U-factor is found by iterating over the thermal network of the glass and
+gas layers at the winter conditions of NFRC 100 (-18C outside and 21C inside)
+with the film coefficients of EN 673 (as used for opaque constructions). The
+conductance of each gap is the sum of the convective conductance of ISO 15099
+for a vertical cavity and the radiative conductance between its two glass
+surfaces. The coefficients of the properties of each gas layer are resolved
+once per construction (a gas mixture is reduced to a single set of
+coefficients weighted by the gas fractions) and the properties of each gas are
+cached by these coefficients and the temperature such that windows with the
+same gases reuse the evaluations.
+
+The solar and visible transmittance and reflectance of the layers are
+combined with the interreflections between all layers to get the VT and the
+solar energy absorbed by each layer. The SHGC is the solar transmittance plus
+the fraction of the absorbed energy that flows inward, which is found from the
+resistances of the thermal network of the U-factor calculation.
+
+When an EnergyWindowFrame is assigned to a construction, the U-factor, SHGC
+and VT of a whole window of a given size are also computed from the areas of
+the center of glass, the 63.5 mm edge of glass and the frame.
+"""
+from pydantic import BaseModel
+
+from .thermal import EXTERIOR_FILM_COEFFICIENT, interior_film_coefficient, _get, _type
+
+# (a, b, c) coefficients of the conductivity [W/m-K], viscosity [kg/m-s] and
+# specific heat [J/kg-K] of each gas along with its molecular weight from ISO 15099
+GAS_COEFFICIENTS = {
+    'Air': ((2.873e-3, 7.760e-5, 0), (3.723e-6, 4.940e-8, 0),
+            (1002.737, 1.2324e-2, 0), 28.97),
+    'Argon': ((2.285e-3, 5.149e-5, 0), (3.379e-6, 6.451e-8, 0),
+              (521.929, 0, 0), 39.948),
+    'Krypton': ((9.443e-4, 2.826e-5, 0), (2.213e-6, 7.777e-8, 0),
+                (248.091, 0, 0), 83.8),
+    'Xenon': ((4.538e-4, 1.723e-5, 0), (1.069e-6, 7.414e-8, 0),
+              (158.34, 0, 0), 131.3)
+}
+# outside and inside air temperatures of the U-factor calculation [K]
+OUTSIDE_TEMPERATURE = 255.15
+INSIDE_TEMPERATURE = 294.15
+# default width and height of the glazed area of a window with a frame [m]
+WINDOW_SIZE = (1.2, 1.5)
+# width of the edge of glass region of a window with a frame [m]
+EDGE_OF_GLASS = 0.0635
+
+_WINDOW_CONSTRUCTION_TYPES = ('WindowConstructionAbridged', 'WindowConstruction')
+_GAS_TYPES = ('EnergyWindowMaterialGas', 'EnergyWindowMaterialGasMixture',
+              'EnergyWindowMaterialGasCustom')
+_GLAZING_DEFAULTS = {
+    'thickness': 0.003, 'conductivity': 0.9, 'solar_transmittance': 0.85,
+    'solar_reflectance': 0.075, 'visible_transmittance': 0.9,
+    'visible_reflectance': 0.075, 'emissivity': 0.84, 'emissivity_back': 0.84,
+    'dirt_correction': 1
+}
+_FRAME_DEFAULTS = {
+    'edge_to_center_ratio': 1, 'thermal_absorptance': 0.9, 'solar_absorptance': 0.7
+}
+_STEFAN_BOLTZMANN = 5.6697e-8
+_GAS_CONSTANT = 8314.462618  # J/kmol-K
+_PRESSURE = 101325
+_GRAVITY = 9.81
+_MAX_ITERATIONS = 100
+
+
+def _values(obj, defaults):
+    return {key: _get(obj, key, default) for key, default in defaults.items()}
+
+
+def _back(obj, key, front):
+    """Get a back reflectance, which may be Autocalculate to match the front."""
+    value = _get(obj, key)
+    return value if isinstance(value, (int, float)) else front
+
+
+def gas_coefficients(gas):
+    """Get the coefficients of the properties of a gas layer.
+
+    Args:
+        gas: An EnergyWindowMaterialGas, EnergyWindowMaterialGasMixture or
+            EnergyWindowMaterialGasCustom object or a dictionary of one.
+
+    Returns:
+        A tuple with the (a, b, c) coefficients of the conductivity, viscosity
+        and specific heat of the gas followed by its molecular weight. The
+        coefficients of a gas mixture are the averages of the coefficients of
+        its gases weighted by their fractions, where the specific heat is
+        weighted by mass.
+    """
+    gas_type = _type(gas)
+    if gas_type == 'EnergyWindowMaterialGas':
+        name = _get(gas, 'gas_type', 'Air')
+        return GAS_COEFFICIENTS[getattr(name, 'value', name)]
+    if gas_type == 'EnergyWindowMaterialGasCustom':
+        return tuple(
+            tuple(_get(gas, '{}_coeff_{}'.format(prop, c), 0) for c in 'abc')
+            for prop in ('conductivity', 'viscosity', 'specific_heat')
+        ) + (_get(gas, 'molecular_weight'),)
+    gases = [GAS_COEFFICIENTS[getattr(name, 'value', name)]
+             for name in _get(gas, 'gas_types')]
+    fractions = _get(gas, 'gas_fractions')
+    weight = sum(f * g[3] for f, g in zip(fractions, gases))
+    conductivity, viscosity = (
+        tuple(sum(f * g[i][j] for f, g in zip(fractions, gases)) for j in range(3))
+        for i in (0, 1))
+    specific_heat = tuple(sum(f * g[3] * g[2][j] for f, g in zip(fractions, gases)) /
+                          weight for j in range(3))
+    return conductivity, viscosity, specific_heat, weight
+
+
+def _polynomial(coefficients, temperature):
+    a, b, c = coefficients
+    return a + b * temperature + c * temperature * temperature
+
+
+def _nusselt(rayleigh, aspect_ratio):
+    """Get the Nusselt number of a vertical cavity of ISO 15099."""
+    if rayleigh > 5e4:
+        nu_1 = 0.0673838 * rayleigh ** (1 / 3)
+    elif rayleigh > 1e4:
+        nu_1 = 0.028154 * rayleigh ** 0.4134
+    else:
+        nu_1 = 1 + 1.7596678e-10 * rayleigh ** 2.2984755
+    nu_2 = 0.242 * (rayleigh / aspect_ratio) ** 0.272
+    return max(nu_1, nu_2)
+
+
+def _stack(front, back):
+    """Get the (transmittance, front reflectance, back reflectance) of two layers."""
+    t_1, rf_1, rb_1 = front
+    t_2, rf_2, rb_2 = back
+    denominator = 1 - rb_1 * rf_2
+    return t_1 * t_2 / denominator, rf_1 + t_1 * t_1 * rf_2 / denominator, \
+        rb_2 + t_2 * t_2 * rb_1 / denominator
+
+
+def _combine(layers):
+    """Combine the (transmittance, front reflectance, back reflectance) of layers.
+
+    Returns:
+        A list with the combined properties of the layers from the first layer
+        to each layer (forward) and a list with the combined properties of the
+        layers from each layer to the last layer (backward).
+    """
+    forward = [layers[0]]
+    for layer in layers[1:]:
+        forward.append(_stack(forward[-1], layer))
+    backward = [layers[-1]]
+    for layer in reversed(layers[:-1]):
+        backward.insert(0, _stack(layer, backward[0]))
+    return forward, backward
+
+
+def optical_properties(layers):
+    """Get the transmittance and the absorptance of each layer of a stack of layers.
+
+    Args:
+        layers: A list of (transmittance, front reflectance, back reflectance)
+            tuples for each layer from the exterior to the interior.
+
+    Returns:
+        A tuple with the transmittance of all layers, their front reflectance and
+        a list with the fraction of the incident radiation absorbed by each layer.
+    """
+    forward, backward = _combine(layers)
+    absorbed = []
+    incoming = 1.0  # radiation incident on the front of the layer
+    for i, (t, rf, rb) in enumerate(layers):
+        if i + 1 < len(layers):
+            t_front, _, rb_front = forward[i]
+            outgoing = t_front / (1 - rb_front * backward[i + 1][1]) * backward[i + 1][1]
+        else:
+            outgoing = 0.0  # radiation incident on the back of the layer
+        absorbed.append(incoming * (1 - t - rf) + outgoing * (1 - t - rb))
+        if i + 1 < len(layers):
+            incoming = forward[i][0] / (1 - forward[i][2] * backward[i + 1][1])
+    return forward[-1][0], forward[-1][1], absorbed
+
+
+class WindowCalculator:
+    """Calculator of the U-factor, SHGC and VT of window constructions.
+
+    The properties of each gas at each temperature are cached by the
+    coefficients of the gas and reused for all other constructions, including
+    those of other Models.
+
+    Args:
+        materials: A list of material objects or dictionaries that are
+            referenced by the abridged constructions (eg. the materials of
+            ModelEnergyProperties).
+        window_size: A tuple with the width and height of the glazed area of
+            a window in meters, which is used for the properties of whole
+            windows with frames and for the aspect ratio of the gaps.
+            (Default: (1.2, 1.5)).
+    """
+    __slots__ = ('window_size', '_materials', '_gas_properties')
+
+    def __init__(self, materials=None, window_size=WINDOW_SIZE):
+        self.window_size = window_size
+        self._materials = {}
+        self._gas_properties = {}
+        self.update(materials)
+
+    def update(self, materials=None):
+        """Replace the materials that are referenced by the abridged constructions.
+
+        Args:
+            materials: A list of material objects or dictionaries (eg. the
+                materials of the ModelEnergyProperties of the next Model).
+        """
+        self._materials = {_get(mat, 'identifier'): mat for mat in materials or ()}
+
+    def _material(self, material):
+        if not isinstance(material, str):
+            return material
+        try:
+            return self._materials[material]
+        except KeyError:
+            raise ValueError('Material "{}" was not found.'.format(material))
+
+    def gas_properties(self, coefficients, temperature):
+        """Get the cached properties of a gas at a temperature.
+
+        Args:
+            coefficients: A tuple of the coefficients of the gas as returned by
+                the gas_coefficients function, which is the key of the cache
+                such that gases with the same content share their properties.
+            temperature: The temperature of the gas in Kelvin, which is rounded
+                to 0.1 K for the cache.
+
+        Returns:
+            A tuple with the conductivity [W/m-K], viscosity [kg/m-s], specific
+            heat [J/kg-K] and density [kg/m3] of the gas.
+        """
+        temperature = round(temperature, 1)
+        try:
+            return self._gas_properties[(coefficients, temperature)]
+        except KeyError:
+            pass
+        conductivity, viscosity, specific_heat, weight = coefficients
+        properties = self._gas_properties[(coefficients, temperature)] = (
+            _polynomial(conductivity, temperature), _polynomial(viscosity, temperature),
+            _polynomial(specific_heat, temperature),
+            _PRESSURE * weight / (_GAS_CONSTANT * temperature))
+        return properties
+
+    def _gap_conductance(self, coefficients, thickness, t_1, t_2, e_1, e_2):
+        """Get the convective and radiative conductance of a gap [W/m2-K]."""
+        t_mean, delta_t = (t_1 + t_2) / 2, max(abs(t_1 - t_2), 1e-6)
+        conductivity, viscosity, specific_heat, density = \
+            self.gas_properties(coefficients, t_mean)
+        rayleigh = density * density * thickness ** 3 * _GRAVITY * specific_heat * \
+            delta_t / (t_mean * viscosity * conductivity)
+        convective = _nusselt(rayleigh, self.window_size[1] / thickness) * \
+            conductivity / thickness
+        radiative = 4 * _STEFAN_BOLTZMANN * t_mean ** 3 / \
+            (1 / max(e_1, 1e-6) + 1 / max(e_2, 1e-6) - 1)
+        return convective + radiative
+
+    def _layers(self, construction):
+        """Get the glazing and gas layers of a construction.
+
+        Returns:
+            A list of dictionaries of the values of the glazing layers and a
+            list of (coefficients, thickness) tuples for the gas layers.
+        """
+        glazings, gaps = [], []
+        for i, material in enumerate(_get(construction, 'materials')):
+            material = self._material(material)
+            mat_type = _type(material)
+            if (i % 2 == 0) != (mat_type == 'EnergyWindowMaterialGlazing') or \
+                    (i % 2 == 1 and mat_type not in _GAS_TYPES):
+                raise ValueError(
+                    'Window construction "{}" must alternate between glazing and gas '
+                    'layers starting with glazing. Got {}.'.format(
+                        _get(construction, 'identifier'), mat_type))
+            if i % 2 == 0:
+                values = _values(material, _GLAZING_DEFAULTS)
+                for key in ('solar', 'visible'):
+                    values['{}_reflectance_back'.format(key)] = _back(
+                        material, '{}_reflectance_back'.format(key),
+                        values['{}_reflectance'.format(key)])
+                glazings.append(values)
+            else:
+                gaps.append((gas_coefficients(material),
+                             _get(material, 'thickness', 0.0125)))
+        if len(glazings) != len(gaps) + 1:
+            raise ValueError('Window construction "{}" must end with a glazing '
+                             'layer.'.format(_get(construction, 'identifier')))
+        return glazings, gaps
+
+    def _center_of_glass(self, construction):
+        """Get the U-factor, SHGC, VT and interior film of the center of glass."""
+        materials = [self._material(m) for m in _get(construction, 'materials')]
+        if len(materials) == 1 and _type(materials[0]) == \
+                'EnergyWindowMaterialSimpleGlazSys':
+            material = materials[0]
+            return _get(material, 'u_factor'), _get(material, 'shgc'), \
+                _get(material, 'vt', 0.54), interior_film_coefficient()
+        glazings, gaps = self._layers(construction)
+        h_out = EXTERIOR_FILM_COEFFICIENT
+        h_in = interior_film_coefficient(glazings[-1]['emissivity_back'])
+        glass_r = [g['thickness'] / g['conductivity'] for g in glazings]
+        total_glass_r = sum(glass_r)
+
+        # iterate over the thermal network until the U-factor converges
+        gap_h = [3.0] * len(gaps)
+        u_factor, temperatures = 0, []
+        for _ in range(_MAX_ITERATIONS):
+            total_r = 1 / h_out + total_glass_r + sum(1 / h for h in gap_h) + 1 / h_in
+            new_u = 1 / total_r
+            flux = (INSIDE_TEMPERATURE - OUTSIDE_TEMPERATURE) * new_u
+            temperature = OUTSIDE_TEMPERATURE + flux / h_out
+            temperatures = []  # the temperatures of both sides of each glass layer
+            for i, r_value in enumerate(glass_r):
+                temperatures.append((temperature, temperature + flux * r_value))
+                temperature += flux * r_value
+                if i < len(gaps):
+                    temperature += flux / gap_h[i]
+            gap_h = [
+                self._gap_conductance(
+                    gas, thickness, temperatures[i][1], temperatures[i + 1][0],
+                    glazings[i]['emissivity_back'], glazings[i + 1]['emissivity'])
+                for i, (gas, thickness) in enumerate(gaps)]
+            if abs(new_u - u_factor) < 1e-6:
+                break
+            u_factor = new_u
+
+        # get the fraction of the energy absorbed by each layer that flows inward
+        solar = [(g['solar_transmittance'] * g['dirt_correction'],
+                  g['solar_reflectance'], g['solar_reflectance_back'])
+                 for g in glazings]
+        solar_t, _, absorbed = optical_properties(solar)
+        shgc, outside_r = solar_t, 1 / h_out
+        for i, r_value in enumerate(glass_r):
+            shgc += absorbed[i] * (outside_r + r_value / 2) / total_r
+            outside_r += r_value + (1 / gap_h[i] if i < len(gaps) else 0)
+        visible = [(g['visible_transmittance'] * g['dirt_correction'],
+                    g['visible_reflectance'], g['visible_reflectance_back'])
+                   for g in glazings]
+        vt = optical_properties(visible)[0]
+        return new_u, shgc, vt, h_in
+
+    def construction(self, construction):
+        """Get the thermal and optical properties of a window construction.
+
+        Args:
+            construction: A WindowConstructionAbridged or WindowConstruction
+                object or a dictionary of one.
+
+        Returns:
+            A dictionary with the center-of-glass u_factor [W/m2-K], shgc and vt
+            of the construction followed by the window_u_factor, window_shgc
+            and window_vt of a whole window, which include the edge of glass
+            and the frame when the construction has a frame. The properties of
+            the whole window are equal to those of the center of glass when
+            the construction has no frame. The outside_projection and
+            inside_projection of frames are not accounted for.
+        """
+        u_factor, shgc, vt, h_in = self._center_of_glass(construction)
+        result = {'u_factor': u_factor, 'shgc': shgc, 'vt': vt,
+                  'window_u_factor': u_factor, 'window_shgc': shgc, 'window_vt': vt}
+        frame = _get(construction, 'frame')
+        if frame is None:
+            return result
+        frame = self._material(frame)
+        values = _values(frame, _FRAME_DEFAULTS)
+        h_out, frame_width = EXTERIOR_FILM_COEFFICIENT, _get(frame, 'width')
+        width, height = self.window_size
+        glass_area = width * height
+        frame_area = (width + 2 * frame_width) * (height + 2 * frame_width) - glass_area
+        center_area = max(width - 2 * EDGE_OF_GLASS, 0) * \
+            max(height - 2 * EDGE_OF_GLASS, 0)
+        edge_area = glass_area - center_area
+        total_area = glass_area + frame_area
+
+        films = 1 / h_out + 1 / h_in
+        center_conductance = 1 / (1 / u_factor - films) if 1 / u_factor > films \
+            else float('inf')
+        edge_u = 1 / (films + 1 / (values['edge_to_center_ratio'] * center_conductance))
+        frame_u = 1 / (1 / h_out + 1 / _get(frame, 'conductance') +
+                       1 / interior_film_coefficient(values['thermal_absorptance']))
+        frame_shgc = values['solar_absorptance'] * frame_u / h_out
+        result['window_u_factor'] = (center_area * u_factor + edge_area * edge_u +
+                                     frame_area * frame_u) / total_area
+        result['window_shgc'] = (glass_area * shgc + frame_area * frame_shgc) / total_area
+        result['window_vt'] = glass_area * vt / total_area
+        return result
+
+
+def window_construction_properties(energy_properties, calculator=None):
+    """Get the U-factor, SHGC and VT of all window constructions of a Model.
+
+    Args:
+        energy_properties: A ModelEnergyProperties object or a dictionary of one.
+        calculator: An optional WindowCalculator to be used, which can be reused
+            across Models to reuse its cached gas properties. The calculator
+            is updated with the materials of the energy_properties. If None, a
+            WindowCalculator with the default window size will be used.
+
+    Returns:
+        A dictionary with the identifier of each window construction as keys
+        and a dictionary of the properties of the construction as values, as
+        returned by WindowCalculator.construction.
+    """
+    if isinstance(energy_properties, BaseModel):
+        energy_properties = energy_properties.__dict__
+    if calculator is None:
+        calculator = WindowCalculator(energy_properties.get('materials'))
+    else:
+        calculator.update(energy_properties.get('materials'))
+    return {
+        _get(construction, 'identifier'): calculator.construction(construction)
+        for construction in energy_properties.get('constructions') or ()
+        if _type(construction) in _WINDOW_CONSTRUCTION_TYPES
+    }
@@ -1,8 +1,139 @@
 """Geometry objects for model."""
+from array import array
+from itertools import chain
 from typing import List, Literal, Annotated, Union
-from pydantic import Field
+from pydantic import Field, field_validator, field_serializer, model_validator
 from ._base import NoExtraBaseModel
 
+# key of the validation context that turns on the compact storage of coordinates
+COMPACT_GEOMETRY = 'compact_geometry'
+
+
+class PointArray:
+    """A list of 3D points stored as a contiguous array of float64 coordinates.
+
+    PointArrays are used in place of lists of [x, y, z] lists for the vertices
+    of Face3Ds and Mesh3Ds when a Model is validated with compact geometry
+    (eg. Model.model_validate(data, context={'compact_geometry': True})).
+    Each point then takes 24 bytes instead of one list and three float objects
+    while the objects serialize to exactly the same JSON.
+
+    Args:
+        coordinates: An array('d'), a memoryview of float64 values (eg. of a
+            memory-mapped file) or an iterable of floats with the (x, y, z)
+            values of each point one after the other.
+    """
+    __slots__ = ('array',)
+
+    def __init__(self, coordinates):
+        self.array = coordinates if isinstance(coordinates, (array, memoryview)) \
+            else array('d', coordinates)
+
+    @classmethod
+    def from_points(cls, points, min_count=3):
+        """Create a PointArray from a list of [x, y, z] lists.
+
+        The length of all points is checked at once and the coordinates are
+        converted to floats as they are copied into the array.
+
+        Args:
+            points: A list of lists with 3 numbers for each point.
+            min_count: An integer for the minimum number of points. (Default: 3).
+        """
+        if isinstance(points, PointArray):
+            if len(points) < min_count or len(points.array) % 3 != 0:
+                raise ValueError('There should be at least {} points with 3 (x, y, '
+                                 'z) values each.'.format(min_count))
+            return points
+        if not isinstance(points, (list, tuple)):
+            raise ValueError('Points should be a valid list.')
+        if len(points) < min_count:
+            raise ValueError('There should be at least {} points but {} were '
+                             'given.'.format(min_count, len(points)))
+        try:
+            if points and set(map(len, points)) != {3}:
+                raise ValueError('Each point should be a list of 3 (x, y, z) values.')
+            return cls(array('d', chain.from_iterable(points)))
+        except TypeError:
+            raise ValueError('Each point should be a list of 3 (x, y, z) numbers.')
+
+    def tolist(self):
+        """Get the points as a list of [x, y, z] lists."""
+        flat = self.array.tolist()
+        return [flat[i:i + 3] for i in range(0, len(flat), 3)]
+
+    def __len__(self):
+        return len(self.array) // 3
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.tolist()[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('PointArray index out of range')
+        return self.array[index * 3:index * 3 + 3].tolist()
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __eq__(self, other):
+        if isinstance(other, PointArray):
+            if type(self.array) is type(other.array):
+                return self.array == other.array
+            return self.array.tolist() == other.array.tolist()
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return 'PointArray ({} points)'.format(len(self))
+
+
+def newell_normal(points):
+    """Get the Newell normal of a loop of points, which has a length of twice its area.
+
+    Args:
+        points: A list of (x, y, z) values for the vertices of the loop.
+
+    Returns:
+        A tuple with the (x, y, z) values of the normal, which is not unitized.
+    """
+    nx = ny = nz = 0.0
+    x_1, y_1, z_1 = points[-1]
+    for x_2, y_2, z_2 in points:
+        nx += (y_1 - y_2) * (z_1 + z_2)
+        ny += (z_1 - z_2) * (x_1 + x_2)
+        nz += (x_1 - x_2) * (y_1 + y_2)
+        x_1, y_1, z_1 = x_2, y_2, z_2
+    return nx, ny, nz
+
+
+def _compact(info):
+    """Get a boolean for whether compact geometry is requested in a validation context.
+    """
+    context = info.context
+    return isinstance(context, dict) and bool(context.get(COMPACT_GEOMETRY))
+
+
+def _validate_points(value, handler, info):
+    """Validate a list of points as a PointArray if compact geometry is requested."""
+    if _compact(info):
+        return PointArray.from_points(value)
+    if isinstance(value, PointArray):
+        value = value.tolist()
+    return handler(value)
+
+
+def _serialize_points(value, handler):
+    """Serialize a PointArray or a list of them to the same value as lists of points.
+    """
+    if isinstance(value, PointArray):
+        value = value.tolist()
+    elif value and isinstance(value[0], PointArray):
+        value = [points.tolist() for points in value]
+    return handler(value)
+
 
 class Point3D(NoExtraBaseModel):
     """A point object in 3D space."""
@@ -98,6 +229,26 @@ class Face3D(NoExtraBaseModel):
         'If None, the plane will usually be derived from the boundary points.'
     )
 
+    @field_validator('boundary', mode='wrap')
+    @classmethod
+    def compact_boundary(cls, v, handler, info):
+        return _validate_points(v, handler, info)
+
+    @field_validator('holes', mode='wrap')
+    @classmethod
+    def compact_holes(cls, v, handler, info):
+        if v is None or not _compact(info):
+            if v and any(isinstance(hole, PointArray) for hole in v):
+                v = [list(hole) for hole in v]
+            return handler(v)
+        if not isinstance(v, (list, tuple)):
+            raise ValueError('Holes should be a valid list.')
+        return [PointArray.from_points(hole) for hole in v]
+
+    @field_serializer('boundary', 'holes', mode='wrap')
+    def serialize_points(self, v, handler):
+        return _serialize_points(v, handler)
+
 
 class Color(NoExtraBaseModel):
     """A RGB color."""
@@ -159,3 +310,36 @@ class Mesh3D(NoExtraBaseModel):
         description='An optional list of colors that correspond to either the faces '
         'of the mesh or the vertices of the mesh.'
     )
+
+    @field_validator('vertices', mode='wrap')
+    @classmethod
+    def compact_vertices(cls, v, handler, info):
+        return _validate_points(v, handler, info)
+
+    @field_serializer('vertices', mode='wrap')
+    def serialize_points(self, v, handler):
+        return _serialize_points(v, handler)
+
+    @model_validator(mode='after')
+    def check_faces_colors(self) -> 'Mesh3D':
+        """Ensure face indices refer to vertices and colors match faces or vertices.
+
+        The highest index of all faces is found in one pass such that the faces
+        are only searched for the offending one when an index is out of range.
+        """
+        vert_count = len(self.vertices)
+        if max(chain.from_iterable(self.faces)) >= vert_count:
+            for i, face in enumerate(self.faces):
+                if max(face) >= vert_count:
+                    raise ValueError(
+                        'Mesh3D face {} {} refers to a vertex index that is out of '
+                        'range for the {} vertices of the mesh.'.format(
+                            i, face, vert_count))
+        if self.colors is not None:
+            color_count, face_count = len(self.colors), len(self.faces)
+            if color_count not in (face_count, vert_count):
+                raise ValueError(
+                    'Number of Mesh3D colors ({}) must match the number of faces '
+                    '({}) or the number of vertices ({}).'.format(
+                        color_count, face_count, vert_count))
+        return self
@@ -1,7 +1,7 @@
 """Model schema and the 5 geometry objects that define it."""
 from typing import List, Union, Literal
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from ._base import IDdBaseModel
 from .boundarycondition import Outdoors, Surface, Ground, Adiabatic, OtherSideTemperature
@@ -23,6 +23,8 @@ from .geometry import Face3D, Mesh3D
 
 class ShadeMeshPropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ShadeMeshPropertiesAbridged'] = 'ShadeMeshPropertiesAbridged'
 
     energy: Union[ShadeMeshEnergyPropertiesAbridged, None] = Field(
@@ -59,6 +61,8 @@ class ShadeMesh(IDdBaseModel):
 
 class ShadePropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ShadePropertiesAbridged'] = 'ShadePropertiesAbridged'
 
     energy: Union[ShadeEnergyPropertiesAbridged, None] = Field(
@@ -96,6 +100,8 @@ class Shade(IDdBaseModel):
 
 class DoorPropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['DoorPropertiesAbridged'] = 'DoorPropertiesAbridged'
 
     energy: Union[DoorEnergyPropertiesAbridged, None] = Field(
@@ -116,7 +122,7 @@ class Door(IDdBaseModel):
         description='Planar Face3D for the geometry.'
     )
 
-    boundary_condition: Union[Outdoors, Surface]
+    boundary_condition: Union[Outdoors, Surface] = Field(..., discriminator='type')
 
     @field_validator('boundary_condition')
     @classmethod
@@ -152,6 +158,8 @@ class Door(IDdBaseModel):
 
 class AperturePropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['AperturePropertiesAbridged'] = 'AperturePropertiesAbridged'
 
     energy: Union[ApertureEnergyPropertiesAbridged, None] = Field(
@@ -172,7 +180,7 @@ class Aperture(IDdBaseModel):
         description='Planar Face3D for the geometry.'
     )
 
-    boundary_condition: Union[Outdoors, Surface]
+    boundary_condition: Union[Outdoors, Surface] = Field(..., discriminator='type')
 
     @field_validator('boundary_condition')
     @classmethod
@@ -208,6 +216,8 @@ class Aperture(IDdBaseModel):
 
 class FacePropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['FacePropertiesAbridged'] = 'FacePropertiesAbridged'
 
     energy: Union[FaceEnergyPropertiesAbridged, None] = Field(
@@ -238,7 +248,9 @@ class Face(IDdBaseModel):
 
     face_type: FaceType
 
-    boundary_condition: Union[Ground, Outdoors, Adiabatic, Surface, OtherSideTemperature]
+    boundary_condition: Union[
+        Ground, Outdoors, Adiabatic, Surface, OtherSideTemperature
+    ] = Field(..., discriminator='type')
 
     @field_validator('boundary_condition')
     @classmethod
@@ -290,6 +302,8 @@ class Face(IDdBaseModel):
 
 class RoomPropertiesAbridged(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['RoomPropertiesAbridged'] = 'RoomPropertiesAbridged'
 
     energy: Union[RoomEnergyPropertiesAbridged, None] = Field(
@@ -377,6 +391,8 @@ class Units(str, Enum):
 
 class ModelProperties(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ModelProperties'] = 'ModelProperties'
 
     energy: Union[ModelEnergyProperties, None] = Field(
@@ -0,0 +1,105 @@
+"""Validation of Model JSON files across several processes."""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from pydantic import ValidationError
+
+from .stream import iter_model_elements, values_context, _adapter, _element_type
+from ._report import schema_errors, validation_report
+
+# approximate number of characters of JSON sent to a worker in one batch
+BATCH_SIZE = 1048576
+
+
+def _validate_batch(batch, context=None):
+    """Validate a batch of Model elements and get the errors as dictionaries.
+
+    Args:
+        batch: A list of (path, json_text) tuples as yielded by
+            stream.iter_model_elements.
+        context: An optional dictionary for the validation context.
+
+    Returns:
+        A list of dictionaries for the ValidationErrors of the batch. These
+        are sent back to the parent process as dictionaries to keep the
+        pickled results small.
+    """
+    errors = []
+    for path, json_text in batch:
+        try:
+            _adapter(_element_type(path)).validate_json(json_text, context=context)
+        except ValidationError as error:
+            errors.extend(
+                e.model_dump(exclude_none=True)
+                for e in schema_errors(path, json_text, error)
+            )
+    return errors
+
+
+def _iter_batches(model_json, batch_size, shell):
+    """Group the elements of a Model JSON file into batches of similar size.
+
+    The Model shell that is left once all of the elements are streamed is not
+    included in any batch but is instead added to the input shell list.
+    """
+    batch, size = [], 0
+    for path, json_text in iter_model_elements(model_json):
+        if not path:
+            shell.append(json_text)
+            continue
+        batch.append((path, json_text))
+        size += len(json_text)
+        if size >= batch_size:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def validate_model_parallel(model_json, jobs=None, batch_size=BATCH_SIZE):
+    """Validate a Model JSON file using a pool of processes.
+
+    The Rooms, orphaned objects, ShadeMeshes and the resources of the Model
+    extension properties are streamed from the file and sent to the worker
+    processes in batches, which are validated independently of one another.
+    The errors of all batches are then merged into a single ValidationReport.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        jobs: An integer for the number of processes to use. If None, the
+            number of CPUs of the machine will be used. If 1, the Model will
+            be validated in the current process. (Default: None).
+        batch_size: Approximate number of characters of JSON that are sent
+            to a worker process at a time. (Default: 1048576).
+
+    Returns:
+        A ValidationReport for the Model. Errors in the schema of the Model
+        elements are reported with their parents. Errors in any of the
+        other attributes of the Model are reported as the fatal_error.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    context = values_context(model_json)
+    shell, error_dicts, pending = [], [], []
+    try:
+        batches = _iter_batches(model_json, batch_size, shell)
+        if jobs == 1:
+            for batch in batches:
+                error_dicts.extend(_validate_batch(batch, context))
+        else:
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                for batch in batches:
+                    pending.append(executor.submit(_validate_batch, batch, context))
+                    if len(pending) >= 2 * jobs:  # limit the JSON held in memory
+                        error_dicts.extend(pending.pop(0).result())
+                while pending:
+                    error_dicts.extend(pending.pop(0).result())
+        _adapter(_element_type(())).validate_json(shell[0], context=context)
+    except ValidationError as error:
+        return validation_report(error_dicts, fatal_error=str(error))
+    except ValueError as error:
+        # keep the errors of the batches that were validated before the error
+        for future in pending:
+            if future.done() and future.exception() is None:
+                error_dicts.extend(future.result())
+        return validation_report(error_dicts, fatal_error=str(error))
+    return validation_report(error_dicts)
@@ -1,6 +1,6 @@
 """Schema for project information."""
 from typing import List, Union, Literal, Annotated
-from pydantic import BaseModel, Field, AnyUrl
+from pydantic import BaseModel, ConfigDict, Field, AnyUrl
 
 from .altnumber import Autocalculate
 from .energy.simulation import EfficiencyStandards, ClimateZones, BuildingTypes
@@ -9,6 +9,8 @@ from .energy.simulation import EfficiencyStandards, ClimateZones, BuildingTypes
 class Location(BaseModel):
     """A Ladybug Location."""
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['Location'] = 'Location'
 
     city: str = Field(
@@ -52,6 +54,8 @@ class Location(BaseModel):
 class ProjectInfo(BaseModel):
     """Project information."""
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ProjectInfo'] = 'ProjectInfo'
 
     north: float = Field(
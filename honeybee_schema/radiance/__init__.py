@@ -0,0 +1,11 @@
+"""Radiance schema objects."""
+from .._lazy import lazy_loader
+
+__getattr__, __dir__ = lazy_loader(__name__, {
+    'ModelRadianceProperties': 'properties',
+    'ModifierSet': 'modifierset',
+    'ModifierSetAbridged': 'modifierset',
+    'GlobalModifierSet': 'global_modifierset',
+    'SensorGrid': 'asset',
+    'View': 'asset'
+})
@@ -2,7 +2,7 @@
 import pathlib
 import json
 
-from typing import List, Union, Literal
+from typing import List, Union, Literal, Annotated
 from pydantic import Field
 
 from honeybee_standards import radiance_default
@@ -37,7 +37,9 @@ class GlobalModifierSet(NoExtraBaseModel):
 
     type: Literal['GlobalModifierSet'] = 'GlobalModifierSet'
 
-    modifiers: List[Union[Plastic, Glass, Trans]] = Field(
+    modifiers: List[
+        Annotated[Union[Plastic, Glass, Trans], Field(discriminator='type')]
+    ] = Field(
         default=_MODIFIERS,
         description='Global Honeybee Radiance modifiers.',
         json_schema_extra={'readOnly': True}
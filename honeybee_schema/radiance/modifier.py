@@ -1,7 +1,7 @@
 """Modifier Schema"""
 from __future__ import annotations
 from pydantic import Field, BaseModel, field_validator
-from typing import List, Literal, Union, Optional
+from typing import List, Literal, Union, Optional, Annotated
 from ._base import IDdRadianceBaseModel
 
 
@@ -360,8 +360,10 @@ class Glow(Light):
 
 
 # Union Modifier Schema objects defined for type reference
-_REFERENCE_UNION_MODIFIERS = \
-    Union[Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror]
+_REFERENCE_UNION_MODIFIERS = Annotated[
+    Union[Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror],
+    Field(discriminator='type')
+]
 
 # Required for self.referencing model
 # see https://pydantic-docs.helpmanual.io/#self-referencing-models
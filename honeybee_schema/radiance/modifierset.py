@@ -1,6 +1,6 @@
 """ModifierSet Schema"""
 from pydantic import Field
-from typing import Union, Literal
+from typing import Union, Literal, Annotated
 from .._base import NoExtraBaseModel
 from ._base import IDdRadianceBaseModel
 from .modifier import Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror
@@ -152,7 +152,10 @@ class ModifierSetAbridged(IDdRadianceBaseModel):
     )
 
 
-ALL_MODIFIERS = Union[Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror, None]
+ALL_MODIFIERS = Union[Annotated[
+    Union[Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror],
+    Field(discriminator='type')
+], None]
 
 
 class BaseModifierSet(NoExtraBaseModel):
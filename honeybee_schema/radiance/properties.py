@@ -1,6 +1,6 @@
 """Properties Schema"""
 from pydantic import Field
-from typing import List, Union, Literal
+from typing import List, Union, Literal, Annotated
 
 from .modifierset import ModifierSet, ModifierSetAbridged
 from .modifier import Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror
@@ -119,14 +119,19 @@ class ModelRadianceProperties(NoExtraBaseModel):
         json_schema_extra={'readOnly': True}
     )
 
-    modifiers: List[Union[Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror]] = Field(
+    modifiers: List[Annotated[
+        Union[Plastic, Glass, BSDF, Glow, Light, Trans, Metal, Void, Mirror],
+        Field(discriminator='type')
+    ]] = Field(
         default=None,
         description='A list of all unique modifiers in the model. '
                     'This includes modifiers across all Faces, Apertures, Doors, '
                     'Shades, Room ModifierSets, and the global_modifier_set.'
     )
 
-    modifier_sets: List[Union[ModifierSet, ModifierSetAbridged]] = Field(
+    modifier_sets: List[Annotated[
+        Union[ModifierSet, ModifierSetAbridged], Field(discriminator='type')
+    ]] = Field(
         default=None,
         description='A list of all unique Room-Assigned ModifierSets in the Model.'
     )
@@ -0,0 +1,195 @@
+"""Solve the adjacencies between the Rooms of a Model dictionary.
+
+The Faces of all Rooms are hashed into a grid of cells that are the size of the
+Model tolerance using the center of their vertices. Faces that are adjacent to
+one another have the same center and so each Face only needs to be compared
+with the Faces in its own cell and the neighboring cells. This makes the
+solution linear in the number of Faces in the Model rather than comparing all
+pairs of Faces.
+"""
+import math
+
+from .geometry import newell_normal
+
+# offsets of a cell and all of its neighboring cells in the grid
+_NEIGHBORS = tuple(
+    (i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1))
+
+
+def _near_all(points_1, points_2, tolerance):
+    """Check whether every vertex of a loop is near some vertex of another loop."""
+    for pt_1 in points_1:
+        if not any(abs(pt_1[0] - pt_2[0]) <= tolerance and
+                   abs(pt_1[1] - pt_2[1]) <= tolerance and
+                   abs(pt_1[2] - pt_2[2]) <= tolerance for pt_2 in points_2):
+            return False
+    return True
+
+
+def _loops_match(points_1, points_2, tolerance):
+    """Check whether two loops of vertices have the same vertices both ways."""
+    return len(points_1) == len(points_2) and \
+        _near_all(points_1, points_2, tolerance) and \
+        _near_all(points_2, points_1, tolerance)
+
+
+class _Polygon:
+    """The center, normal and vertices of a Face3D used to match adjacent objects."""
+    __slots__ = ('obj', 'points', 'holes', 'center', 'normal')
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.points = [tuple(pt) for pt in obj['geometry']['boundary']]
+        self.holes = [[tuple(pt) for pt in hole]
+                      for hole in obj['geometry'].get('holes') or ()]
+        count = len(self.points)
+        self.center = tuple(sum(pt[i] for pt in self.points) / count for i in range(3))
+        nx, ny, nz = newell_normal(self.points)
+        length = math.sqrt(nx * nx + ny * ny + nz * nz)
+        self.normal = (nx / length, ny / length, nz / length) if length else (0, 0, 0)
+
+    def cell(self, tolerance):
+        return tuple(int(math.floor(c / tolerance)) for c in self.center)
+
+    def matches(self, other, tolerance, cos_angle):
+        """Check whether another polygon is coplanar, opposite-facing and congruent.
+
+        The boundaries must have the same vertices in both directions and each
+        hole must match a different hole of the other polygon in the same way.
+        """
+        if len(self.points) != len(other.points) or \
+                len(self.holes) != len(other.holes):
+            return False
+        if any(abs(c_1 - c_2) > tolerance
+               for c_1, c_2 in zip(self.center, other.center)):
+            return False
+        if sum(n_1 * n_2 for n_1, n_2 in zip(self.normal, other.normal)) > -cos_angle:
+            return False
+        if not _loops_match(self.points, other.points, tolerance):
+            return False
+        other_holes = list(other.holes)
+        for hole in self.holes:
+            for i, other_hole in enumerate(other_holes):
+                if _loops_match(hole, other_hole, tolerance):
+                    del other_holes[i]
+                    break
+            else:
+                return False
+        return True
+
+
+def _match_sub_faces(sub_faces_1, sub_faces_2, tolerance, cos_angle):
+    """Get the pairs of matching sub-faces or None if not all sub-faces match."""
+    if len(sub_faces_1) != len(sub_faces_2):
+        return None
+    polygons_2 = [_Polygon(obj) for obj in sub_faces_2]
+    pairs = []
+    for obj in sub_faces_1:
+        polygon = _Polygon(obj)
+        for i, other in enumerate(polygons_2):
+            if other is not None and polygon.matches(other, tolerance, cos_angle):
+                pairs.append((obj, other.obj))
+                polygons_2[i] = None
+                break
+        else:
+            return None
+    return pairs
+
+
+def _surface(adjacent_ids):
+    return {'type': 'Surface', 'boundary_condition_objects': list(adjacent_ids)}
+
+
+def _reset_outdoors(face):
+    """Reset the Surface boundary conditions of a Face and its sub-faces to Outdoors.
+    """
+    for obj in [face] + (face.get('apertures') or []) + (face.get('doors') or []):
+        if obj['boundary_condition']['type'] == 'Surface':
+            obj['boundary_condition'] = {'type': 'Outdoors'}
+
+
+def solve_adjacency(model_dict, tolerance=None, angle_tolerance=None, overwrite=False):
+    """Set reciprocal Surface boundary conditions between the Rooms of a Model.
+
+    Faces of different Rooms are adjacent when they are coplanar, face opposite
+    directions and have matching vertices (including those of their holes)
+    within the tolerance. All of their Apertures and Doors must also match one
+    another in the same way, in which case the sub-faces also get Surface
+    boundary conditions. Only Faces with an Outdoors boundary condition (or a
+    Surface boundary condition when overwrite is True) are solved such that
+    Ground, Adiabatic and other boundary conditions are never changed.
+
+    Args:
+        model_dict: A dictionary of a Model that complies with the schema, which
+            will be edited in place.
+        tolerance: The maximum difference between coordinates at which vertices
+            are considered equivalent. If None, the tolerance of the Model is used.
+        angle_tolerance: The maximum angle in degrees by which the normals of
+            adjacent Faces can deviate from being exactly opposite. If None,
+            the angle_tolerance of the Model is used.
+        overwrite: Boolean to note whether Faces that already have a Surface
+            boundary condition should be solved again. When True, the Faces
+            with a Surface boundary condition that no longer match any Face
+            (along with their Apertures and Doors) are reset to Outdoors such
+            that no Surface boundary condition points to a Face that now has
+            a different adjacent Face. (Default: False).
+
+    Returns:
+        A list of tuples with the identifiers of each pair of adjacent Faces.
+    """
+    tolerance = tolerance or model_dict.get('tolerance') or 0.01
+    if angle_tolerance is None:
+        angle_tolerance = model_dict.get('angle_tolerance', 1.0)
+    cos_angle = math.cos(math.radians(angle_tolerance))
+
+    grid, polygons = {}, []
+    for room in model_dict.get('rooms') or ():
+        for face in room['faces']:
+            bc_type = face['boundary_condition']['type']
+            if bc_type != 'Outdoors' and not (overwrite and bc_type == 'Surface'):
+                continue
+            polygon = _Polygon(face)
+            polygons.append((room, polygon))
+            grid.setdefault(polygon.cell(tolerance), []).append(len(polygons) - 1)
+
+    matched, pairs = set(), []
+    for i, (room, polygon) in enumerate(polygons):
+        if i in matched:
+            continue
+        x, y, z = polygon.cell(tolerance)
+        candidates = sorted(j for dx, dy, dz in _NEIGHBORS
+                            for j in grid.get((x + dx, y + dy, z + dz), ())
+                            if j > i and j not in matched)
+        for j in candidates:
+            adj_room, adj_polygon = polygons[j]
+            if adj_room is room or \
+                    not polygon.matches(adj_polygon, tolerance, cos_angle):
+                continue
+            face, adj_face = polygon.obj, adj_polygon.obj
+            sub_pairs = []
+            for key in ('apertures', 'doors'):
+                key_pairs = _match_sub_faces(
+                    face.get(key) or [], adj_face.get(key) or [], tolerance, cos_angle)
+                if key_pairs is None:
+                    break
+                sub_pairs.extend(key_pairs)
+            else:
+                matched.update((i, j))
+                pairs.append((face['identifier'], adj_face['identifier']))
+                face['boundary_condition'] = _surface(
+                    (adj_face['identifier'], adj_room['identifier']))
+                adj_face['boundary_condition'] = _surface(
+                    (face['identifier'], room['identifier']))
+                for sub_face, adj_sub_face in sub_pairs:
+                    sub_face['boundary_condition'] = _surface((
+                        adj_sub_face['identifier'], adj_face['identifier'],
+                        adj_room['identifier']))
+                    adj_sub_face['boundary_condition'] = _surface((
+                        sub_face['identifier'], face['identifier'], room['identifier']))
+                break
+
+    if overwrite:  # reset any previous Surface that no longer has an adjacent Face
+        for i, (_, polygon) in enumerate(polygons):
+            if i not in matched:
+                _reset_outdoors(polygon.obj)
+    return pairs
@@ -0,0 +1,401 @@
+"""Spatial index of the geometry objects of a Model for box, ray and nearest queries.
+
+The index is an R-tree of the axis-aligned bounding boxes of the objects. It is
+bulk-loaded from a validated Model by recursively splitting the objects along
+the longest axis of their bounds and it supports the insertion and deletion of
+objects afterwards such that it can be kept up to date as the Model is edited.
+All queries only descend into the nodes of the tree with bounding boxes that
+can contain a result, which avoids a scan of all objects in the Model.
+"""
+import math
+import heapq
+
+# default maximum number of children of each node of the tree
+MAX_ENTRIES = 16
+
+# keys for the geometry objects that are nested within each type of object
+_SHADES = (('indoor_shades', 'Shade'), ('outdoor_shades', 'Shade'))
+_CHILDREN = {
+    'Room': (('faces', 'Face'),) + _SHADES,
+    'Face': (('apertures', 'Aperture'), ('doors', 'Door')) + _SHADES,
+    'Aperture': _SHADES,
+    'Door': _SHADES,
+    'Shade': (),
+    'ShadeMesh': ()
+}
+_MODEL_GEOMETRY = (
+    ('rooms', 'Room'),
+    ('orphaned_faces', 'Face'),
+    ('orphaned_shades', 'Shade'),
+    ('orphaned_apertures', 'Aperture'),
+    ('orphaned_doors', 'Door'),
+    ('shade_meshes', 'ShadeMesh')
+)
+OBJECT_TYPES = ('Room', 'Face', 'Aperture', 'Door', 'Shade', 'ShadeMesh')
+
+
+def points_bounds(points):
+    """Get the bounding box of a list of [x, y, z] points or a PointArray.
+
+    Returns:
+        A tuple of (min_x, min_y, min_z, max_x, max_y, max_z).
+    """
+    coordinates = getattr(points, 'array', None)
+    if coordinates is not None:
+        xs, ys, zs = coordinates[0::3], coordinates[1::3], coordinates[2::3]
+    else:
+        xs, ys, zs = zip(*points)
+    return min(xs), min(ys), min(zs), max(xs), max(ys), max(zs)
+
+
+def union(box_1, box_2):
+    """Get the bounding box around two bounding boxes."""
+    return (
+        min(box_1[0], box_2[0]), min(box_1[1], box_2[1]), min(box_1[2], box_2[2]),
+        max(box_1[3], box_2[3]), max(box_1[4], box_2[4]), max(box_1[5], box_2[5])
+    )
+
+
+def _union_all(boxes):
+    boxes = iter(boxes)
+    result = next(boxes)
+    for box in boxes:
+        result = union(result, box)
+    return result
+
+
+def _margin(box):
+    return (box[3] - box[0]) + (box[4] - box[1]) + (box[5] - box[2])
+
+
+def _intersects(box_1, box_2):
+    return box_1[0] <= box_2[3] and box_2[0] <= box_1[3] and \
+        box_1[1] <= box_2[4] and box_2[1] <= box_1[4] and \
+        box_1[2] <= box_2[5] and box_2[2] <= box_1[5]
+
+
+def _center(box, axis):
+    return box[axis] + box[axis + 3]
+
+
+def _point_distance(point, box):
+    """Get the distance from a point to the nearest point of a bounding box."""
+    distance = 0
+    for i in range(3):
+        if point[i] < box[i]:
+            distance += (box[i] - point[i]) ** 2
+        elif point[i] > box[i + 3]:
+            distance += (point[i] - box[i + 3]) ** 2
+    return math.sqrt(distance)
+
+
+def _ray_distance(origin, inverse, box):
+    """Get the distance along a ray to a bounding box or None if it is missed."""
+    t_min, t_max = 0, math.inf
+    for i in range(3):
+        if inverse[i] is None:  # the ray is parallel to this axis
+            if not box[i] <= origin[i] <= box[i + 3]:
+                return None
+            continue
+        t_1 = (box[i] - origin[i]) * inverse[i]
+        t_2 = (box[i + 3] - origin[i]) * inverse[i]
+        if t_1 > t_2:
+            t_1, t_2 = t_2, t_1
+        t_min, t_max = max(t_min, t_1), min(t_max, t_2)
+        if t_min > t_max:
+            return None
+    return t_min
+
+
+class _Entry:
+    __slots__ = ('key', 'box', 'parent')
+
+    def __init__(self, key, box, parent=None):
+        self.key, self.box, self.parent = key, box, parent
+
+
+class _Node:
+    __slots__ = ('box', 'children', 'leaf', 'parent')
+
+    def __init__(self, children, leaf, parent=None):
+        self.children, self.leaf, self.parent = children, leaf, parent
+        for child in children:
+            child.parent = self
+        self.box = _union_all(child.box for child in children) if children else None
+
+    def update_box(self):
+        """Recompute the bounding box of this node and all of its parents."""
+        node = self
+        while node is not None:
+            node.box = _union_all(child.box for child in node.children) \
+                if node.children else None
+            node = node.parent
+
+
+class SpatialIndex:
+    """An R-tree of the bounding boxes of the geometry objects of a Model.
+
+    Each object in the index is identified by its ObjectTypes (eg. Face)
+    and its identifier since objects of different types can share the same
+    identifier. All queries return (obj_type, identifier) tuples for the
+    objects, which can be filtered to certain types with the obj_types
+    argument.
+
+    Args:
+        max_entries: An integer for the maximum number of children of each node
+            of the tree. (Default: 16).
+
+    Usage:
+
+    .. code-block:: python
+
+        index = SpatialIndex.from_model(model)
+        shades = index.query_box(room_bounds, obj_types=('Shade', 'ShadeMesh'))
+        nearest_rooms = index.nearest((0, 0, 0), k=3, obj_types=('Room',))
+    """
+    __slots__ = ('max_entries', '_root', '_entries')
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        assert max_entries >= 4, 'SpatialIndex max_entries must be at least 4.'
+        self.max_entries = max_entries
+        self._root = _Node([], leaf=True)
+        self._entries = {}
+
+    @classmethod
+    def from_model(cls, model, obj_types=OBJECT_TYPES, max_entries=MAX_ENTRIES):
+        """Create a SpatialIndex from the geometry objects of a validated Model.
+
+        Args:
+            model: A Model object.
+            obj_types: A list of the ObjectTypes to be included in the index.
+                (Default: Room, Face, Aperture, Door, Shade and ShadeMesh).
+            max_entries: An integer for the maximum number of children of each
+                node of the tree. (Default: 16).
+        """
+        index = cls(max_entries)
+        entries = []
+        for key, obj_type in _MODEL_GEOMETRY:
+            for obj in getattr(model, key) or ():
+                cls._object_entries(obj_type, obj, set(obj_types), entries)
+        for entry in entries:
+            if entry.key in index._entries:
+                raise ValueError('{} "{}" is in the Model more than once.'.format(
+                    *entry.key))
+            index._entries[entry.key] = entry
+        if entries:
+            index._root = index._bulk_load(entries)
+        return index
+
+    @classmethod
+    def _object_entries(cls, obj_type, obj, obj_types, entries):
+        """Add the entries for an object and its children, returning its bounds."""
+        boxes = []
+        if obj_type == 'ShadeMesh':
+            boxes.append(points_bounds(obj.geometry.vertices))
+        elif obj_type != 'Room':
+            boxes.append(points_bounds(obj.geometry.boundary))
+        for key, child_type in _CHILDREN[obj_type]:
+            for child in getattr(obj, key) or ():
+                child_box = cls._object_entries(child_type, child, obj_types, entries)
+                if key == 'faces':
+                    boxes.append(child_box)
+        box = _union_all(boxes)
+        if obj_type in obj_types:
+            entries.append(_Entry((obj_type, obj.identifier), box))
+        return box
+
+    def _bulk_load(self, items, leaf=True):
+        """Build a tree from a list of entries by recursive splits along long axes."""
+        if len(items) <= self.max_entries:
+            return _Node(items, leaf)
+        groups = [items]
+        while len(groups) < self.max_entries:  # split the largest group in two
+            groups.sort(key=len)
+            largest = groups.pop()
+            if len(largest) <= self.max_entries:
+                groups.append(largest)
+                break
+            groups.extend(self._split(largest))
+        return _Node([self._bulk_load(group, leaf) for group in groups], False)
+
+    @staticmethod
+    def _split(items):
+        """Split a list of entries or nodes in two halves along the longest axis."""
+        box = _union_all(item.box for item in items)
+        axis = max(range(3), key=lambda i: box[i + 3] - box[i])
+        items = sorted(items, key=lambda item: _center(item.box, axis))
+        half = len(items) // 2
+        return items[:half], items[half:]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def bounds(self):
+        """Get the bounding box of all objects in the index or None if it is empty."""
+        return self._root.box
+
+    def bounding_box(self, obj_type, identifier):
+        """Get the bounding box of an object in the index.
+
+        Args:
+            obj_type: Text for the ObjectTypes of the object (eg. Face).
+            identifier: Text for the identifier of the object.
+        """
+        return self._entries[(obj_type, identifier)].box
+
+    def insert(self, obj_type, identifier, box):
+        """Insert an object into the index.
+
+        Args:
+            obj_type: Text for the ObjectTypes of the object (eg. Face).
+            identifier: Text for the identifier of the object.
+            box: A tuple of (min_x, min_y, min_z, max_x, max_y, max_z) for the
+                bounding box of the object, which can be obtained from the
+                vertices of the object with the points_bounds function.
+        """
+        key = (obj_type, identifier)
+        if key in self._entries:
+            raise ValueError('{} "{}" is already in the SpatialIndex.'.format(*key))
+        entry = self._entries[key] = _Entry(key, tuple(box))
+        node = self._root
+        while not node.leaf:  # choose the child that grows the least
+            node = min(node.children, key=lambda child: (
+                _margin(union(child.box, entry.box)) - _margin(child.box),
+                _margin(child.box)))
+        entry.parent = node
+        node.children.append(entry)
+        node.update_box()
+        while len(node.children) > self.max_entries:
+            node = self._split_node(node)
+
+    def _split_node(self, node):
+        """Split an overfull node in two and get the parent that holds both halves."""
+        first, second = self._split(node.children)
+        parent = node.parent
+        new_node = _Node(second, node.leaf)
+        node.children = first
+        for child in first:
+            child.parent = node
+        node.update_box()
+        if parent is None:  # the root was split
+            self._root = parent = _Node([node, new_node], False)
+        else:
+            parent.children.append(new_node)
+            new_node.parent = parent
+            parent.update_box()
+        return parent
+
+    def delete(self, obj_type, identifier):
+        """Delete an object from the index.
+
+        Args:
+            obj_type: Text for the ObjectTypes of the object (eg. Face).
+            identifier: Text for the identifier of the object.
+        """
+        entry = self._entries.pop((obj_type, identifier))
+        node = entry.parent
+        node.children.remove(entry)
+        while not node.children and node.parent is not None:  # remove empty nodes
+            node.parent.children.remove(node)
+            node = node.parent
+        if not node.children:  # all objects were deleted
+            self._root = _Node([], leaf=True)
+        else:
+            node.update_box()
+
+    def update(self, obj_type, identifier, box):
+        """Update the bounding box of an object in the index after it is edited.
+
+        Args:
+            obj_type: Text for the ObjectTypes of the object (eg. Face).
+            identifier: Text for the identifier of the object.
+            box: A tuple of (min_x, min_y, min_z, max_x, max_y, max_z) for the
+                new bounding box of the object.
+        """
+        self.delete(obj_type, identifier)
+        self.insert(obj_type, identifier, box)
+
+    def query_box(self, box, obj_types=None):
+        """Get the objects with bounding boxes that intersect a box.
+
+        Args:
+            box: A tuple of (min_x, min_y, min_z, max_x, max_y, max_z).
+            obj_types: An optional list of ObjectTypes to which the results
+                are limited. If None, objects of all types are returned.
+
+        Returns:
+            A list of (obj_type, identifier) tuples for the objects.
+        """
+        results, stack = [], [self._root] if self._root.box is not None else []
+        while stack:
+            node = stack.pop()
+            for child in node.children:
+                if _intersects(child.box, box):
+                    if not node.leaf:
+                        stack.append(child)
+                    elif obj_types is None or child.key[0] in obj_types:
+                        results.append(child.key)
+        return results
+
+    def query_ray(self, origin, direction, max_distance=None, obj_types=None):
+        """Get the objects with bounding boxes that a ray hits.
+
+        Args:
+            origin: A tuple of (x, y, z) for the start of the ray.
+            direction: A tuple of (x, y, z) for the direction of the ray.
+            max_distance: An optional number for the maximum distance along the
+                ray, in multiples of the length of the direction.
+            obj_types: An optional list of ObjectTypes to which the results
+                are limited. If None, objects of all types are returned.
+
+        Returns:
+            A list of (obj_type, identifier) tuples for the objects sorted by
+            the distance along the ray at which their bounding box is hit.
+        """
+        inverse = [1 / d if d != 0 else None for d in direction]
+        limit = math.inf if max_distance is None else max_distance
+        hits, stack = [], [self._root] if self._root.box is not None else []
+        while stack:
+            node = stack.pop()
+            for child in node.children:
+                distance = _ray_distance(origin, inverse, child.box)
+                if distance is None or distance > limit:
+                    continue
+                if not node.leaf:
+                    stack.append(child)
+                elif obj_types is None or child.key[0] in obj_types:
+                    hits.append((distance, child.key))
+        hits.sort()
+        return [key for _, key in hits]
+
+    def nearest(self, point, k=1, obj_types=None):
+        """Get the k objects with bounding boxes nearest to a point.
+
+        Args:
+            point: A tuple of (x, y, z) for the point.
+            k: An integer for the number of objects to return. (Default: 1).
+            obj_types: An optional list of ObjectTypes to which the results
+                are limited. If None, objects of all types are returned.
+
+        Returns:
+            A list of up to k (obj_type, identifier) tuples for the objects sorted
+            by the distance from the point to their bounding box.
+        """
+        results, count = [], 0  # the count breaks ties between equal distances
+        queue = [(0, count, self._root)] if self._root.box is not None else []
+        while queue and len(results) < k:
+            _, _, item = heapq.heappop(queue)
+            if isinstance(item, _Entry):
+                results.append(item.key)
+                continue
+            for child in item.children:
+                if item.leaf and obj_types is not None and \
+                        child.key[0] not in obj_types:
+                    continue
+                count += 1
+                heapq.heappush(queue, (_point_distance(point, child.box), count, child))
+        return results
@@ -0,0 +1,397 @@
+"""Incremental reading and validation of Model JSON files.
+
+The functions in this module walk a Model JSON file one element at a time
+(Rooms, orphaned objects, ShadeMeshes and the resource lists of the energy and
+radiance properties) such that the memory needed to validate a Model stays
+close to that of its largest single element rather than the whole Model.
+"""
+import os
+import re
+import json
+import typing
+
+from pydantic import TypeAdapter, ValidationError
+
+from .model import Model
+from .energy.schedule import VALUES_FOLDER
+from .energy.properties import ModelEnergyProperties
+from .radiance.properties import ModelRadianceProperties
+
+
+CHUNK_SIZE = 65536
+
+_WHITESPACE = re.compile(r'\s*')
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_SCALAR_END = re.compile(r'[\s,\]}]')
+
+# Model keys that hold lists of objects, which are validated one at a time
+_MODEL_LISTS = (
+    'rooms', 'orphaned_faces', 'orphaned_shades', 'orphaned_apertures',
+    'orphaned_doors', 'shade_meshes'
+)
+
+
+class _JsonReader:
+    """A minimal pull reader over a JSON text file.
+
+    The reader only understands the structure of JSON (objects, arrays and
+    strings). Scalar values and any values that are not explicitly walked are
+    returned as raw JSON text such that they can be validated with pydantic.
+
+    Args:
+        file: A file object opened in text mode.
+        chunk_size: Number of characters to read from the file at a time.
+    """
+
+    def __init__(self, file, chunk_size=CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buf = ''
+        self._pos = 0
+
+    def _fill(self):
+        """Read the next chunk of the file into the buffer.
+
+        Returns:
+            False if the end of the file has been reached. True otherwise.
+        """
+        data = self._file.read(self._chunk_size)
+        if not data:
+            return False
+        self._buf += data
+        return True
+
+    def release(self):
+        """Discard the part of the buffer that has already been consumed."""
+        if self._pos:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+    def peek(self):
+        """Get the next non-whitespace character without consuming it."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            self.release()
+            if not self._fill():
+                raise ValueError('Unexpected end of the JSON file.')
+
+    def expect(self, character):
+        """Consume the next non-whitespace character, checking that it is expected."""
+        found = self.peek()
+        if found != character:
+            raise ValueError(
+                'Expected "{}" in the JSON file but got "{}".'.format(character, found)
+            )
+        self._pos += 1
+
+    def _skip_string(self):
+        """Move the reader past the string that starts at the current position."""
+        index = self._pos + 1
+        while True:
+            end = self._buf.find('"', index)
+            if end == -1:
+                index = len(self._buf)
+                if not self._fill():
+                    raise ValueError('Unterminated string in the JSON file.')
+                continue
+            slash = end - 1
+            while self._buf[slash] == '\\':
+                slash -= 1
+            if (end - slash) % 2 == 1:  # an even number of backslashes
+                self._pos = end + 1
+                return
+            index = end + 1
+
+    def _skip_container(self):
+        """Move the reader past the object or array at the current position."""
+        depth = 0
+        while True:
+            match = _STRUCTURE.search(self._buf, self._pos)
+            if match is None:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise ValueError('Unexpected end of the JSON file.')
+                continue
+            self._pos = match.start()
+            character = match.group()
+            if character == '"':
+                self._skip_string()
+                continue
+            self._pos += 1
+            if character in '[{':
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def _skip_scalar(self):
+        """Move the reader past the number or literal at the current position."""
+        while True:
+            match = _SCALAR_END.search(self._buf, self._pos)
+            if match is not None:
+                self._pos = match.start()
+                return
+            self._pos = len(self._buf)
+            if not self._fill():
+                return
+
+    def read_raw(self):
+        """Consume the next JSON value and return it as raw JSON text."""
+        character = self.peek()
+        start = self._pos
+        if character == '"':
+            self._skip_string()
+        elif character in '[{':
+            self._skip_container()
+        else:
+            self._skip_scalar()
+        return self._buf[start:self._pos]
+
+    def read_key(self):
+        """Consume the next object key along with the colon that follows it."""
+        if self.peek() != '"':
+            raise ValueError('Expected an object key in the JSON file.')
+        start = self._pos
+        self._skip_string()
+        key = json.loads(self._buf[start:self._pos])
+        self.expect(':')
+        return key
+
+    def iter_object(self):
+        """Iterate over the keys of the JSON object at the current position.
+
+        The caller must consume the value of each key (eg. with read_raw)
+        before requesting the next key.
+        """
+        self.expect('{')
+        if self.peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            yield self.read_key()
+            character = self.peek()
+            self._pos += 1
+            if character == '}':
+                return
+            if character != ',':
+                raise ValueError(
+                    'Expected "," or "}}" in the JSON file but got "{}".'.format(
+                        character)
+                )
+
+    def iter_array(self):
+        """Iterate over the items of the JSON array at the current position.
+
+        The caller must consume each item (eg. with read_raw) before requesting
+        the next one. The yielded value is the index of the item.
+        """
+        self.expect('[')
+        if self.peek() == ']':
+            self._pos += 1
+            return
+        index = 0
+        while True:
+            self.release()
+            yield index
+            index += 1
+            character = self.peek()
+            self._pos += 1
+            if character == ']':
+                return
+            if character != ',':
+                raise ValueError(
+                    'Expected "," or "]" in the JSON file but got "{}".'.format(
+                        character)
+                )
+
+
+def _list_item_type(annotation):
+    """Get the item type of a field annotation like Union[List[X], None]."""
+    if typing.get_origin(annotation) is list:
+        return typing.get_args(annotation)[0]
+    for arg in typing.get_args(annotation):
+        if typing.get_origin(arg) is list:
+            return typing.get_args(arg)[0]
+    return None
+
+
+def _streamed_lists(model_class):
+    """Get a dictionary of the list fields of a model class and their item types."""
+    lists = {}
+    for name, field in model_class.model_fields.items():
+        item_type = _list_item_type(field.annotation)
+        if item_type is not None:
+            lists[name] = item_type
+    return lists
+
+
+_STREAMED = {
+    (): {name: _list_item_type(Model.model_fields[name].annotation)
+         for name in _MODEL_LISTS},
+    ('properties', 'energy'): _streamed_lists(ModelEnergyProperties),
+    ('properties', 'radiance'): _streamed_lists(ModelRadianceProperties)
+}
+_ADAPTERS = {}
+
+
+def _adapter(item_type):
+    """Get a cached TypeAdapter for a type of item found in a Model list."""
+    try:
+        return _ADAPTERS[item_type]
+    except KeyError:
+        adapter = _ADAPTERS[item_type] = TypeAdapter(item_type)
+        return adapter
+
+
+def _walk_object(reader, path, shell):
+    """Walk a JSON object, yielding the items of its streamed lists.
+
+    Any value that is not streamed is added as raw JSON text to the shell
+    dictionary such that it can be validated once the walk is complete.
+    """
+    streamed = _STREAMED.get(path, {})
+    for key in reader.iter_object():
+        sub_path = path + (key,)
+        character = reader.peek()
+        if key in streamed and character == '[':
+            for index in reader.iter_array():
+                yield sub_path + (index,), reader.read_raw()
+        elif character == '{' and (sub_path == ('properties',) or
+                                   sub_path in _STREAMED):
+            sub_shell = shell[key] = {}
+            for item in _walk_object(reader, sub_path, sub_shell):
+                yield item
+        else:
+            shell[key] = reader.read_raw()
+
+
+def _shell_json(shell):
+    """Get a JSON string from a shell dictionary of raw JSON text values."""
+    members = []
+    for key, value in shell.items():
+        if isinstance(value, dict):
+            value = _shell_json(value)
+        members.append('{}:{}'.format(json.dumps(key), value))
+    return '{' + ','.join(members) + '}'
+
+
+def iter_model_elements(model_json, chunk_size=CHUNK_SIZE):
+    """Iterate over the elements of a Model JSON file without loading all of it.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        chunk_size: Number of characters to read from the file at a time.
+
+    Yields:
+        A tuple for each element with two items.
+
+        -   path: A tuple for the location of the element in the Model JSON
+            (eg. ('rooms', 0) or ('properties', 'energy', 'schedules', 12)).
+            The last item yielded always has an empty tuple for the path and
+            it contains the Model without any of the streamed elements.
+
+        -   json_text: The raw JSON text of the element.
+    """
+    shell = {}
+    with open(model_json, encoding='utf-8') as json_file:
+        reader = _JsonReader(json_file, chunk_size)
+        for item in _walk_object(reader, (), shell):
+            yield item
+    yield (), _shell_json(shell)
+
+
+def _skip_value(reader):
+    """Consume the next JSON value, reading the items of arrays one at a time."""
+    if reader.peek() == '[':
+        for _ in reader.iter_array():
+            reader.read_raw()
+    else:
+        reader.read_raw()
+
+
+def _walk_list(reader, path):
+    """Walk a JSON object down a path of keys, yielding the items of its last list.
+    """
+    for key in reader.iter_object():
+        character = reader.peek()
+        if key == path[0] and len(path) == 1 and character == '[':
+            for _ in reader.iter_array():
+                yield reader.read_raw()
+            return
+        if key == path[0] and len(path) > 1 and character == '{':
+            for item in _walk_list(reader, path[1:]):
+                yield item
+            return
+        _skip_value(reader)
+
+
+def iter_model_list(model_json, path, chunk_size=CHUNK_SIZE):
+    """Iterate over the items of one list of a Model JSON file without parsing it.
+
+    The file is only read up to the end of the list and none of the other
+    values of the Model are parsed.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        path: A tuple of keys for the location of the list in the Model JSON
+            (eg. ('properties', 'energy', 'schedules')).
+        chunk_size: Number of characters to read from the file at a time.
+
+    Yields:
+        The raw JSON text of each item of the list.
+    """
+    with open(model_json, encoding='utf-8') as json_file:
+        reader = _JsonReader(json_file, chunk_size)
+        for item in _walk_list(reader, tuple(path)):
+            yield item
+
+
+def _element_type(path):
+    """Get the type against which an element at a given path is validated."""
+    if not path:
+        return Model
+    return _STREAMED[path[:-2]][path[-2]]
+
+
+def values_context(model_json):
+    """Get the validation context for the external files referenced by a Model JSON.
+
+    Args:
+        model_json: Path to a Model JSON file.
+
+    Returns:
+        A dictionary with the folder of the Model JSON file, which is used to
+        find the .hbval files of the ExternalValues of schedules.
+    """
+    return {VALUES_FOLDER: os.path.dirname(os.path.abspath(model_json))}
+
+
+def validate_model_elements(model_json, chunk_size=CHUNK_SIZE):
+    """Validate the elements of a Model JSON file one at a time.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        chunk_size: Number of characters to read from the file at a time.
+
+    Yields:
+        A tuple for each element of the Model with two items.
+
+        -   path: A tuple for the location of the element in the Model JSON
+            (eg. ('rooms', 0) or ('properties', 'energy', 'schedules', 12)).
+            The last item yielded always has an empty tuple for the path and
+            it is for the Model without any of the streamed elements.
+
+        -   result: The validated schema object (eg. a Room) or a pydantic
+            ValidationError if the element is not valid.
+    """
+    context = values_context(model_json)
+    for path, json_text in iter_model_elements(model_json, chunk_size):
+        try:
+            yield path, _adapter(_element_type(path)).validate_json(
+                json_text, context=context)
+        except ValidationError as error:
+            yield path, error
+
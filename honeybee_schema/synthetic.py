@@ -0,0 +1,478 @@
+"""Synthetic Models of any size that are built only from the schema objects.
+
+The Models are made of box-shaped Rooms arranged in a single-story grid where
+the walls between neighboring Rooms have reciprocal Surface boundary conditions.
+All Rooms share the same energy and radiance resources. The Model is written
+to a JSON file one Room at a time such that Models that are much larger than
+the available memory can be generated for scale testing.
+"""
+import math
+import json
+
+from .model import Room, Face, Aperture, Shade, RoomPropertiesAbridged, \
+    FacePropertiesAbridged, AperturePropertiesAbridged, ShadePropertiesAbridged
+from .geometry import Face3D
+from .boundarycondition import Outdoors, Ground, Surface
+from .energy.properties import RoomEnergyPropertiesAbridged, \
+    FaceEnergyPropertiesAbridged, ApertureEnergyPropertiesAbridged, \
+    ShadeEnergyPropertiesAbridged
+from .energy.material import EnergyMaterial, EnergyWindowMaterialSimpleGlazSys
+from .energy.construction import OpaqueConstructionAbridged, \
+    WindowConstructionAbridged, ShadeConstruction
+from .energy.constructionset import ConstructionSetAbridged, \
+    WallConstructionSetAbridged, FloorConstructionSetAbridged, \
+    RoofCeilingConstructionSetAbridged, ApertureConstructionSetAbridged
+from .energy.schedule import ScheduleTypeLimit, ScheduleDay, ScheduleRuleAbridged, \
+    ScheduleRulesetAbridged
+from .energy.load import PeopleAbridged, LightingAbridged, \
+    ElectricEquipmentAbridged, InfiltrationAbridged, SetpointAbridged
+from .energy.programtype import ProgramTypeAbridged
+from .energy.hvac.idealair import IdealAirSystemAbridged
+from .radiance.properties import RoomRadiancePropertiesAbridged, \
+    FaceRadiancePropertiesAbridged, ApertureRadiancePropertiesAbridged, \
+    ShadeRadiancePropertiesAbridged
+from .radiance.modifier import Plastic, Glass
+from .radiance.modifierset import ModifierSetAbridged, WallModifierSetAbridged, \
+    FloorModifierSetAbridged, RoofCeilingModifierSetAbridged, \
+    ApertureModifierSetAbridged, ShadeModifierSetAbridged
+from .radiance.asset import SensorGrid, Sensor
+from ._report import schema_version
+
+# identifiers of the resources shared by all Rooms
+CONSTRUCTION_SET = 'Synthetic Construction Set'
+MODIFIER_SET = 'Synthetic_Modifier_Set'
+HVAC = 'Synthetic Ideal Air'
+_FRACTIONAL = 'Fractional'
+_TEMPERATURE = 'Temperature'
+_HEATING = 'Synthetic Heating Setpoint'
+_COOLING = 'Synthetic Cooling Setpoint'
+
+
+def _face_properties():
+    return FacePropertiesAbridged(
+        energy=FaceEnergyPropertiesAbridged(),
+        radiance=FaceRadiancePropertiesAbridged()
+    )
+
+
+def _wall_points(start, direction, t_0, t_1, z_0, z_1):
+    """Get the counterclockwise vertices of a vertical rectangle along a wall."""
+    (x, y), (u, v) = start, direction
+    return [
+        [x + u * t_0, y + v * t_0, z_0], [x + u * t_1, y + v * t_1, z_0],
+        [x + u * t_1, y + v * t_1, z_1], [x + u * t_0, y + v * t_0, z_1]
+    ]
+
+
+def _outdoor_shades(aperture_id, start, direction, t_0, t_1, z_top, height, count):
+    """Get horizontal louvers that project outward from above an Aperture."""
+    (x, y), (u, v) = start, direction
+    normal_x, normal_y = v, -u  # the direction cross the Z axis
+    depth, shades = height / (count + 1), []
+    for i in range(count):
+        z = z_top - i * depth
+        p_0 = [x + u * t_0, y + v * t_0, z]
+        p_1 = [x + u * t_1, y + v * t_1, z]
+        boundary = [
+            p_0, [p_0[0] + normal_x * depth, p_0[1] + normal_y * depth, z],
+            [p_1[0] + normal_x * depth, p_1[1] + normal_y * depth, z], p_1
+        ]
+        shades.append(Shade(
+            identifier='{}_Shade_{}'.format(aperture_id, i),
+            geometry=Face3D(boundary=boundary),
+            properties=ShadePropertiesAbridged(
+                energy=ShadeEnergyPropertiesAbridged(),
+                radiance=ShadeRadiancePropertiesAbridged()
+            )
+        ))
+    return shades
+
+
+def _room(index, columns, room_count, options):
+    """Get a Room object at a given index in the grid of synthetic Rooms."""
+    width, depth, height = options['room_size']
+    divisions, aperture_count = options['wall_divisions'], options['apertures_per_face']
+    column, row = index % columns, index // columns
+    x_0, y_0 = column * width, row * depth
+    room_id = 'Room_{}'.format(index)
+
+    # walls in counterclockwise order with their start, direction and neighbor
+    walls = (
+        ((x_0, y_0), (1, 0), width, index - columns if row > 0 else None, 2),
+        ((x_0 + width, y_0), (0, 1), depth,
+         index + 1 if column + 1 < columns and index + 1 < room_count else None, 3),
+        ((x_0 + width, y_0 + depth), (-1, 0), width,
+         index + columns if index + columns < room_count else None, 0),
+        ((x_0, y_0 + depth), (0, -1), depth, index - 1 if column > 0 else None, 1)
+    )
+    faces = [
+        Face(
+            identifier='{}_Floor'.format(room_id),
+            geometry=Face3D(boundary=[
+                [x_0, y_0, 0], [x_0, y_0 + depth, 0],
+                [x_0 + width, y_0 + depth, 0], [x_0 + width, y_0, 0]
+            ]),
+            face_type='Floor', boundary_condition=Ground(),
+            properties=_face_properties()
+        ),
+        Face(
+            identifier='{}_Roof'.format(room_id),
+            geometry=Face3D(boundary=[
+                [x_0, y_0, height], [x_0 + width, y_0, height],
+                [x_0 + width, y_0 + depth, height], [x_0, y_0 + depth, height]
+            ]),
+            face_type='RoofCeiling', boundary_condition=Outdoors(),
+            properties=_face_properties()
+        )
+    ]
+    for wall_i, (start, direction, length, neighbor, neighbor_wall) in enumerate(walls):
+        segment = length / divisions
+        for seg_i in range(divisions):
+            face_id = '{}_Wall_{}_{}'.format(room_id, wall_i, seg_i)
+            t_0, t_1 = seg_i * segment, (seg_i + 1) * segment
+            geometry = Face3D(boundary=_wall_points(start, direction, t_0, t_1, 0, height))
+            if neighbor is not None:
+                adj_face = 'Room_{}_Wall_{}_{}'.format(
+                    neighbor, neighbor_wall, divisions - 1 - seg_i)
+                faces.append(Face(
+                    identifier=face_id, geometry=geometry, face_type='Wall',
+                    boundary_condition=Surface(boundary_condition_objects=[
+                        adj_face, 'Room_{}'.format(neighbor)]),
+                    properties=_face_properties()
+                ))
+                continue
+            apertures, bay = [], segment / max(aperture_count, 1)
+            for ap_i in range(aperture_count):
+                ap_id = '{}_Glz_{}'.format(face_id, ap_i)
+                a_0, a_1 = t_0 + (ap_i + 0.1) * bay, t_0 + (ap_i + 0.9) * bay
+                z_0, z_1 = 0.3 * height, 0.8 * height
+                apertures.append(Aperture(
+                    identifier=ap_id,
+                    geometry=Face3D(
+                        boundary=_wall_points(start, direction, a_0, a_1, z_0, z_1)),
+                    boundary_condition=Outdoors(),
+                    outdoor_shades=_outdoor_shades(
+                        ap_id, start, direction, a_0, a_1, z_1, z_1 - z_0,
+                        options['shades_per_aperture']) or None,
+                    properties=AperturePropertiesAbridged(
+                        energy=ApertureEnergyPropertiesAbridged(),
+                        radiance=ApertureRadiancePropertiesAbridged()
+                    )
+                ))
+            faces.append(Face(
+                identifier=face_id, geometry=geometry, face_type='Wall',
+                boundary_condition=Outdoors(), apertures=apertures or None,
+                properties=_face_properties()
+            ))
+
+    return Room(
+        identifier=room_id,
+        faces=faces,
+        properties=RoomPropertiesAbridged(
+            energy=RoomEnergyPropertiesAbridged(
+                construction_set=CONSTRUCTION_SET,
+                program_type=_program_id(index % options['program_types']),
+                hvac=HVAC
+            ),
+            radiance=RoomRadiancePropertiesAbridged(modifier_set=MODIFIER_SET)
+        )
+    )
+
+
+def _sensor_grid(index, columns, options):
+    """Get a SensorGrid over the floor of the synthetic Room at an index."""
+    width, depth, _ = options['room_size']
+    spacing = options['sensor_spacing']
+    x_0, y_0 = (index % columns) * width, (index // columns) * depth
+    count_x = max(int(width / spacing), 1)
+    count_y = max(int(depth / spacing), 1)
+    sensors = [
+        Sensor(
+            pos=[x_0 + (i + 0.5) * width / count_x, y_0 + (j + 0.5) * depth / count_y,
+                 0.8],
+            dir=[0, 0, 1]
+        )
+        for j in range(count_y) for i in range(count_x)
+    ]
+    return SensorGrid(
+        identifier='Room_{}_Grid'.format(index), sensors=sensors,
+        room_identifier='Room_{}'.format(index)
+    )
+
+
+def _program_id(index):
+    return 'Synthetic Program {}'.format(index)
+
+
+def _schedule_id(index):
+    return 'Synthetic Schedule {}'.format(index)
+
+
+def _schedules(count):
+    """Get a list of fractional ScheduleRulesets with different hours of operation."""
+    schedules = []
+    for i in range(count):
+        start, end = 6 + i % 4, 16 + i % 6
+        value = 1 - 0.5 * (i % 3) / 3
+        weekday = ScheduleDay(
+            identifier='{} Weekday'.format(_schedule_id(i)),
+            values=[0.05, value, 0.05], times=[[0, 0], [start, 0], [end, 0]]
+        )
+        weekend = ScheduleDay(
+            identifier='{} Weekend'.format(_schedule_id(i)), values=[0.05]
+        )
+        schedules.append(ScheduleRulesetAbridged(
+            identifier=_schedule_id(i),
+            day_schedules=[weekday, weekend],
+            default_day_schedule=weekend.identifier,
+            schedule_rules=[ScheduleRuleAbridged(
+                schedule_day=weekday.identifier, apply_monday=True,
+                apply_tuesday=True, apply_wednesday=True, apply_thursday=True,
+                apply_friday=True
+            )],
+            summer_designday_schedule=weekday.identifier,
+            winter_designday_schedule=weekend.identifier,
+            schedule_type_limit=_FRACTIONAL
+        ))
+    for identifier, value in ((_HEATING, 21), (_COOLING, 24)):
+        day = ScheduleDay(identifier='{} Day'.format(identifier), values=[value])
+        schedules.append(ScheduleRulesetAbridged(
+            identifier=identifier, day_schedules=[day],
+            default_day_schedule=day.identifier, schedule_type_limit=_TEMPERATURE
+        ))
+    return schedules
+
+
+def _program_types(count, schedule_count):
+    """Get a list of ProgramTypes that use the fractional schedules in turn."""
+    programs = []
+    for i in range(count):
+        program_id = _program_id(i)
+
+        def schedule(offset):
+            return _schedule_id((i + offset) % schedule_count)
+
+        programs.append(ProgramTypeAbridged(
+            identifier=program_id,
+            people=PeopleAbridged(
+                identifier='{} People'.format(program_id),
+                people_per_area=0.05 + 0.01 * (i % 5), occupancy_schedule=schedule(0)
+            ),
+            lighting=LightingAbridged(
+                identifier='{} Lighting'.format(program_id),
+                watts_per_area=8 + i % 5, schedule=schedule(1)
+            ),
+            electric_equipment=ElectricEquipmentAbridged(
+                identifier='{} Equipment'.format(program_id),
+                watts_per_area=10 + i % 5, schedule=schedule(2)
+            ),
+            infiltration=InfiltrationAbridged(
+                identifier='{} Infiltration'.format(program_id),
+                flow_per_exterior_area=0.0003, schedule=schedule(3)
+            ),
+            setpoint=SetpointAbridged(
+                identifier='{} Setpoint'.format(program_id),
+                heating_schedule=_HEATING, cooling_schedule=_COOLING
+            )
+        ))
+    return programs
+
+
+def _energy_resources(options):
+    """Get a dictionary of the lists of energy resources shared by all Rooms."""
+    materials = [
+        EnergyMaterial(identifier='Synthetic Brick', thickness=0.1, conductivity=0.9,
+                       density=1920, specific_heat=790),
+        EnergyMaterial(identifier='Synthetic Insulation', thickness=0.1,
+                       conductivity=0.03, density=43, specific_heat=1210),
+        EnergyMaterial(identifier='Synthetic Concrete', thickness=0.2,
+                       conductivity=1.95, density=2240, specific_heat=900),
+        EnergyWindowMaterialSimpleGlazSys(identifier='Synthetic Glazing',
+                                          u_factor=1.8, shgc=0.4, vt=0.6)
+    ]
+    constructions = [
+        OpaqueConstructionAbridged(
+            identifier='Synthetic Exterior Wall',
+            materials=['Synthetic Brick', 'Synthetic Insulation']),
+        OpaqueConstructionAbridged(
+            identifier='Synthetic Interior Wall', materials=['Synthetic Brick']),
+        OpaqueConstructionAbridged(
+            identifier='Synthetic Roof',
+            materials=['Synthetic Insulation', 'Synthetic Concrete']),
+        OpaqueConstructionAbridged(
+            identifier='Synthetic Slab',
+            materials=['Synthetic Concrete', 'Synthetic Insulation']),
+        WindowConstructionAbridged(
+            identifier='Synthetic Window', materials=['Synthetic Glazing']),
+        ShadeConstruction(identifier='Synthetic Shade')
+    ]
+    construction_set = ConstructionSetAbridged(
+        identifier=CONSTRUCTION_SET,
+        wall_set=WallConstructionSetAbridged(
+            exterior_construction='Synthetic Exterior Wall',
+            interior_construction='Synthetic Interior Wall',
+            ground_construction='Synthetic Slab'),
+        floor_set=FloorConstructionSetAbridged(
+            ground_construction='Synthetic Slab',
+            interior_construction='Synthetic Slab'),
+        roof_ceiling_set=RoofCeilingConstructionSetAbridged(
+            exterior_construction='Synthetic Roof'),
+        aperture_set=ApertureConstructionSetAbridged(
+            window_construction='Synthetic Window'),
+        shade_construction='Synthetic Shade'
+    )
+    type_limits = [
+        ScheduleTypeLimit(identifier=_FRACTIONAL, lower_limit=0, upper_limit=1),
+        ScheduleTypeLimit(identifier=_TEMPERATURE, lower_limit=-273.15,
+                          unit_type='Temperature')
+    ]
+    return {
+        'construction_sets': [construction_set],
+        'constructions': constructions,
+        'materials': materials,
+        'hvacs': [IdealAirSystemAbridged(identifier=HVAC)],
+        'program_types': _program_types(options['program_types'], options['schedules']),
+        'schedules': _schedules(options['schedules']),
+        'schedule_type_limits': type_limits
+    }
+
+
+def _radiance_resources():
+    """Get a dictionary of the lists of radiance resources shared by all Rooms."""
+    modifiers = [
+        Plastic(identifier='synthetic_wall', r_reflectance=0.5, g_reflectance=0.5,
+                b_reflectance=0.5),
+        Plastic(identifier='synthetic_floor', r_reflectance=0.2, g_reflectance=0.2,
+                b_reflectance=0.2),
+        Plastic(identifier='synthetic_ceiling', r_reflectance=0.8,
+                g_reflectance=0.8, b_reflectance=0.8),
+        Glass(identifier='synthetic_glass', r_transmissivity=0.65,
+              g_transmissivity=0.65, b_transmissivity=0.65),
+        Plastic(identifier='synthetic_shade', r_reflectance=0.35,
+                g_reflectance=0.35, b_reflectance=0.35)
+    ]
+    modifier_set = ModifierSetAbridged(
+        identifier=MODIFIER_SET,
+        wall_set=WallModifierSetAbridged(
+            exterior_modifier='synthetic_wall', interior_modifier='synthetic_wall'),
+        floor_set=FloorModifierSetAbridged(
+            exterior_modifier='synthetic_floor', interior_modifier='synthetic_floor'),
+        roof_ceiling_set=RoofCeilingModifierSetAbridged(
+            exterior_modifier='synthetic_ceiling',
+            interior_modifier='synthetic_ceiling'),
+        aperture_set=ApertureModifierSetAbridged(
+            window_modifier='synthetic_glass', interior_modifier='synthetic_glass',
+            skylight_modifier='synthetic_glass', operable_modifier='synthetic_glass'),
+        shade_set=ShadeModifierSetAbridged(
+            exterior_modifier='synthetic_shade', interior_modifier='synthetic_shade')
+    )
+    return {'modifiers': modifiers, 'modifier_sets': [modifier_set]}
+
+
+def _write_list(out_file, objects):
+    """Write an iterable of schema objects to a file as a JSON array."""
+    out_file.write('[')
+    for i, obj in enumerate(objects):
+        if i:
+            out_file.write(',')
+        out_file.write(obj.model_dump_json(exclude_none=True))
+    out_file.write(']')
+
+
+def _write_properties(out_file, properties_type, resources):
+    """Write a dictionary of lists of schema objects as Model extension properties."""
+    out_file.write('{{"type":{}'.format(json.dumps(properties_type)))
+    for key, objects in resources.items():
+        out_file.write(',{}:'.format(json.dumps(key)))
+        _write_list(out_file, objects)
+    out_file.write('}')
+
+
+def write_synthetic_model(
+        file_path, rooms=100, faces_per_room=6, apertures_per_face=1,
+        shades_per_aperture=1, sensor_grids=None, schedules=4, program_types=2,
+        room_size=(5, 5, 3), sensor_spacing=1.0, identifier='Synthetic_Model'):
+    """Write a synthetic Model of any size to a JSON file.
+
+    The Rooms are boxes arranged in a square grid on a single story. Walls
+    between neighboring Rooms have Surface boundary conditions that reference
+    one another while the other walls face the Outdoors and contain Apertures
+    with louvered outdoor Shades. All Rooms use the same ConstructionSet,
+    ModifierSet and HVAC and they cycle through the ProgramTypes, which in turn
+    cycle through the schedules.
+
+    Args:
+        file_path: Path to the Model JSON file to be written.
+        rooms: An integer for the number of Rooms in the Model. (Default: 100).
+        faces_per_room: An integer for the number of Faces in each Room. This
+            must be 2 (for the floor and roof) plus a multiple of 4 since each
+            of the 4 walls is divided into the same number of Faces. (Default: 6).
+        apertures_per_face: An integer for the number of Apertures in each
+            exterior wall Face. (Default: 1).
+        shades_per_aperture: An integer for the number of outdoor Shades
+            above each Aperture. (Default: 1).
+        sensor_grids: An integer for the number of SensorGrids, which are
+            assigned to the first Rooms of the Model. If None, each Room gets
+            a SensorGrid. (Default: None).
+        schedules: An integer for the number of fractional schedules that are
+            used by the loads of the ProgramTypes. (Default: 4).
+        program_types: An integer for the number of ProgramTypes. (Default: 2).
+        room_size: A tuple of three numbers for the width, depth and height of
+            each Room in meters. (Default: (5, 5, 3)).
+        sensor_spacing: A number for the distance between sensors of the
+            SensorGrids in meters. (Default: 1.0).
+        identifier: Text for the identifier of the Model. (Default: Synthetic_Model).
+
+    Returns:
+        A dictionary with the number of each type of object in the Model.
+    """
+    if faces_per_room < 6 or (faces_per_room - 2) % 4 != 0:
+        raise ValueError(
+            'faces_per_room must be 2 plus a multiple of 4. Got {}.'.format(
+                faces_per_room))
+    sensor_grids = rooms if sensor_grids is None else sensor_grids
+    if not 0 <= sensor_grids <= rooms:
+        raise ValueError('sensor_grids must be between 0 and the number of rooms.')
+    if schedules < 1 or program_types < 1:
+        raise ValueError('There must be at least one schedule and program type.')
+    options = {
+        'room_size': room_size, 'wall_divisions': (faces_per_room - 2) // 4,
+        'apertures_per_face': apertures_per_face,
+        'shades_per_aperture': shades_per_aperture, 'schedules': schedules,
+        'program_types': program_types, 'sensor_spacing': sensor_spacing
+    }
+    columns = int(math.ceil(math.sqrt(rooms)))
+    counts = {'Room': rooms, 'Face': 0, 'Aperture': 0, 'Shade': 0}
+
+    def iter_rooms():
+        for i in range(rooms):
+            room = _room(i, columns, rooms, options)
+            for face in room.faces:
+                counts['Face'] += 1
+                for aperture in face.apertures or ():
+                    counts['Aperture'] += 1
+                    counts['Shade'] += len(aperture.outdoor_shades or ())
+            yield room
+
+    energy = _energy_resources(options)
+    radiance = _radiance_resources()
+    with open(file_path, 'w', encoding='utf-8') as out_file:
+        out_file.write(
+            '{{"type":"Model","identifier":{},"version":{},"units":"Meters",'
+            '"tolerance":0.01,"angle_tolerance":1.0,"rooms":'.format(
+                json.dumps(identifier), json.dumps(schema_version())))
+        _write_list(out_file, iter_rooms())
+        out_file.write(',"properties":{"type":"ModelProperties","energy":')
+        _write_properties(out_file, 'ModelEnergyProperties', energy)
+        out_file.write(',"radiance":')
+        radiance['sensor_grids'] = (
+            _sensor_grid(i, columns, options) for i in range(sensor_grids))
+        _write_properties(out_file, 'ModelRadianceProperties', radiance)
+        out_file.write('}}')
+
+    for key, resources in energy.items():
+        counts[key] = len(resources)
+    counts['modifiers'] = len(radiance['modifiers'])
+    counts['modifier_sets'] = len(radiance['modifier_sets'])
+    counts['sensor_grids'] = sensor_grids
+    return counts
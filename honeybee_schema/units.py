@@ -0,0 +1,154 @@
+"""Conversion of the units of Models and their geometry objects.
+
+The conversion works on validated schema objects as well as on raw dictionaries
+(eg. the elements yielded by stream.iter_model_elements) such that Models can
+be converted without validating them. All of the coordinates of each list of
+points are scaled together in a single comprehension (or with a single map over
+the array of a PointArray) without rebuilding any of the objects.
+"""
+from array import array
+
+from pydantic import BaseModel
+
+from .geometry import PointArray
+
+# the number of meters in one unit of each of the Units of a Model
+UNITS_TO_METERS = {
+    'Meters': 1.0,
+    'Millimeters': 0.001,
+    'Feet': 0.3048,
+    'Inches': 0.0254,
+    'Centimeters': 0.01
+}
+# default tolerance of a Model, which is used for dictionaries without a tolerance
+DEFAULT_TOLERANCE = 0.01
+
+# keys of lists of points, single points and distances for each type of object
+_POINT_LISTS = {
+    'Face3D': ('boundary',),
+    'Mesh3D': ('vertices',)
+}
+_POINTS = {
+    'Plane': ('o',),
+    'Sensor': ('pos',),
+    'View': ('position',),
+    'DaylightingControl': ('sensor_position',)
+}
+_DISTANCES = {
+    'View': ('fore_clip', 'aft_clip')
+}
+# view types for which the h_size and v_size are distances instead of angles
+_PARALLEL_VIEW = 'l'
+
+
+def conversion_factor(from_units, to_units):
+    """Get the number by which coordinates are multiplied to change their units.
+
+    Args:
+        from_units: Text for the Units of the coordinates (eg. Feet).
+        to_units: Text for the Units to which the coordinates are converted.
+    """
+    try:
+        return UNITS_TO_METERS[from_units] / UNITS_TO_METERS[to_units]
+    except KeyError as e:
+        raise ValueError('Unknown units {}. Choose from: {}.'.format(
+            e, ', '.join(UNITS_TO_METERS)))
+
+
+def _get(obj, key):
+    return obj.get(key) if isinstance(obj, dict) else getattr(obj, key, None)
+
+
+def _set(obj, key, value):
+    if isinstance(obj, dict):
+        obj[key] = value
+    else:
+        setattr(obj, key, value)
+
+
+def _scale_points(points, factor):
+    """Get a scaled copy of a list of [x, y, z] points or of a PointArray."""
+    if isinstance(points, PointArray):
+        return PointArray(array('d', map(factor.__mul__, points.array)))
+    return [[x * factor, y * factor, z * factor] for x, y, z in points]
+
+
+def scale_geometry(obj, factor):
+    """Scale all coordinates and distances of an object and its children in place.
+
+    Args:
+        obj: A schema object or a dictionary of one (eg. a Room). Lists of
+            objects are also accepted.
+        factor: A number by which all coordinates and distances are multiplied.
+    """
+    if isinstance(obj, list):
+        for item in obj:
+            if isinstance(item, (dict, list, BaseModel)):
+                scale_geometry(item, factor)
+        return
+    if isinstance(obj, dict):
+        items = obj.items()
+    elif isinstance(obj, BaseModel):
+        items = obj.__dict__.items()
+    else:
+        return
+    obj_type = _get(obj, 'type')
+    obj_type = getattr(obj_type, 'value', obj_type)
+    point_keys = _POINT_LISTS.get(obj_type, ()) + _POINTS.get(obj_type, ())
+    for key, value in items:
+        if key not in point_keys and key != 'holes' and \
+                isinstance(value, (dict, list, BaseModel)):
+            scale_geometry(value, factor)
+
+    if obj_type in _POINT_LISTS:
+        for key in _POINT_LISTS[obj_type]:
+            _set(obj, key, _scale_points(_get(obj, key), factor))
+        if obj_type == 'Face3D' and _get(obj, 'holes'):
+            _set(obj, 'holes', [_scale_points(hole, factor)
+                                for hole in _get(obj, 'holes')])
+    elif obj_type == 'SensorGrid' and isinstance(obj, dict):
+        for sensor in obj['sensors']:  # sensor dictionaries may not have a type
+            if 'type' not in sensor:
+                sensor['pos'] = [c * factor for c in sensor['pos']]
+    for key in _POINTS.get(obj_type, ()):
+        if _get(obj, key) is not None:
+            _set(obj, key, [c * factor for c in _get(obj, key)])
+    for key in _DISTANCES.get(obj_type, ()):
+        if _get(obj, key) is not None:
+            _set(obj, key, _get(obj, key) * factor)
+    if obj_type == 'View' and getattr(_get(obj, 'view_type'), 'value',
+                                      _get(obj, 'view_type')) == _PARALLEL_VIEW:
+        for key in ('h_size', 'v_size'):
+            if _get(obj, key) is not None:
+                _set(obj, key, _get(obj, key) * factor)
+
+
+def convert_units(model, target):
+    """Convert a Model to other units in place.
+
+    All coordinates of the geometry of the Model are scaled along with the
+    positions of SensorGrid sensors, Views and DaylightingControls, the clipping
+    distances of Views and the tolerance of the Model. Directions and properties
+    that are always in SI units (eg. material thicknesses) are not changed.
+
+    Args:
+        model: A Model object or a dictionary of a Model, which does not need
+            to be validated.
+        target: Text for the Units to which the Model is converted (eg. Feet).
+
+    Returns:
+        The input Model, which has been edited in place.
+    """
+    units = _get(model, 'units') or 'Meters'
+    units = getattr(units, 'value', units)
+    factor = conversion_factor(units, target)
+    if factor != 1:
+        scale_geometry(model, factor)
+        tolerance = _get(model, 'tolerance')
+        _set(model, 'tolerance', (DEFAULT_TOLERANCE if tolerance is None else
+                                  tolerance) * factor)
+    if isinstance(model, dict):
+        model['units'] = target
+    else:
+        model.units = type(model.units)(target)
+    return model
@@ -1,7 +1,7 @@
 """Schema for the error objects returned by the validation command"""
 from typing import List, Union, Literal, Annotated
 from enum import Enum
-from pydantic import BaseModel, Field, StringConstraints
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
 
 from .geometry import Point3D, LineSegment3D, Face3D
 
@@ -51,6 +51,8 @@ class ParentTypes(str, Enum):
 
 class ValidationParent(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ValidationParent'] = 'ValidationParent'
 
     parent_type: ParentTypes = Field(
@@ -82,6 +84,8 @@ class Platforms(str, Enum):
 
 class SuggestedFix(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['SuggestedFix'] = 'SuggestedFix'
 
     platform: Platforms = Field(
@@ -106,6 +110,8 @@ class SuggestedFix(BaseModel):
 
 class ValidationError(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ValidationError'] = 'ValidationError'
 
     code: str = Field(
@@ -183,7 +189,9 @@ class ValidationError(BaseModel):
         'are involved.'
     )
 
-    helper_geometry: List[Union[Point3D, LineSegment3D, Face3D]] = Field(
+    helper_geometry: List[Annotated[
+        Union[Point3D, LineSegment3D, Face3D], Field(discriminator='type')
+    ]] = Field(
         default=None,
         description='An optional list of geometry objects that helps illustrate '
         'where exactly issues with invalid geometry exist within the Honeybee object. '
@@ -205,6 +213,8 @@ class ValidationError(BaseModel):
 
 class ValidationReport(BaseModel):
 
+    model_config = ConfigDict(defer_build=True)
+
     type: Literal['ValidationReport'] = 'ValidationReport'
 
     app_name: str = Field(
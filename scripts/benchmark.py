@@ -0,0 +1,302 @@
+"""Benchmark the parsing, validation and serialization of large Model JSON files.
+
+The benchmark runs on the Models in samples/model_large along with synthetic
+enlargements of them, which repeat all geometry objects of the Model several
+times under new identifiers while sharing the same resources. Each case is run
+in a separate process such that the peak memory of the process (RSS) can be
+recorded along with the wall time. The results are written to a JSON file
+that can be compared across releases.
+
+Usage:
+    python scripts/benchmark.py --output benchmark.json
+    python scripts/benchmark.py --scales 1 10 --cases validate_json dump_json
+"""
+import os
+import sys
+import gc
+import json
+import time
+import shutil
+import argparse
+import platform
+import datetime
+import tempfile
+import subprocess
+
+try:  # the resource module is only available on Unix
+    import resource
+except ImportError:
+    resource = None
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sample_folder = os.path.join(root_dir, 'samples', 'model_large')
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+MODELS = ('lab_building.hbjson', 'single_family_home.hbjson')
+SCALES = (1, 10, 100, 1000)
+CASES = ('parse', 'validate', 'validate_json', 'dump_json', 'round_trip', 'update_model')
+# version assigned to the enlarged Models that do not have one, which is the
+# version of the last updater such that update-model runs its full path
+UPDATE_VERSION = '1.43.5'
+
+# Model keys for the lists of geometry objects that are repeated in enlargements
+_GEOMETRY_LISTS = (
+    'rooms', 'orphaned_faces', 'orphaned_shades', 'orphaned_apertures',
+    'orphaned_doors', 'shade_meshes'
+)
+_CHILD_LISTS = (
+    ('faces', 'Face'), ('apertures', 'Aperture'), ('doors', 'Door'),
+    ('indoor_shades', 'Shade'), ('outdoor_shades', 'Shade')
+)
+_LIST_TYPES = {
+    'rooms': 'Room', 'orphaned_faces': 'Face', 'orphaned_shades': 'Shade',
+    'orphaned_apertures': 'Aperture', 'orphaned_doors': 'Door',
+    'shade_meshes': 'ShadeMesh'
+}
+
+
+def _rename(obj, suffix):
+    """Add a suffix to the identifiers of a geometry object and all of its children.
+    """
+    obj['identifier'] = obj['identifier'] + suffix
+    bc = obj.get('boundary_condition')
+    if bc is not None and bc['type'] == 'Surface':
+        bc['boundary_condition_objects'] = \
+            [identifier + suffix for identifier in bc['boundary_condition_objects']]
+    for key, _ in _CHILD_LISTS:
+        for child in obj.get(key) or ():
+            _rename(child, suffix)
+
+
+def enlarge_model(model_json, scale, output_json):
+    """Write a Model JSON with all geometry objects of a Model repeated several times.
+
+    The copies are written to the output file one object at a time such that
+    the enlarged Model is never held in memory.
+
+    Args:
+        model_json: Path to a Model JSON file.
+        scale: An integer for the number of copies of each geometry object.
+        output_json: Path to the output Model JSON file.
+    """
+    with open(model_json, encoding='utf-8') as json_file:
+        model_dict = json.load(json_file)
+    model_dict.setdefault('version', UPDATE_VERSION)
+    with open(output_json, 'w', encoding='utf-8') as out_file:
+        out_file.write('{')
+        for i, (key, value) in enumerate(model_dict.items()):
+            if i:
+                out_file.write(',')
+            out_file.write('{}:'.format(json.dumps(key)))
+            if key not in _GEOMETRY_LISTS or scale == 1:
+                out_file.write(json.dumps(value))
+                continue
+            obj_texts = [json.dumps(obj) for obj in value]
+            out_file.write('[')
+            for copy in range(scale):
+                for j, obj_text in enumerate(obj_texts):
+                    if copy or j:
+                        out_file.write(',')
+                    obj = json.loads(obj_text)
+                    if copy:
+                        _rename(obj, '_{}'.format(copy))
+                    out_file.write(json.dumps(obj))
+            out_file.write(']')
+        out_file.write('}')
+
+
+def _count_object(obj_type, obj, counts):
+    counts[obj_type] = counts.get(obj_type, 0) + 1
+    for key, child_type in _CHILD_LISTS:
+        for child in obj.get(key) or ():
+            _count_object(child_type, child, counts)
+
+
+def count_objects(model_json, scale=1):
+    """Get a dictionary with the number of each type of object in an enlarged Model.
+    """
+    with open(model_json, encoding='utf-8') as json_file:
+        model_dict = json.load(json_file)
+    counts = {}
+    for key in _GEOMETRY_LISTS:
+        for obj in model_dict.get(key) or ():
+            _count_object(_LIST_TYPES[key], obj, counts)
+    counts = {obj_type: count * scale for obj_type, count in counts.items()}
+    for ext_props in model_dict.get('properties', {}).values():
+        if not isinstance(ext_props, dict):
+            continue
+        for key, resources in ext_props.items():
+            if isinstance(resources, list):
+                counts[key] = counts.get(key, 0) + len(resources)
+    return counts
+
+
+def _peak_rss():
+    """Get the peak resident set size of the current process in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def run_case(case, model_json, repeat):
+    """Run a benchmark case in the current process and get its results.
+
+    Args:
+        case: Text for the name of the case (one of the CASES).
+        model_json: Path to a Model JSON file.
+        repeat: An integer for the number of times the case is run after a
+            first run, which includes the time to build the pydantic validators.
+
+    Returns:
+        A dictionary with the wall time of the first run in seconds, the
+        fastest wall time of the following runs, the peak RSS of the process
+        in bytes and the number of Python objects tracked by the garbage
+        collector at the end of the case.
+    """
+    from honeybee_schema.model import Model
+    with open(model_json, encoding='utf-8') as json_file:
+        model_text = json_file.read()
+
+    if case == 'parse':
+        def function():
+            return json.loads(model_text)
+    elif case == 'validate':
+        model_dict = json.loads(model_text)
+
+        def function():
+            return Model.model_validate(model_dict)
+    elif case == 'validate_json':
+        def function():
+            return Model.model_validate_json(model_text)
+    elif case == 'dump_json':
+        model = Model.model_validate_json(model_text)
+
+        def function():
+            return model.model_dump_json(exclude_unset=True)
+    elif case == 'round_trip':
+        def function():
+            model = Model.model_validate_json(model_text)
+            return Model.model_validate_json(model.model_dump_json(exclude_unset=True))
+    elif case == 'update_model':
+        from click.testing import CliRunner
+        from honeybee_schema.cli import update_model
+        del model_text
+
+        def function():
+            result = CliRunner().invoke(
+                update_model, [model_json, '--output-file', os.devnull])
+            assert result.exit_code == 0, result.output
+            return result
+    else:
+        raise ValueError('Unknown benchmark case "{}".'.format(case))
+
+    times = []
+    for _ in range(repeat + 1):
+        start = time.perf_counter()
+        result = function()
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    gc_objects = len(gc.get_objects())
+    del result
+    return {
+        'first_time': times[0],
+        'time': min(times[1:]) if repeat else times[0],
+        'peak_rss': _peak_rss(),
+        'gc_objects': gc_objects
+    }
+
+
+def _run_case_process(case, model_json, repeat):
+    """Run a benchmark case in a new process and get its results."""
+    cmd = [sys.executable, os.path.abspath(__file__), '--run-case', case, model_json,
+           '--repeat', str(repeat)]
+    process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if process.returncode != 0:
+        error = process.stderr.decode('utf-8', 'replace').strip().splitlines()
+        return {'error': error[-1] if error else 'exit code {}'.format(
+            process.returncode)}
+    return json.loads(process.stdout.decode('utf-8').strip().splitlines()[-1])
+
+
+def benchmark(models=MODELS, scales=SCALES, cases=CASES, repeat=3, folder=None):
+    """Run the benchmark cases on enlargements of Model JSON files.
+
+    Args:
+        models: A list of Model JSON file names in samples/model_large or paths
+            to Model JSON files.
+        scales: A list of integers for the enlargements of each Model.
+        cases: A list of the names of the cases to run.
+        repeat: An integer for the number of times each case is run after a
+            first run. The time of the first run and the fastest time of the
+            following runs are reported.
+        folder: An optional folder in which the enlarged Models are written.
+            If None, a temporary folder is used and deleted at the end.
+
+    Returns:
+        A dictionary of the results with one item for each Model, scale and case.
+    """
+    temp_folder = folder or tempfile.mkdtemp()
+    results = []
+    try:
+        for model in models:
+            model_json = model if os.path.isfile(model) else \
+                os.path.join(sample_folder, model)
+            model_name = os.path.splitext(os.path.basename(model_json))[0]
+            for scale in scales:
+                scaled_json = os.path.join(
+                    temp_folder, '{}_{}x.hbjson'.format(model_name, scale))
+                enlarge_model(model_json, scale, scaled_json)
+                info = {
+                    'model': model_name,
+                    'scale': scale,
+                    'size': os.path.getsize(scaled_json),
+                    'objects': count_objects(model_json, scale)
+                }
+                for case in cases:
+                    result = dict(info, case=case)
+                    result.update(_run_case_process(case, scaled_json, repeat))
+                    results.append(result)
+                    print('{} {}x {}: {}'.format(
+                        model_name, scale, case,
+                        result.get('error') or '{:.4f} s'.format(result['time'])),
+                        file=sys.stderr)
+                os.remove(scaled_json)
+    finally:
+        if folder is None:
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+    from honeybee_schema._report import schema_version
+    return {
+        'schema_version': schema_version(),
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+        'repeat': repeat,
+        'results': results
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--models', nargs='+', default=list(MODELS))
+    parser.add_argument('--scales', nargs='+', type=int, default=list(SCALES))
+    parser.add_argument('--cases', nargs='+', choices=CASES, default=list(CASES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--folder', default=None)
+    parser.add_argument('--output', default='benchmark.json')
+    parser.add_argument('--run-case', nargs=2, metavar=('CASE', 'MODEL_JSON'),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args(args)
+
+    if args.run_case:
+        print(json.dumps(run_case(args.run_case[0], args.run_case[1], args.repeat)))
+        return
+    results = benchmark(args.models, args.scales, args.cases, args.repeat, args.folder)
+    with open(args.output, 'w') as out_file:
+        json.dump(results, out_file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""Compare the validation time of tagged and untagged unions for the large samples.
+
+The resource lists of the Model properties (materials, constructions, schedules,
+modifiers, etc.) are validated once using the discriminated unions of the schema
+and once using plain unions of the same classes, which is how they were
+validated before the unions were tagged with the type field.
+
+Usage:
+    python scripts/benchmark_unions.py [model_json ...]
+"""
+import os
+import sys
+import json
+import time
+import typing
+from typing import List, Union
+
+from pydantic import TypeAdapter
+from honeybee_schema.model import Model
+from honeybee_schema.energy.properties import ModelEnergyProperties
+from honeybee_schema.radiance.properties import ModelRadianceProperties
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sample_folder = os.path.join(root_dir, 'samples', 'model_large')
+REPEAT = 7
+
+
+def _tagged_union(annotation):
+    """Get the discriminated union of a field like Union[List[X], None]."""
+    for arg in typing.get_args(annotation):
+        if typing.get_origin(arg) is list:
+            item = typing.get_args(arg)[0]
+            if typing.get_origin(item) is typing.Annotated:
+                return item
+    return None
+
+
+def _untagged_union(tagged):
+    """Get a plain union with the same members as a discriminated union."""
+    return Union[typing.get_args(typing.get_args(tagged)[0])]
+
+
+def best_time(function, *args):
+    """Get the fastest of several runs of a function in seconds."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def benchmark(model_json):
+    with open(model_json, 'r', encoding='utf-8') as f:
+        model_text = f.read()
+    model_dict = json.loads(model_text)
+    print(os.path.basename(model_json))
+
+    properties = (
+        ('energy', ModelEnergyProperties), ('radiance', ModelRadianceProperties)
+    )
+    for ext, props_class in properties:
+        ext_dict = model_dict['properties'].get(ext, {})
+        for name, field in props_class.model_fields.items():
+            tagged = _tagged_union(field.annotation)
+            items = ext_dict.get(name)
+            if tagged is None or not items:
+                continue
+            tagged_adapter = TypeAdapter(List[tagged])
+            untagged_adapter = TypeAdapter(List[_untagged_union(tagged)])
+            items_json = json.dumps(items)
+            tagged_time = best_time(tagged_adapter.validate_json, items_json)
+            untagged_time = best_time(untagged_adapter.validate_json, items_json)
+            print('  {}.{} ({} items): tagged {:.5f} s, untagged {:.5f} s'.format(
+                ext, name, len(items), tagged_time, untagged_time))
+
+    model_time = best_time(Model.model_validate_json, model_text)
+    print('  Model: {:.5f} s'.format(model_time))
+
+
+if __name__ == '__main__':
+    model_files = sys.argv[1:] or [
+        os.path.join(sample_folder, f) for f in sorted(os.listdir(sample_folder))
+        if f.endswith('.hbjson')
+    ]
+    for model_file in model_files:
+        benchmark(model_file)
@@ -0,0 +1,83 @@
+"""Test the check of the Surface boundary conditions of Models."""
+import os
+import json
+
+from honeybee_schema.checks.adjacency import check_adjacencies
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+target_folder_large = os.path.join(root, 'samples', 'model_large')
+
+
+def load_model(folder, file_name):
+    with open(os.path.join(folder, file_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def find_face(model_dict, identifier):
+    for room in model_dict['rooms']:
+        for face in room['faces']:
+            if face['identifier'] == identifier:
+                return face
+
+
+def test_check_adjacencies_valid():
+    for file_name in os.listdir(target_folder):
+        if file_name.endswith('.hbjson'):
+            assert check_adjacencies(load_model(target_folder, file_name)) == []
+    model_dict = load_model(target_folder_large, 'lab_building.hbjson')
+    assert check_adjacencies(model_dict) == []
+
+
+def test_check_adjacencies_missing():
+    model_dict = load_model(target_folder, 'model_5vertex_sub_faces_interior.hbjson')
+    back_face = find_face(model_dict, 'TinyHouseZone2_Back')
+    back_face['identifier'] = 'TinyHouseZone2_Renamed'
+
+    errors = check_adjacencies(model_dict)
+    codes = sorted((error.code, error.element_id[0]) for error in errors)
+    assert codes == [
+        ('000201', 'TinyHouseZone1_Front'),
+        ('000202', 'BackAperture'),
+        ('000202', 'BackDoor'),
+        ('000202', 'FrontAperture'),
+        ('000202', 'FrontDoor'),
+        ('000202', 'TinyHouseZone2_Renamed')
+    ]
+    missing = [error for error in errors if error.code == '000201'][0]
+    assert missing.element_type.value == 'Face'
+    assert [p.id for p in missing.parents[0]] == ['TinyHouseZone1']
+
+
+def test_check_adjacencies_not_reciprocal():
+    model_dict = load_model(target_folder, 'model_5vertex_sub_faces_interior.hbjson')
+    back_aperture = find_face(model_dict, 'TinyHouseZone2_Back')['apertures'][0]
+    back_aperture['boundary_condition'] = {'type': 'Outdoors'}
+
+    errors = check_adjacencies(model_dict)
+    assert len(errors) == 1
+    error = errors[0]
+    assert error.code == '000202'
+    assert error.element_type.value == 'Aperture'
+    assert error.element_id == ['FrontAperture', 'BackAperture']
+    assert [p.id for p in error.parents[0]] == ['TinyHouseZone1_Front', 'TinyHouseZone1']
+    assert [p.id for p in error.parents[1]] == ['TinyHouseZone2_Back', 'TinyHouseZone2']
+    assert 'does not have a Surface' in error.message
+
+
+def test_check_adjacencies_namespaces():
+    model_dict = load_model(target_folder, 'model_5vertex_sub_faces_interior.hbjson')
+    # Faces and sub-faces are separate namespaces so they can share identifiers
+    find_face(model_dict, 'TinyHouseZone2_Left')['identifier'] = 'FrontAperture'
+    assert check_adjacencies(model_dict) == []
+
+    # sub-faces that share an identifier are all checked
+    back_face = find_face(model_dict, 'TinyHouseZone2_Back')
+    back_face['doors'][0]['identifier'] = 'BackAperture'
+    errors = check_adjacencies(model_dict)
+    codes = sorted((e.code, e.element_type.value, e.element_id[0]) for e in errors)
+    assert codes == [
+        ('000201', 'Door', 'FrontDoor'),
+        ('000202', 'Door', 'BackAperture')
+    ]
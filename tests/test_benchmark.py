@@ -0,0 +1,36 @@
+"""Test the benchmark of large Model JSON files."""
+import os
+import json
+
+from honeybee_schema.model import Model
+from honeybee_schema.checks import check_model
+from scripts.benchmark import enlarge_model, count_objects, benchmark
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder_large = os.path.join(root, 'samples', 'model_large')
+
+
+def test_enlarge_model(tmp_path):
+    file_path = os.path.join(target_folder_large, 'single_family_home.hbjson')
+    enlarged_path = str(tmp_path / 'enlarged.hbjson')
+    enlarge_model(file_path, 3, enlarged_path)
+
+    with open(enlarged_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    Model.model_validate(model_dict)
+    assert check_model(model_dict).valid
+
+    counts = count_objects(file_path, 3)
+    assert len(model_dict['rooms']) == counts['Room']
+    assert counts['Room'] == 3 * count_objects(file_path)['Room']
+
+
+def test_benchmark():
+    results = benchmark(['single_family_home.hbjson'], [1], ['parse'], repeat=0)
+    assert len(results['results']) == 1
+    result = results['results'][0]
+    assert result['model'] == 'single_family_home'
+    assert result['case'] == 'parse'
+    assert result['time'] > 0
+    assert result['objects']['Room'] > 0
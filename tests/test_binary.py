@@ -0,0 +1,88 @@
+"""Test the binary sidecar files for the coordinates of Models."""
+import gc
+import os
+import json
+
+import pytest
+from honeybee_schema.binary import GeometryBuffer, model_to_binary, \
+    binary_to_model, load_binary_model, sidecar_path
+from honeybee_schema.geometry import PointArray
+from honeybee_schema.model import Model
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+
+@pytest.mark.parametrize('file_name', [
+    'model_complete_holes.hbjson',
+    'model_radiance_grid_views.hbjson',
+    'model_radiance_dynamic_states.hbjson',
+    'model_with_shade_mesh.hbjson'
+])
+def test_binary_round_trip(file_name, tmp_path):
+    model_json = os.path.join(target_folder, file_name)
+    hbjson_path = str(tmp_path / 'model.hbjson')
+    count = model_to_binary(model_json, hbjson_path)
+    assert os.path.isfile(sidecar_path(hbjson_path))
+    with GeometryBuffer(sidecar_path(hbjson_path)) as buffer:
+        assert len(buffer) == count
+
+    with open(hbjson_path, 'r', encoding='utf-8') as f:
+        assert '"boundary": {"hbbin": ' in f.read()
+
+    output_json = str(tmp_path / 'output.hbjson')
+    binary_to_model(hbjson_path, output_json)
+    with open(model_json, 'r', encoding='utf-8') as f:
+        original = json.load(f)
+    with open(output_json, 'r', encoding='utf-8') as f:
+        assert json.load(f) == original
+
+
+def _check_compact_model(model_dict, model_json):
+    """Check a Model validated with compact geometry against its original file.
+
+    This is a separate function since the first validation of a Model may keep
+    the local variables of the calling frame, which must not hold any views of
+    the buffer once it is closed.
+    """
+    model = Model.model_validate(model_dict, context={'compact_geometry': True})
+    assert isinstance(model.shade_meshes[0].geometry.vertices.array, memoryview)
+    with open(model_json, 'r', encoding='utf-8') as f:
+        original = Model.model_validate_json(f.read())
+    assert model.model_dump_json(exclude_unset=True) == \
+        original.model_dump_json(exclude_unset=True)
+
+
+def test_load_binary_model(tmp_path):
+    model_json = os.path.join(target_folder, 'model_with_shade_mesh.hbjson')
+    hbjson_path = str(tmp_path / 'model.hbjson')
+    hbbin_path = str(tmp_path / 'geometry.bin')
+    model_to_binary(model_json, hbjson_path, hbbin_path)
+
+    model_dict, buffer = load_binary_model(hbjson_path, hbbin_path)
+    assert isinstance(buffer, GeometryBuffer)
+    boundary = model_dict['rooms'][0]['faces'][0]['geometry']['boundary']
+    assert isinstance(boundary, PointArray)
+    assert isinstance(boundary.array, memoryview)  # shares the mapped file
+
+    _check_compact_model(model_dict, model_json)
+
+    del model_dict, boundary  # release the views of the buffer
+    gc.collect()
+    buffer.close()
+    assert buffer._file.closed and buffer._mmap.closed
+    model_dict, buffer = load_binary_model(hbjson_path, hbbin_path, compact=False)
+    assert buffer is None
+    assert isinstance(model_dict['rooms'][0]['faces'][0]['geometry']['boundary'], list)
+
+
+def test_geometry_buffer_invalid(tmp_path):
+    file_path = str(tmp_path / 'model.hbbin')
+    with open(file_path, 'wb') as f:
+        f.write(b'{"type": "Model"}')
+    with pytest.raises(ValueError):
+        GeometryBuffer(file_path)
+    with open(file_path, 'wb') as f:
+        f.write(b'')
+    with pytest.raises(ValueError):
+        GeometryBuffer(file_path)
@@ -0,0 +1,87 @@
+"""Test the on-disk cache of ValidationReports."""
+import os
+import shutil
+
+from honeybee_schema.cache import ValidationCache, validate_model_cached
+import honeybee_schema.cache
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+
+def test_validate_model_cached(tmp_path, monkeypatch):
+    file_path = os.path.join(target_folder, 'model_complete_single_zone_office.hbjson')
+    cache_dir = str(tmp_path / 'cache')
+    report = validate_model_cached(file_path, cache_dir, jobs=1)
+    assert report.valid
+    assert len(os.listdir(cache_dir)) == 1
+
+    def no_validation(*args, **kwargs):
+        raise AssertionError('Cached Model was validated again.')
+
+    monkeypatch.setattr(honeybee_schema.cache, 'validate_model_parallel', no_validation)
+    cached_report = validate_model_cached(file_path, cache_dir, jobs=1)
+    assert cached_report == report
+
+
+def test_validation_cache_eviction(tmp_path):
+    cache = ValidationCache(str(tmp_path / 'cache'))
+    report = validate_model_cached(
+        os.path.join(target_folder, 'model_energy_shoe_box.hbjson'), cache.directory)
+
+    keys = []
+    for i in range(3):
+        model_path = tmp_path / 'model_{}.hbjson'.format(i)
+        shutil.copy(os.path.join(target_folder, 'model_energy_shoe_box.hbjson'),
+                    model_path)
+        with open(model_path, 'a') as f:
+            f.write(' ' * (i + 1))
+        keys.append(cache.key(str(model_path)))
+    assert len(set(keys)) == 3
+
+    report_size = len(report.model_dump_json(exclude_none=True))
+    cache.max_size = report_size * 2
+    for i, key in enumerate(keys):
+        cache.set(key, report)
+        os.utime(cache._path(key), (1000 + i, 1000 + i))
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[-1]) == report
+
+    cache.clear()
+    assert os.listdir(cache.directory) == []
+
+
+def test_validation_cache_temp_files(tmp_path):
+    cache = ValidationCache(str(tmp_path / 'cache'), max_size=1000)
+    stale_path = os.path.join(cache.directory, 'stale.tmp')
+    recent_path = os.path.join(cache.directory, 'recent.tmp')
+    for path in (stale_path, recent_path):
+        with open(path, 'wb') as f:
+            f.write(b' ' * 600)
+    os.utime(stale_path, (1000, 1000))  # left behind by a crashed write
+
+    cache.evict()
+    assert sorted(os.listdir(cache.directory)) == ['recent.tmp']
+    cache.clear()
+    assert os.listdir(cache.directory) == ['recent.tmp']
+
+
+def test_validate_model_cached_external_values(tmp_path):
+    from honeybee_schema.energy.values_file import model_to_external_values, \
+        values_file_path, write_values_file, close_values_files
+    model_json = os.path.join(target_folder, 'model_energy_fixed_interval.hbjson')
+    hbjson_path = str(tmp_path / 'm.hbjson')
+    model_to_external_values(model_json, hbjson_path)
+    cache_dir = str(tmp_path / 'cache')
+    key = ValidationCache.key(hbjson_path)
+    assert validate_model_cached(hbjson_path, cache_dir, jobs=1).valid
+    close_values_files()
+
+    # rewriting the .hbval file changes the key and the cached report is not used
+    write_values_file(values_file_path(hbjson_path), [[0.0] * 100], timestep=4)
+    assert ValidationCache.key(hbjson_path) != key
+    assert not validate_model_cached(hbjson_path, cache_dir, jobs=1).valid
+    os.remove(values_file_path(hbjson_path))
+    assert not validate_model_cached(hbjson_path, cache_dir, jobs=1).valid
+    close_values_files()
@@ -3,7 +3,7 @@ import json
 import pathlib
 
 from click.testing import CliRunner
-from honeybee_schema.cli import update_model
+from honeybee_schema.cli import update_model, validate_model, check_model
 
 
 def test_update_model():
@@ -25,3 +25,25 @@ def test_update_model():
     assert updated_hvac['equipment_type'] == 'PSZAC_DCW_DHW'
 
     output_model.unlink()
+
+
+def test_validate_model():
+    input_model = './samples/model/model_complete_single_zone_office.hbjson'
+    runner = CliRunner()
+    result = runner.invoke(validate_model, [input_model, '--jobs', '1'])
+    assert result.exit_code == 0
+
+    report = json.loads(result.output)
+    assert report['type'] == 'ValidationReport'
+    assert report['valid']
+
+
+def test_check_model():
+    input_model = './samples/model/model_complete_patient_room.hbjson'
+    runner = CliRunner()
+    result = runner.invoke(check_model, [input_model])
+    assert result.exit_code == 0
+
+    report = json.loads(result.output)
+    assert not report['valid']
+    assert [error['code'] for error in report['errors']] == ['020005']
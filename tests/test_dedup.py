@@ -0,0 +1,101 @@
+"""Test the deduplication of the schedules of Models."""
+import os
+import json
+import copy
+
+from honeybee_schema.model import Model
+from honeybee_schema.checks.references import check_references
+from honeybee_schema.energy.schedule import EncodedValues
+from honeybee_schema.dedup import canonical_day, canonical_schedule, \
+    deduplicate_schedules
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+
+def load_model(file_name):
+    with open(os.path.join(target_folder, file_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def copy_schedule(schedule, identifier):
+    """Get a copy of a schedule with new identifiers for it and its day schedules."""
+    new_schedule = copy.deepcopy(schedule)
+    new_schedule['identifier'] = identifier
+    if 'day_schedules' in new_schedule:
+        text = json.dumps(new_schedule).replace(
+            schedule['identifier'], identifier)
+        new_schedule = json.loads(text)
+    return new_schedule
+
+
+def test_canonical_day():
+    day = {'type': 'ScheduleDay', 'identifier': 'Day', 'values': [0, 0, 1],
+           'times': [[0, 0], [6, 0], [9, 0]]}
+    same_day = {'type': 'ScheduleDay', 'identifier': 'Other Day', 'values': [0.0, 1.0],
+                'times': [[0, 0], [9, 0]], 'interpolate': False}
+    assert canonical_day(day) == canonical_day(same_day)
+    day['interpolate'] = True
+    assert canonical_day(day) != canonical_day(same_day)
+
+
+def test_canonical_fixed_interval():
+    schedule = {'type': 'ScheduleFixedIntervalAbridged', 'identifier': 'Fixed',
+                'values': [float(i % 24) for i in range(48)]}
+    encoded = dict(schedule, identifier='Encoded', values=EncodedValues.encode(
+        schedule['values']).model_dump())
+    assert canonical_schedule(schedule) == canonical_schedule(encoded)
+    leap_year = dict(schedule, start_date=[1, 1, 1])
+    assert canonical_schedule(schedule) != canonical_schedule(leap_year)
+
+
+def test_deduplicate_schedules():
+    model_dict = load_model('model_complete_office_floor.hbjson')
+    energy = model_dict['properties']['energy']
+    schedule_count = len(energy['schedules'])
+    lighting = energy['schedules'][1]
+    assert lighting['identifier'] == 'Generic Office Lighting'
+
+    # add copies of the lighting schedule that are referenced by the model
+    energy['schedules'].append(copy_schedule(lighting, 'Lighting Copy'))
+    energy['schedules'].append(copy_schedule(lighting, 'Lighting Copy 2'))
+    energy['program_types'][0]['lighting']['schedule'] = 'Lighting Copy'
+    room = model_dict['rooms'][0]
+    room['properties']['energy']['lighting'] = dict(
+        energy['program_types'][0]['lighting'], identifier='Room Lighting',
+        schedule='Lighting Copy 2')
+    changed = copy_schedule(lighting, 'Lighting Changed')
+    changed['schedule_type_limit'] = None
+    energy['schedules'].append(changed)
+
+    renamed = deduplicate_schedules(model_dict)
+    assert renamed == {'Lighting Copy': 'Generic Office Lighting',
+                       'Lighting Copy 2': 'Generic Office Lighting'}
+    assert len(energy['schedules']) == schedule_count + 1
+    assert energy['program_types'][0]['lighting']['schedule'] == \
+        'Generic Office Lighting'
+    assert room['properties']['energy']['lighting']['schedule'] == \
+        'Generic Office Lighting'
+    assert check_references(model_dict) == []
+    Model.model_validate(model_dict)
+    assert deduplicate_schedules(model_dict) == {}
+
+
+def test_deduplicate_day_schedules():
+    model_dict = load_model('model_complete_office_floor.hbjson')
+    schedule = model_dict['properties']['energy']['schedules'][0]
+    day = copy.deepcopy(schedule['day_schedules'][0])
+    day['identifier'] = 'Day Copy'
+    schedule['day_schedules'].append(day)
+    schedule['schedule_rules'][0]['schedule_day'] = 'Day Copy'
+    schedule['holiday_schedule'] = 'Day Copy'
+    original = schedule['day_schedules'][0]['identifier']
+
+    assert deduplicate_schedules(model_dict) == {}
+    day_ids = [day['identifier'] for day in schedule['day_schedules']]
+    assert 'Day Copy' not in day_ids
+    days = [json.dumps(canonical_day(day)) for day in schedule['day_schedules']]
+    assert len(set(days)) == len(days)
+    assert schedule['schedule_rules'][0]['schedule_day'] == original
+    assert schedule['holiday_schedule'] == original
+    assert check_references(model_dict) == []
@@ -0,0 +1,71 @@
+"""Test the check of the planarity, area and vertices of the Face3Ds of Models."""
+import os
+import json
+
+from honeybee_schema.checks.geometry import check_face_geometry, \
+    NON_PLANAR_CODE, ZERO_AREA_CODE, DUPLICATE_VERTEX_CODE
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+target_folder_large = os.path.join(root, 'samples', 'model_large')
+
+
+def load_model(folder, file_name):
+    with open(os.path.join(folder, file_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_check_face_geometry_valid():
+    for file_name in os.listdir(target_folder):
+        if file_name.endswith('.hbjson'):
+            assert check_face_geometry(load_model(target_folder, file_name)) == []
+    model_dict = load_model(target_folder_large, 'lab_building.hbjson')
+    assert check_face_geometry(model_dict) == []
+
+
+def test_check_face_geometry_invalid():
+    model_dict = load_model(target_folder, 'model_complete_holes.hbjson')
+    faces = model_dict['rooms'][0]['faces']
+    faces[0]['geometry'] = {  # one vertex is out of the plane of the others
+        'type': 'Face3D', 'boundary': [[0, 0, 0], [4, 0, 0], [4, 4, 1], [0, 4, 0]]
+    }
+    faces[1]['geometry'] = {  # the second vertex is a duplicate of the first
+        'type': 'Face3D',
+        'boundary': [[0, 0, 0], [0.001, 0, 0], [4, 0, 0], [4, 4, 0], [0, 4, 0]]
+    }
+    faces[2]['geometry'] = {  # a sliver that is thinner than the tolerance
+        'type': 'Face3D', 'boundary': [[0, 0, 0], [4, 0, 0], [2, 0.005, 0]]
+    }
+
+    errors = check_face_geometry(model_dict)
+    codes = [(error.code, error.element_id[0]) for error in errors]
+    assert codes == [
+        (NON_PLANAR_CODE, faces[0]['identifier']),
+        (DUPLICATE_VERTEX_CODE, faces[1]['identifier']),
+        (ZERO_AREA_CODE, faces[2]['identifier'])
+    ]
+    assert len(errors[0].helper_geometry) == 4
+    assert errors[0].helper_geometry[0].type == 'Point3D'
+    assert errors[1].helper_geometry[0].x == 0.001
+    assert errors[0].parents[0][0].id == model_dict['rooms'][0]['identifier']
+    assert errors[2].helper_geometry[0].type == 'Face3D'
+
+    model_dict['tolerance'] = 0
+    assert check_face_geometry(model_dict) == []
+
+
+def test_check_face_geometry_thin():
+    model_dict = load_model(target_folder, 'model_complete_holes.hbjson')
+    faces = model_dict['rooms'][0]['faces']
+    faces[0]['geometry'] = {  # a long and thin sill that is wider than the tolerance
+        'type': 'Face3D',
+        'boundary': [[0, 0, 0], [20, 0, 0], [20, 0.05, 0], [0, 0.05, 0]]
+    }
+    assert check_face_geometry(model_dict) == []
+    faces[0]['geometry']['boundary'] = \
+        [[0, 0, 0], [0.005, 0, 0], [0.005, 0.005, 0], [0, 0.005, 0]]
+    model_dict['tolerance'] = 0.001
+    assert check_face_geometry(model_dict) == []
+    model_dict['tolerance'] = 0.01
+    assert ZERO_AREA_CODE in [e.code for e in check_face_geometry(model_dict)]
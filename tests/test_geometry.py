@@ -0,0 +1,100 @@
+"""Test the compact storage of the coordinates of Face3Ds and Mesh3Ds."""
+import os
+import copy
+import pickle
+
+import pytest
+from pydantic import ValidationError
+from honeybee_schema.geometry import Face3D, Mesh3D, PointArray
+from honeybee_schema.model import Model
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+compact = {'compact_geometry': True}
+
+
+@pytest.mark.parametrize('file_name', sorted(os.listdir(target_folder)))
+def test_compact_model_json(file_name):
+    with open(os.path.join(target_folder, file_name), 'r', encoding='utf-8') as f:
+        model_json = f.read()
+    model = Model.model_validate_json(model_json)
+    compact_model = Model.model_validate_json(model_json, context=compact)
+    assert compact_model.model_dump_json(exclude_unset=True) == \
+        model.model_dump_json(exclude_unset=True)
+    assert compact_model.model_dump(exclude_unset=True) == \
+        model.model_dump(exclude_unset=True)
+
+
+def test_compact_face3d():
+    data = {
+        'boundary': [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]],
+        'holes': [[[2, 2, 0], [4, 2, 0], [4, 4, 0]]]
+    }
+    face = Face3D.model_validate(data, context=compact)
+    assert isinstance(face.boundary, PointArray)
+    assert isinstance(face.holes[0], PointArray)
+    assert len(face.boundary) == 4
+    assert face.boundary[1] == [10.0, 0.0, 0.0]
+    assert face.boundary[-1] == [0.0, 10.0, 0.0]
+    assert face.boundary == data['boundary']
+    assert face.model_dump(exclude_unset=True) == \
+        Face3D.model_validate(data).model_dump(exclude_unset=True)
+
+    assert pickle.loads(pickle.dumps(face)) == face
+    assert copy.deepcopy(face) == face
+    # compact objects can be validated again without compact geometry
+    assert isinstance(Face3D.model_validate(face.model_dump()).boundary, list)
+    assert Face3D(boundary=face.boundary).boundary == data['boundary']
+
+
+def test_compact_mesh3d():
+    data = {
+        'vertices': [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]],
+        'faces': [[0, 1, 2, 3]]
+    }
+    mesh = Mesh3D.model_validate(data, context=compact)
+    assert isinstance(mesh.vertices, PointArray)
+    assert mesh.vertices.array.tolist() == \
+        [0, 0, 0, 10, 0, 0, 10, 10, 0, 0, 10, 0]
+    assert mesh.model_dump_json() == Mesh3D.model_validate(data).model_dump_json()
+
+
+@pytest.mark.parametrize('boundary', [
+    [[0, 0, 0], [10, 0, 0]],
+    [[0, 0, 0], [10, 0], [10, 10, 0]],
+    [[0, 0, 0], [10, 0, 0, 0], [10, 10, 0]],
+    [[0, 0, 0], [10, 'a', 0], [10, 10, 0]],
+    [[0, 0, 0], 10, [10, 10, 0]],
+    'boundary'
+])
+def test_compact_face3d_invalid(boundary):
+    with pytest.raises(ValidationError):
+        Face3D.model_validate({'boundary': boundary})
+    with pytest.raises(ValidationError):
+        Face3D.model_validate({'boundary': boundary}, context=compact)
+
+
+def test_mesh3d_face_indices():
+    data = {
+        'vertices': [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]],
+        'faces': [[0, 1, 2], [0, 2, 4]]
+    }
+    with pytest.raises(ValidationError) as exc_info:
+        Mesh3D.model_validate(data)
+    assert 'face 1 [0, 2, 4]' in str(exc_info.value)
+    data['faces'][1][2] = 3
+    Mesh3D.model_validate(data)
+
+
+def test_mesh3d_colors():
+    data = {
+        'vertices': [[0, 0, 0], [10, 0, 0], [10, 10, 0], [0, 10, 0]],
+        'faces': [[0, 1, 2], [0, 2, 3]],
+        'colors': [{'r': 255, 'g': 0, 'b': 0}] * 2
+    }
+    Mesh3D.model_validate(data)  # one color per face
+    data['colors'] = [{'r': 255, 'g': 0, 'b': 0}] * 4
+    Mesh3D.model_validate(data)  # one color per vertex
+    data['colors'] = [{'r': 255, 'g': 0, 'b': 0}] * 3
+    with pytest.raises(ValidationError):
+        Mesh3D.model_validate(data)
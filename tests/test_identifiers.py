@@ -0,0 +1,66 @@
+"""Test the check of duplicate identifiers in Models."""
+import os
+import json
+
+from honeybee_schema.checks.identifiers import check_duplicate_identifiers
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+target_folder_large = os.path.join(root, 'samples', 'model_large')
+
+
+def load_model(folder, file_name):
+    with open(os.path.join(folder, file_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_check_duplicate_identifiers_valid():
+    for file_name in os.listdir(target_folder):
+        if file_name.endswith('.hbjson') and 'patient_room' not in file_name:
+            model_dict = load_model(target_folder, file_name)
+            assert check_duplicate_identifiers(model_dict) == []
+    model_dict = load_model(target_folder_large, 'lab_building.hbjson')
+    assert check_duplicate_identifiers(model_dict) == []
+
+
+def test_check_duplicate_identifiers_schedules():
+    model_dict = load_model(target_folder, 'model_complete_patient_room.hbjson')
+    errors = check_duplicate_identifiers(model_dict)
+    assert len(errors) == 1
+    assert errors[0].code == '020005'
+    assert errors[0].element_type.value == 'Schedule'
+    assert errors[0].extension_type.value == 'Energy'
+    assert len(errors[0].element_id) == 2
+
+
+def test_check_duplicate_identifiers_geometry():
+    model_dict = load_model(target_folder, 'model_5vertex_sub_faces_interior.hbjson')
+    room_1, room_2 = model_dict['rooms']
+    room_2['faces'][0]['identifier'] = room_1['faces'][0]['identifier']
+    front_face = [f for f in room_1['faces'] if f.get('apertures')][0]
+    front_face['doors'][0]['identifier'] = front_face['apertures'][0]['identifier']
+
+    errors = check_duplicate_identifiers(model_dict)
+    assert len(errors) == 2
+    sub_face_error = [e for e in errors if e.code == '000002'][0]
+    assert sub_face_error.element_type.value == 'SubFace'
+    assert sub_face_error.top_parents is None
+
+    face_error = [e for e in errors if e.code == '000003'][0]
+    assert face_error.element_type.value == 'Face'
+    assert [p[0].id for p in face_error.parents] == \
+        [room_1['identifier'], room_2['identifier']]
+    assert [p.id for p in face_error.top_parents] == \
+        [room_1['identifier'], room_2['identifier']]
+
+
+def test_check_duplicate_identifiers_many_objects():
+    shades = [{'type': 'Shade', 'identifier': 'shade_{}'.format(i)}
+              for i in range(100000)]
+    shades.append({'type': 'Shade', 'identifier': 'shade_12345'})
+    model_dict = {'type': 'Model', 'identifier': 'many_shades',
+                  'orphaned_shades': shades, 'properties': {}}
+    errors = check_duplicate_identifiers(model_dict)
+    assert len(errors) == 1
+    assert errors[0].element_id == ['shade_12345', 'shade_12345']
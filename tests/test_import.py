@@ -0,0 +1,68 @@
+"""Test the lazy loading of honeybee_schema and the modules loaded by its imports."""
+import sys
+import subprocess
+
+# heavy modules (and their submodules) that must not be loaded by importing a module
+EXCLUDED_MODULES = {
+    'honeybee_schema': (
+        'honeybee_schema._base', 'honeybee_schema.model', 'honeybee_schema.energy',
+        'honeybee_schema.radiance'),
+    'honeybee_schema.validation': (
+        'honeybee_schema.model', 'honeybee_schema.energy', 'honeybee_schema.radiance',
+        'honeybee_standards'),
+    'honeybee_schema.energy.simulation': (
+        'honeybee_schema.model', 'honeybee_schema.energy.properties',
+        'honeybee_schema.radiance', 'honeybee_standards'),
+    'honeybee_schema.model': (
+        'honeybee_schema.checks', 'honeybee_schema.stream', 'honeybee_schema.parallel',
+        'honeybee_schema.comparison', 'honeybee_schema.cli')
+}
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_lazy_package_import():
+    loaded = _run(
+        'import sys, honeybee_schema, honeybee_schema.energy\n'
+        'print(sorted(m for m in sys.modules if m.startswith("honeybee_schema")))'
+    )
+    assert loaded == "['honeybee_schema', 'honeybee_schema._lazy', " \
+        "'honeybee_schema.energy']"
+
+
+def test_lazy_class_access():
+    import honeybee_schema
+    import honeybee_schema.energy
+    import honeybee_schema.radiance
+    from honeybee_schema.model import Model
+    from honeybee_schema.energy.simulation import SimulationParameter
+    from honeybee_schema.radiance.asset import SensorGrid
+
+    assert honeybee_schema.Model is Model
+    assert honeybee_schema.energy.SimulationParameter is SimulationParameter
+    assert honeybee_schema.radiance.SensorGrid is SensorGrid
+    assert 'ValidationReport' in dir(honeybee_schema)
+
+
+def test_validation_import_excludes_model():
+    loaded = _run(
+        'import sys, honeybee_schema.validation\n'
+        'print(any(m.startswith(("honeybee_schema.energy", "honeybee_schema.model"))'
+        ' for m in sys.modules))'
+    )
+    assert loaded == 'False'
+
+
+def test_import_excluded_modules():
+    for module, excluded in EXCLUDED_MODULES.items():
+        loaded = _run(
+            'import sys, {}\n'
+            'print("\\n".join(sys.modules))'.format(module)).split('\n')
+        heavy = [m for m in loaded
+                 if any(m == x or m.startswith(x + '.') for x in excluded)]
+        assert heavy == [], \
+            'Importing {} loaded the modules {}.'.format(module, ', '.join(heavy))
@@ -0,0 +1,71 @@
+"""Test the validation of Model JSON files across several processes."""
+import os
+import json
+
+from honeybee_schema.parallel import validate_model_parallel
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+target_folder_large = os.path.join(root, 'samples', 'model_large')
+
+
+def test_validate_model_parallel_valid():
+    file_path = os.path.join(target_folder_large, 'lab_building.hbjson')
+    report = validate_model_parallel(file_path, jobs=2, batch_size=65536)
+    assert report.valid
+    assert report.errors == []
+    assert report.fatal_error == ''
+
+
+def test_validate_model_parallel_invalid(tmp_path):
+    file_path = os.path.join(target_folder, 'model_complete_multi_zone_office.hbjson')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    room = model_dict['rooms'][1]
+    face = room['faces'][0]
+    face['apertures'] = [{
+        'type': 'Aperture',
+        'identifier': 'Bad_Aperture',
+        'geometry': {'type': 'Face3D', 'boundary': [[0, 0, 0], [1, 0, 0]]},
+        'boundary_condition': {'type': 'Outdoors'},
+        'properties': {'type': 'AperturePropertiesAbridged'}
+    }]
+    model_dict['rooms'][2]['multiplier'] = 0
+    model_dict['properties']['energy']['schedules'][0]['identifier'] = 'Bad,Schedule'
+    invalid_path = tmp_path / 'invalid_model.hbjson'
+    invalid_path.write_text(json.dumps(model_dict))
+
+    for jobs in (1, 2):
+        report = validate_model_parallel(str(invalid_path), jobs=jobs, batch_size=1)
+        assert not report.valid
+        errors = {(e.element_type.value, e.element_id[0]): e for e in report.errors}
+        assert len(errors) == 3
+
+        aperture_error = errors[('Aperture', 'Bad_Aperture')]
+        parents = aperture_error.parents[0]
+        assert [p.parent_type.value for p in parents] == ['Face', 'Room']
+        assert [p.id for p in parents] == [face['identifier'], room['identifier']]
+
+        room_error = errors[('Room', model_dict['rooms'][2]['identifier'])]
+        assert room_error.parents is None
+        assert room_error.extension_type.value == 'Core'
+        schedule_error = errors[('Schedule', 'schedules[0]')]
+        assert schedule_error.extension_type.value == 'Energy'
+
+
+def test_validate_model_parallel_truncated(tmp_path):
+    file_path = os.path.join(target_folder, 'model_complete_multi_zone_office.hbjson')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    model_dict['rooms'][0]['multiplier'] = 0
+    model_json = json.dumps(model_dict)
+    truncated_path = tmp_path / 'truncated_model.hbjson'  # cut in the last Room
+    truncated_path.write_text(model_json[:-50])
+
+    for jobs in (1, 2):  # the errors found before the end of the file are kept
+        report = validate_model_parallel(str(truncated_path), jobs=jobs, batch_size=1)
+        assert not report.valid
+        assert 'end of the JSON file' in report.fatal_error
+        assert [e.element_id[0] for e in report.errors] == \
+            [model_dict['rooms'][0]['identifier']]
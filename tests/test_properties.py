@@ -2,6 +2,9 @@ from honeybee_schema.radiance.properties import FaceRadiancePropertiesAbridged,
     RoomRadiancePropertiesAbridged, ModelRadianceProperties
 from honeybee_schema.energy.properties import ModelEnergyProperties
 
+from pydantic import ValidationError
+import pytest
+
 import os
 import json
 
@@ -35,3 +38,29 @@ def test_model_energy_properties_office():
     file_path = os.path.join(target_folder_prop, 'model_energy_properties_office.json')
     with open(file_path, 'r', encoding='utf-8') as f:
         ModelEnergyProperties.model_validate_json(f.read())
+
+
+def test_model_energy_properties_tagged_errors():
+    file_path = os.path.join(target_folder, 'model_complete_multi_zone_office.hbjson')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        energy_props = json.load(f)['properties']['energy']
+    material = next(m for m in energy_props['materials']
+                    if m['type'] == 'EnergyMaterial')
+    material['thickness'] = -1
+    with pytest.raises(ValidationError) as error:
+        ModelEnergyProperties.model_validate(energy_props)
+    errors = error.value.errors()
+    assert len(errors) == 1
+    assert errors[0]['loc'][-2:] == ('EnergyMaterial', 'thickness')
+
+
+def test_model_radiance_properties_tagged_errors():
+    rad_props = {
+        'type': 'ModelRadianceProperties',
+        'modifiers': [{'type': 'NotAModifier', 'identifier': 'generic_modifier'}]
+    }
+    with pytest.raises(ValidationError) as error:
+        ModelRadianceProperties.model_validate(rad_props)
+    errors = error.value.errors()
+    assert len(errors) == 1
+    assert errors[0]['type'] == 'union_tag_invalid'
@@ -0,0 +1,65 @@
+"""Test the check of the resource identifiers referenced in Models."""
+import os
+import json
+
+from honeybee_schema.checks.references import check_references
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+target_folder_large = os.path.join(root, 'samples', 'model_large')
+
+
+def load_model(folder, file_name):
+    with open(os.path.join(folder, file_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_check_references_valid():
+    for file_name in os.listdir(target_folder):
+        if file_name.endswith('.hbjson'):
+            assert check_references(load_model(target_folder, file_name)) == []
+    model_dict = load_model(target_folder_large, 'lab_building.hbjson')
+    assert check_references(model_dict) == []
+
+
+def test_check_references_missing():
+    model_dict = load_model(target_folder, 'model_complete_multi_zone_office.hbjson')
+    energy = model_dict['properties']['energy']
+    energy['materials'] = [m for m in energy['materials'] if m['identifier'] != 'PolyIso']
+    room = model_dict['rooms'][0]
+    room['properties']['energy']['program_type'] = 'Missing Program'
+    face = room['faces'][0]
+    face['properties']['energy']['construction'] = 'Missing Construction'
+
+    errors = check_references(model_dict)
+    assert len(errors) == 3
+    codes = {error.element_id[0]: error for error in errors}
+
+    room_error = codes['First_Floor']
+    assert room_error.code == '020016'
+    assert room_error.element_type.value == 'Room'
+    assert room_error.extension_type.value == 'Energy'
+    assert room_error.parents is None
+
+    face_error = codes['First_Floor_Bottom']
+    assert face_error.code == '020012'
+    assert face_error.element_type.value == 'Face'
+    assert [p.id for p in face_error.parents[0]] == ['First_Floor']
+    assert 'Missing Construction' in face_error.message
+
+    construction_error = codes['Attic Roof Construction']
+    assert construction_error.code == '020011'
+    assert construction_error.element_type.value == 'Construction'
+    assert 'materials.1' in construction_error.message
+
+
+def test_check_references_day_schedules():
+    model_dict = load_model(target_folder, 'model_complete_multi_zone_office.hbjson')
+    schedule = model_dict['properties']['energy']['schedules'][0]
+    schedule['default_day_schedule'] = 'Missing Day'
+
+    errors = check_references(model_dict)
+    assert len(errors) == 1
+    assert errors[0].code == '020019'
+    assert errors[0].element_id == [schedule['identifier']]
@@ -0,0 +1,143 @@
+"""Test the resolution of the constructions of Faces, Apertures and Doors."""
+import os
+import json
+import copy
+
+import pytest
+from honeybee_schema.model import Model
+from honeybee_schema.energy.resolver import ConstructionResolver, \
+    resolve_constructions, SLOTS
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+CONSTRUCTION_SET = {
+    'type': 'ConstructionSetAbridged', 'identifier': 'Custom Set',
+    'wall_set': {'type': 'WallConstructionSetAbridged',
+                 'exterior_construction': 'Custom Wall'},
+    'aperture_set': {'type': 'ApertureConstructionSetAbridged',
+                     'operable_construction': 'Custom Operable'},
+    'door_set': {'type': 'DoorConstructionSetAbridged',
+                 'exterior_glass_construction': 'Custom Glass Door'}
+}
+
+
+def _model_dict():
+    with open(os.path.join(target_folder, 'model_complete_single_zone_office.hbjson'),
+              'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_construction_resolver():
+    resolver = ConstructionResolver([CONSTRUCTION_SET])
+    assert resolver.construction(None, 'Face', 'Wall', 'Outdoors') == \
+        'Generic Exterior Wall'
+    assert resolver.construction('Custom Set', 'Face', 'Wall', 'Outdoors') == \
+        'Custom Wall'
+    assert resolver.construction('Custom Set', 'Face', 'Wall', 'Adiabatic') == \
+        'Generic Interior Wall'
+    assert resolver.construction('Custom Set', 'Face', 'Floor', 'Ground') == \
+        'Generic Ground Slab'
+    assert resolver.construction('Custom Set', 'Face', 'AirBoundary', 'Surface') == \
+        'Generic Air Boundary'
+    assert resolver.construction('Custom Set', 'Aperture', 'Wall', 'Outdoors') == \
+        'Generic Double Pane'
+    assert resolver.construction('Custom Set', 'Aperture', 'Wall', 'Outdoors', True) \
+        == 'Custom Operable'
+    assert resolver.construction('Custom Set', 'Aperture', 'Wall', 'Surface', True) \
+        == 'Generic Single Pane'
+    assert resolver.construction('Custom Set', 'Door', 'RoofCeiling', 'Outdoors') == \
+        'Generic Exterior Door'
+    assert resolver.construction('Custom Set', 'Door', 'Wall', 'Outdoors', True) == \
+        'Custom Glass Door'
+    assert all(resolver.construction(None, *slot) for slot in SLOTS)
+
+    with pytest.raises(ValueError):
+        resolver.construction('Missing Set', 'Face', 'Wall', 'Outdoors')
+    with pytest.raises(ValueError):
+        resolver.construction(None, 'Shade', 'Wall', 'Outdoors')
+    for boundary_condition in ('Ground', 'Adiabatic', 'OtherSideTemperature'):
+        with pytest.raises(ValueError):
+            resolver.construction(None, 'Aperture', 'Wall', boundary_condition)
+        with pytest.raises(ValueError):
+            resolver.construction(None, 'Door', 'Wall', boundary_condition, True)
+
+
+def test_construction_resolver_update():
+    resolver = ConstructionResolver([CONSTRUCTION_SET])
+    assert resolver.construction('Custom Set', 'Face', 'Wall', 'Outdoors') == \
+        'Custom Wall'
+    assert resolver.update([CONSTRUCTION_SET]) == []
+
+    changed = copy.deepcopy(CONSTRUCTION_SET)
+    changed['wall_set']['exterior_construction'] = 'Other Wall'
+    assert resolver.update([changed]) == ['Custom Set']
+    assert resolver.construction('Custom Set', 'Face', 'Wall', 'Outdoors') == \
+        'Other Wall'
+
+    # a different global construction set invalidates all ConstructionSets
+    global_set = {'wall_set': {'exterior_construction': 'Global Wall'},
+                  'aperture_set': {'window_construction': 'Global Window'}}
+    assert set(resolver.update([changed], global_set)) == {None, 'Custom Set'}
+    assert resolver.construction('Custom Set', 'Face', 'Wall', 'Outdoors') == \
+        'Other Wall'
+    assert resolver.construction('Custom Set', 'Aperture', 'Wall', 'Outdoors') == \
+        'Global Window'
+
+    assert set(resolver.update()) == {None, 'Custom Set'}
+    with pytest.raises(ValueError):
+        resolver.construction('Custom Set', 'Face', 'Wall', 'Outdoors')
+
+
+def test_resolve_constructions():
+    model_dict = _model_dict()
+    results = resolve_constructions(model_dict)
+    assert len(results) == 9
+    assert results[('Face', 'Tiny_House_Office_Bottom')] == 'Thermal Mass Floor'
+    assert results[('Face', 'Tiny_House_Office_Top')] == 'Generic Roof'
+    assert results[('Aperture', 'Front_Aperture')] == 'Triple Pane Window'
+    assert results[('Aperture', 'Tiny_House_Office_Back_Glz0')] == \
+        'Generic Double Pane'
+    assert results[('Door', 'Front_Door')] == 'Generic Exterior Door'
+
+    # assign a ConstructionSet to the Room and reuse the resolver
+    model_dict['properties']['energy']['construction_sets'] = [CONSTRUCTION_SET]
+    room = model_dict['rooms'][0]
+    room['properties']['energy']['construction_set'] = 'Custom Set'
+    room['faces'][3]['apertures'][0]['is_operable'] = True
+    resolver = ConstructionResolver()
+    results = resolve_constructions(model_dict, resolver)
+    assert results[('Face', 'Tiny_House_Office_Right')] == 'Custom Wall'
+    assert results[('Face', 'Tiny_House_Office_Bottom')] == 'Thermal Mass Floor'
+    assert results[('Aperture', 'Tiny_House_Office_Back_Glz0')] == 'Custom Operable'
+    assert results[('Aperture', 'Front_Aperture')] == 'Triple Pane Window'
+
+    model_dict['properties']['energy']['construction_sets'] = []
+    with pytest.raises(ValueError):
+        resolve_constructions(model_dict, resolver)
+
+
+def test_resolve_constructions_model_objects():
+    model_dict = _model_dict()
+    model = Model.model_validate(model_dict)
+    energy = model.properties.energy
+    resolver = ConstructionResolver(energy.construction_sets,
+                                    energy.global_construction_set)
+    assert resolver.resolve(model_dict) == resolve_constructions(model_dict)
+
+
+def test_resolve_constructions_namespaces():
+    model_dict = _model_dict()
+    room = model_dict['rooms'][0]
+    aperture = room['faces'][3]['apertures'][0]
+    # a Face and an Aperture can share an identifier
+    aperture['identifier'] = room['faces'][0]['identifier']
+    results = resolve_constructions(model_dict)
+    assert len(results) == 9
+    assert results[('Face', aperture['identifier'])] != \
+        results[('Aperture', aperture['identifier'])]
+
+    # sub-faces cannot have Ground, Adiabatic or OtherSideTemperature boundaries
+    aperture['boundary_condition'] = {'type': 'Adiabatic'}
+    with pytest.raises(ValueError):
+        resolve_constructions(model_dict)
@@ -1,5 +1,8 @@
 from honeybee_schema.energy.schedule import ScheduleRulesetAbridged, \
-    ScheduleFixedIntervalAbridged
+    ScheduleFixedIntervalAbridged, EncodedValues
+from pydantic import ValidationError
+import pytest
+import json
 import os
 
 # target folder where all of the samples live
@@ -54,3 +57,44 @@ def test_fixedinterval_leap_year():
         target_folder, 'schedule_fixedinterval_leap_year.json')
     with open(file_path, 'r', encoding='utf-8') as f:
         ScheduleFixedIntervalAbridged.model_validate_json(f.read())
+
+
+@pytest.mark.parametrize('data_type', ['Float64', 'Float32'])
+def test_fixedinterval_encoded_values(data_type):
+    file_path = os.path.join(
+        target_folder, 'schedule_fixedinterval_increasing_fine_timestep.json')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        schedule = ScheduleFixedIntervalAbridged.model_validate_json(f.read())
+
+    encoded_json = schedule.model_dump_json(context={'encode_values': data_type})
+    assert json.loads(encoded_json)['values']['type'] == 'EncodedValues'
+    encoded = ScheduleFixedIntervalAbridged.model_validate_json(encoded_json)
+    assert len(encoded.values) == len(schedule.values)
+    if data_type == 'Float64':
+        assert list(encoded.values) == schedule.values
+        assert encoded.model_dump_json() == schedule.model_dump_json()
+    else:
+        assert list(encoded.values) == pytest.approx(schedule.values, rel=1e-6)
+
+
+def test_fixedinterval_encoded_values_invalid():
+    schedule_dict = {
+        'type': 'ScheduleFixedIntervalAbridged',
+        'identifier': 'Encoded_Schedule',
+        'values': EncodedValues.encode([0.5] * 24).model_dump(),
+        'timestep': 1
+    }
+    ScheduleFixedIntervalAbridged.model_validate(schedule_dict)
+    # the number of values must still match the timestep
+    schedule_dict['timestep'] = 2
+    with pytest.raises(ValidationError):
+        ScheduleFixedIntervalAbridged.model_validate(schedule_dict)
+    schedule_dict['timestep'] = 1
+    schedule_dict['values']['data'] = schedule_dict['values']['data'][:-4]
+    with pytest.raises(ValidationError) as error:
+        ScheduleFixedIntervalAbridged.model_validate(schedule_dict)
+    assert error.value.error_count() == 1  # only validated as EncodedValues
+    schedule_dict['values'] = {'type': 'OtherValues'}
+    with pytest.raises(ValidationError) as error:
+        ScheduleFixedIntervalAbridged.model_validate(schedule_dict)
+    assert error.value.error_count() == 1
@@ -0,0 +1,99 @@
+"""Test the check of schedule values against their ScheduleTypeLimits."""
+import os
+import json
+
+from honeybee_schema.checks import check_model
+from honeybee_schema.checks.schedules import check_schedule_limits
+from honeybee_schema.energy.schedule import EncodedValues
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+
+def load_model(file_name):
+    with open(os.path.join(target_folder, file_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_check_schedule_limits_valid():
+    for file_name in os.listdir(target_folder):
+        if file_name.endswith('.hbjson'):
+            assert check_schedule_limits(load_model(file_name)) == []
+
+
+def test_check_schedule_limits_ruleset():
+    model_dict = load_model('model_complete_office_floor.hbjson')
+    schedule = model_dict['properties']['energy']['schedules'][1]
+    assert schedule['schedule_type_limit'] == 'Fractional'
+    day = [d for d in schedule['day_schedules'] if len(d['values']) > 2][0]
+    day['values'][1] = 1.5
+    day['values'][2] = -0.5
+
+    errors = check_schedule_limits(model_dict)
+    assert len(errors) == 1
+    error = errors[0]
+    assert error.code == '020021'
+    assert error.element_type.value == 'Schedule'
+    assert error.element_id == [schedule['identifier']]
+    assert error.extension_type.value == 'Energy'
+    assert 'has 2 values' in error.message
+    assert 'index 1 of its ScheduleDay "{}"'.format(day['identifier']) in error.message
+    assert '020021' in [e.code for e in check_model(model_dict).errors]
+
+    # schedules with missing limits are not checked
+    schedule['schedule_type_limit'] = 'Missing Limit'
+    assert check_schedule_limits(model_dict) == []
+
+
+def test_check_schedule_limits_discrete():
+    model_dict = load_model('model_complete_office_floor.hbjson')
+    energy = model_dict['properties']['energy']
+    energy['schedule_type_limits'].append({
+        'type': 'ScheduleTypeLimit', 'identifier': 'Mode',
+        'lower_limit': 0, 'upper_limit': {'type': 'NoLimit'},
+        'numeric_type': 'Discrete'
+    })
+    values = [0.0] * 24 + [1.0] * 24
+    values[30] = 0.5
+    values[40] = -2
+    energy['schedules'].append({
+        'type': 'ScheduleFixedIntervalAbridged', 'identifier': 'Mode Schedule',
+        'values': values, 'schedule_type_limit': 'Mode'
+    })
+
+    errors = check_schedule_limits(model_dict)
+    assert [error.code for error in errors] == ['020021', '020022']
+    assert 'index 40 of its values' in errors[0].message
+    assert 'has 1 values that are not integers' in errors[1].message
+    assert 'index 30 of its values' in errors[1].message
+
+    energy['schedules'][-1]['values'] = EncodedValues.encode(values).model_dump()
+    assert len(check_schedule_limits(model_dict)) == 2
+
+
+def test_check_schedule_limits_external_values(tmp_path):
+    from honeybee_schema.energy.values_file import write_external_values, \
+        close_values_files
+    model_dict = load_model('model_complete_office_floor.hbjson')
+    energy = model_dict['properties']['energy']
+    values = [0.0] * 24 + [1.0] * 24
+    values[40] = 2
+    energy['schedules'].append({
+        'type': 'ScheduleFixedIntervalAbridged', 'identifier': 'External Schedule',
+        'values': values, 'schedule_type_limit': 'Fractional'
+    })
+    assert write_external_values(model_dict, str(tmp_path / 'model.hbjson')) == 1
+
+    errors = check_schedule_limits(model_dict, str(tmp_path))
+    assert [error.code for error in errors] == ['020021']
+    assert 'index 40 of its values' in errors[0].message
+    assert [e.code for e in check_model(model_dict, str(tmp_path)).errors] == \
+        ['020021']
+
+    # the values are reported as unchecked when the file cannot be loaded
+    for folder in (None, str(tmp_path / 'missing')):
+        errors = check_schedule_limits(model_dict, folder)
+        assert [error.code for error in errors] == ['020023']
+        assert 'External Schedule' in errors[0].message
+    close_values_files()
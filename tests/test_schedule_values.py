@@ -0,0 +1,123 @@
+"""Test the expansion of ScheduleRulesets into annual values."""
+import os
+import json
+
+import pytest
+from honeybee_schema.energy.schedule import ScheduleRulesetAbridged
+from honeybee_schema.energy.schedule_values import day_values, ruleset_values, \
+    design_day_values, clear_cache
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'schedule')
+
+
+def load_schedule(file_name):
+    with open(os.path.join(target_folder, file_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def simple_ruleset(rules, **kwargs):
+    schedule = {
+        'type': 'ScheduleRulesetAbridged',
+        'identifier': 'Test Ruleset',
+        'day_schedules': [
+            {'type': 'ScheduleDay', 'identifier': 'Zero', 'values': [0]},
+            {'type': 'ScheduleDay', 'identifier': 'One', 'values': [1]},
+            {'type': 'ScheduleDay', 'identifier': 'Two', 'values': [2]}
+        ],
+        'default_day_schedule': 'Zero',
+        'schedule_rules': rules
+    }
+    schedule.update(kwargs)
+    return schedule
+
+
+def test_day_values():
+    day = {'values': [0, 1, 0], 'times': [[0, 0], [9, 0], [17, 30]]}
+    values = day_values(day)
+    assert len(values) == 24
+    assert list(values[8:10]) == [0, 1]
+    assert list(values[17:19]) == [1, 0]
+    assert list(day_values(day, 2)[34:36]) == [1, 0]
+
+    day['interpolate'] = True
+    values = day_values(day, 4)
+    assert values[0] == 0
+    assert values[18] == pytest.approx(0.5)
+    assert values[36] == 1
+    assert values[-1] == 0
+    with pytest.raises(ValueError):
+        day_values(day, 7)
+
+
+def test_ruleset_values_office():
+    schedule = load_schedule('schedule_ruleset_office_occupancy.json')
+    values = ruleset_values(schedule)
+    assert len(values) == 8760
+    assert values[12] == 0.05  # Sunday, January 1st uses the default
+    assert values[24 + 12] == 0.5  # Monday uses the weekday schedule
+    assert values[6 * 24 + 10] == 0.3  # Saturday uses the Saturday schedule
+    assert len(ruleset_values(schedule, timestep=4)) == 8760 * 4
+    assert len(ruleset_values(schedule, leap_year=True)) == 8784
+
+    model = ScheduleRulesetAbridged.model_validate(schedule)
+    assert ruleset_values(model) == values
+    monday_start = ruleset_values(schedule, start_day_of_week='Monday')
+    assert monday_start[12] == 0.5
+    with pytest.raises(ValueError):
+        ruleset_values(schedule, start_day_of_week='Funday')
+
+
+def test_ruleset_values_rules():
+    rules = [
+        {'type': 'ScheduleRuleAbridged', 'schedule_day': 'Two', 'apply_monday': True,
+         'start_date': [3, 1], 'end_date': [3, 31]},
+        {'type': 'ScheduleRuleAbridged', 'schedule_day': 'One', 'apply_monday': True,
+         'apply_sunday': True, 'start_date': [11, 1], 'end_date': [3, 31]}
+    ]
+    schedule = simple_ruleset(rules, holiday_schedule='Two')
+    values = ruleset_values(schedule)
+    assert values[0] == 1  # January 1st is in the rule that wraps around the year
+    assert values[2 * 24] == 0  # Tuesday
+    assert values[59 * 24] == 0  # Wednesday, March 1st
+    assert values[64 * 24] == 2  # Monday, March 6th uses the rule of higher priority
+    assert values[63 * 24] == 1  # Sunday, March 5th
+    assert values[200 * 24] == 0
+    assert values[-24] == 1  # Sunday, December 31st
+
+    leap_values = ruleset_values(schedule, leap_year=True)
+    assert leap_values[59 * 24] == 0  # Wednesday, February 29th
+    assert leap_values[64 * 24] == 2  # Monday, March 5th
+
+    holidays = [[1, 1], [7, 4]]
+    holiday_values = ruleset_values(schedule, holidays=holidays)
+    assert holiday_values[0] == 2
+    assert holiday_values[184 * 24] == 2
+    del schedule['holiday_schedule']
+    assert ruleset_values(schedule, holidays=holidays)[0] == 0
+
+
+def test_ruleset_values_cache():
+    clear_cache()
+    schedule = simple_ruleset([{'type': 'ScheduleRuleAbridged', 'schedule_day': 'One',
+                                'apply_saturday': True}])
+    values = ruleset_values(schedule)
+    values[0] = 100  # editing the returned values does not edit the cache
+    assert ruleset_values(schedule)[0] == 0
+    assert ruleset_values(schedule)[6 * 24] == 1
+
+    schedule['schedule_rules'][0]['schedule_day'] = 'Two'
+    assert ruleset_values(schedule)[6 * 24] == 2
+    schedule['schedule_rules'][0]['schedule_day'] = 'Missing'
+    with pytest.raises(ValueError):
+        ruleset_values(schedule)
+
+
+def test_design_day_values():
+    schedule = load_schedule('schedule_ruleset_office_occupancy.json')
+    assert design_day_values(schedule)[12] == 1
+    assert design_day_values(schedule, 'winter', 2)[24] == 0
+    del schedule['summer_designday_schedule']
+    assert design_day_values(schedule)[12] == 0.05
+    with pytest.raises(ValueError):
+        design_day_values(schedule, 'autumn')
@@ -0,0 +1,115 @@
+"""Test the solution of the adjacencies between the Rooms of Models."""
+import os
+import json
+
+from honeybee_schema.solver import solve_adjacency
+from honeybee_schema.checks.adjacency import check_adjacencies
+from honeybee_schema.synthetic import write_synthetic_model
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+
+def boundary_conditions(model_dict):
+    bcs = {}
+    for room in model_dict['rooms']:
+        for face in room['faces']:
+            bcs[face['identifier']] = face['boundary_condition']
+            for sub_face in face.get('apertures', []) + face.get('doors', []):
+                bcs[sub_face['identifier']] = sub_face['boundary_condition']
+    return bcs
+
+
+def reset_surfaces(model_dict):
+    outdoors = {'type': 'Outdoors'}
+    for room in model_dict['rooms']:
+        for face in room['faces']:
+            if face['boundary_condition']['type'] == 'Surface':
+                face['boundary_condition'] = outdoors
+                for sub_face in face.get('apertures', []) + face.get('doors', []):
+                    sub_face['boundary_condition'] = outdoors
+
+
+def test_solve_adjacency_sub_faces():
+    file_path = os.path.join(target_folder, 'model_5vertex_sub_faces_interior.hbjson')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    expected = boundary_conditions(model_dict)
+    reset_surfaces(model_dict)
+
+    pairs = solve_adjacency(model_dict)
+    assert pairs == [('TinyHouseZone1_Front', 'TinyHouseZone2_Back')]
+    assert boundary_conditions(model_dict) == expected
+    assert solve_adjacency(model_dict) == []
+
+    # a sub-face that does not match prevents the adjacency
+    reset_surfaces(model_dict)
+    face = next(f for room in model_dict['rooms'] for f in room['faces']
+                if f['identifier'] == 'TinyHouseZone1_Front')
+    face['apertures'][0]['geometry']['boundary'][0][2] += 0.1
+    assert solve_adjacency(model_dict) == []
+
+
+def test_solve_adjacency_synthetic(tmp_path):
+    file_path = str(tmp_path / 'synthetic.hbjson')
+    write_synthetic_model(file_path, rooms=20, faces_per_room=10)
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    expected = boundary_conditions(model_dict)
+    reset_surfaces(model_dict)
+
+    pairs = solve_adjacency(model_dict)
+    assert len(pairs) == sum(1 for bc in expected.values() if bc['type'] == 'Surface') / 2
+    assert boundary_conditions(model_dict) == expected
+    assert check_adjacencies(model_dict) == []
+
+
+def test_solve_adjacency_overwrite_stale():
+    file_path = os.path.join(target_folder, 'model_5vertex_sub_faces_interior.hbjson')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    face = next(f for room in model_dict['rooms'] for f in room['faces']
+                if f['identifier'] == 'TinyHouseZone2_Back')
+    for point in face['geometry']['boundary']:
+        point[1] += 1  # the Face no longer matches its previous adjacent Face
+
+    assert solve_adjacency(model_dict, overwrite=True) == []
+    bcs = boundary_conditions(model_dict)
+    for identifier in ('TinyHouseZone1_Front', 'TinyHouseZone2_Back', 'FrontAperture',
+                       'BackAperture', 'FrontDoor', 'BackDoor'):
+        assert bcs[identifier] == {'type': 'Outdoors'}
+    assert check_adjacencies(model_dict) == []
+
+
+def test_solve_adjacency_holes_and_boundary_conditions():
+    boundary = [[0, 0, 0], [4, 0, 0], [4, 0, 3], [0, 0, 3]]
+    hole = [[1, 0, 1], [2, 0, 1], [2, 0, 2], [1, 0, 2]]
+
+    def model(holes_1, holes_2, bc_type='Outdoors'):
+        faces = []
+        for identifier, loop, holes in (('Face_1', boundary, holes_1),
+                                        ('Face_2', boundary[::-1], holes_2)):
+            geometry = {'type': 'Face3D', 'boundary': loop}
+            if holes:
+                geometry['holes'] = holes
+            faces.append({'identifier': identifier, 'geometry': geometry,
+                          'boundary_condition': {'type': 'Outdoors'}})
+        faces[1]['boundary_condition'] = {'type': bc_type}
+        return {'tolerance': 0.01, 'rooms': [
+            {'identifier': 'Room_{}'.format(i), 'faces': [face]}
+            for i, face in enumerate(faces)]}
+
+    assert solve_adjacency(model([hole], [hole[::-1]])) == [('Face_1', 'Face_2')]
+    assert solve_adjacency(model([hole], [])) == []  # the holes do not match
+    moved_hole = [[x + 1, y, z] for x, y, z in hole]
+    assert solve_adjacency(model([hole], [moved_hole])) == []
+
+    # only Outdoors and Surface boundary conditions are changed
+    for bc_type in ('Ground', 'Adiabatic'):
+        model_dict = model([], [], bc_type)
+        assert solve_adjacency(model_dict, overwrite=True) == []
+        assert model_dict['rooms'][1]['faces'][0]['boundary_condition'] == \
+            {'type': bc_type}
+    model_dict = model([], [], 'Surface')
+    assert solve_adjacency(model_dict) == []
+    assert solve_adjacency(model_dict, overwrite=True) == [('Face_1', 'Face_2')]
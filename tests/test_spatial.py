@@ -0,0 +1,127 @@
+"""Test the spatial index of the geometry objects of Models."""
+import os
+import math
+import random
+
+import pytest
+from honeybee_schema.model import Model
+from honeybee_schema.spatial import SpatialIndex, points_bounds
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+target_folder_large = os.path.join(root, 'samples', 'model_large')
+
+
+def load_model(folder, file_name):
+    with open(os.path.join(folder, file_name), 'r', encoding='utf-8') as f:
+        return Model.model_validate_json(f.read())
+
+
+def intersects(box_1, box_2):
+    return all(box_1[i] <= box_2[i + 3] and box_2[i] <= box_1[i + 3]
+               for i in range(3))
+
+
+def distance(point, box):
+    return math.sqrt(sum(max(box[i] - point[i], 0, point[i] - box[i + 3]) ** 2
+                         for i in range(3)))
+
+
+def random_box(rand, bounds):
+    x, y, z = (rand.uniform(bounds[i], bounds[i + 3]) for i in range(3))
+    size = rand.uniform(0, 5)
+    return (x, y, z, x + size, y + size, z + size)
+
+
+@pytest.fixture(scope='module')
+def lab_model():
+    return load_model(target_folder_large, 'lab_building.hbjson')
+
+
+def test_from_model(lab_model):
+    index = SpatialIndex.from_model(lab_model)
+    face_count = sum(len(room.faces) for room in lab_model.rooms)
+    assert len(index) > face_count + len(lab_model.rooms)
+    room = lab_model.rooms[0]
+    room_box = index.bounding_box('Room', room.identifier)
+    for face in room.faces:
+        face_box = points_bounds(face.geometry.boundary)
+        assert face_box == index.bounding_box('Face', face.identifier)
+        assert all(room_box[i] <= face_box[i] for i in range(3))
+        assert all(room_box[i] >= face_box[i] for i in range(3, 6))
+
+    mesh_model = load_model(target_folder, 'model_with_shade_mesh.hbjson')
+    index = SpatialIndex.from_model(mesh_model, obj_types=('ShadeMesh',))
+    assert len(index) == len(mesh_model.shade_meshes)
+
+
+def test_queries(lab_model):
+    index = SpatialIndex.from_model(lab_model, max_entries=8)
+    boxes = {key: entry.box for key, entry in index._entries.items()}
+    rand = random.Random(0)
+    for _ in range(20):
+        box = random_box(rand, index.bounds)
+        expected = sorted(key for key, b in boxes.items() if intersects(b, box))
+        assert sorted(index.query_box(box)) == expected
+        rooms = sorted(key for key, b in boxes.items()
+                       if key[0] == 'Room' and intersects(b, box))
+        assert sorted(index.query_box(box, obj_types=('Room',))) == rooms
+
+        point = box[:3]
+        expected = sorted(distance(point, b) for b in boxes.values())[:5]
+        nearest = index.nearest(point, k=5)
+        assert len(nearest) == 5
+        found = [distance(point, boxes[key]) for key in nearest]
+        assert found == pytest.approx(expected)
+
+
+def test_query_ray():
+    index = SpatialIndex()
+    index.insert('Face', 'near', (2, -1, -1, 3, 1, 1))
+    index.insert('Face', 'far', (8, -1, -1, 9, 1, 1))
+    index.insert('Face', 'off', (5, 2, -1, 6, 3, 1))
+    index.insert('Room', 'behind', (-5, -1, -1, -4, 1, 1))
+    index.insert('Aperture', 'near', (2.5, -1, -1, 2.5, 1, 1))
+    assert index.query_ray((0, 0, 0), (1, 0, 0)) == \
+        [('Face', 'near'), ('Aperture', 'near'), ('Face', 'far')]
+    assert index.query_ray((0, 0, 0), (1, 0, 0), max_distance=2.2) == \
+        [('Face', 'near')]
+    assert index.query_ray((0, 0, 0), (-1, 0, 0)) == [('Room', 'behind')]
+    assert index.query_ray((0, 0, 0), (1, 0, 0), obj_types=('Room',)) == []
+    assert index.query_box((2, 0, 0, 2.5, 0, 0), obj_types=('Aperture',)) == \
+        [('Aperture', 'near')]
+    assert index.nearest((2.6, 0, 0), k=2) == [('Face', 'near'), ('Aperture', 'near')]
+
+
+def test_insert_delete():
+    rand = random.Random(1)
+    index = SpatialIndex(max_entries=4)
+    boxes = {}
+    for i in range(300):
+        box = random_box(rand, (0, 0, 0, 100, 100, 100))
+        boxes['Shade_{}'.format(i)] = box
+        index.insert('Shade', 'Shade_{}'.format(i), box)
+    for i in range(0, 300, 2):
+        index.delete('Shade', 'Shade_{}'.format(i))
+        del boxes['Shade_{}'.format(i)]
+    index.update('Shade', 'Shade_1', (200, 200, 200, 201, 201, 201))
+    boxes['Shade_1'] = (200, 200, 200, 201, 201, 201)
+    assert len(index) == len(boxes) == 150
+    assert ('Shade', 'Shade_2') not in index
+
+    for _ in range(20):
+        box = random_box(rand, (0, 0, 0, 100, 100, 100))
+        expected = sorted(('Shade', key) for key, b in boxes.items()
+                          if intersects(b, box))
+        assert sorted(index.query_box(box)) == expected
+    assert index.nearest((200, 200, 200)) == [('Shade', 'Shade_1')]
+    assert index.bounds[3:] == (201, 201, 201)
+
+    with pytest.raises(ValueError):
+        index.insert('Shade', 'Shade_1', (0, 0, 0, 1, 1, 1))
+    for key in list(boxes):
+        index.delete('Shade', key)
+    assert len(index) == 0 and index.bounds is None
+    assert index.query_box((0, 0, 0, 100, 100, 100)) == []
+    index.insert('Shade', 'Shade_1', (0, 0, 0, 1, 1, 1))
+    assert index.query_box((0, 0, 0, 100, 100, 100)) == [('Shade', 'Shade_1')]
@@ -0,0 +1,79 @@
+"""Test the incremental validation of Model JSON files."""
+import os
+import json
+
+from pydantic import ValidationError
+from honeybee_schema.model import Model, Room
+from honeybee_schema.stream import iter_model_elements, validate_model_elements, \
+    iter_model_list
+
+# target folder where all of the samples live
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+target_folder_large = os.path.join(root, 'samples', 'model_large')
+
+
+def test_iter_model_elements_small_chunks():
+    file_path = os.path.join(target_folder, 'model_with_shade_mesh.hbjson')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+
+    paths = []
+    for path, json_text in iter_model_elements(file_path, chunk_size=7):
+        paths.append(path)
+        if not path:
+            continue
+        value = model_dict
+        for key in path:
+            value = value[key]
+        assert json.loads(json_text) == value
+
+    assert paths[-1] == ()
+    assert ('shade_meshes', 0) in paths
+    assert ('properties', 'radiance', 'modifiers', 0) in paths
+
+
+def test_iter_model_elements_properties():
+    file_path = os.path.join(target_folder, 'model_complete_multi_zone_office.hbjson')
+    paths = [path for path, _ in iter_model_elements(file_path)]
+    assert ('properties', 'energy', 'schedules', 0) in paths
+    assert ('properties', 'energy', 'materials', 0) in paths
+    assert ('orphaned_shades', 0) not in paths
+
+
+def test_iter_model_list():
+    file_path = os.path.join(target_folder, 'model_complete_multi_zone_office.hbjson')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    schedules = model_dict['properties']['energy']['schedules']
+    items = list(iter_model_list(
+        file_path, ('properties', 'energy', 'schedules'), chunk_size=7))
+    assert [json.loads(item) for item in items] == schedules
+    assert list(iter_model_list(file_path, ('properties', 'missing'))) == []
+    assert len(list(iter_model_list(file_path, ('rooms',)))) == \
+        len(model_dict['rooms'])
+
+
+def test_validate_model_elements_large():
+    file_path = os.path.join(target_folder_large, 'lab_building.hbjson')
+    results = list(validate_model_elements(file_path))
+
+    rooms = [obj for path, obj in results if path[:1] == ('rooms',)]
+    assert len(rooms) == 100
+    assert all(isinstance(room, Room) for room in rooms)
+    assert not any(isinstance(obj, ValidationError) for _, obj in results)
+    assert isinstance(results[-1][1], Model)
+
+
+def test_validate_model_elements_errors(tmp_path):
+    file_path = os.path.join(target_folder, 'model_complete_single_zone_office.hbjson')
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    model_dict['rooms'][0]['multiplier'] = 0
+    model_dict['tolerance'] = -1
+    invalid_path = tmp_path / 'invalid_model.hbjson'
+    invalid_path.write_text(json.dumps(model_dict))
+
+    errors = [path for path, obj in validate_model_elements(str(invalid_path))
+              if isinstance(obj, ValidationError)]
+    assert errors == [('rooms', 0), ()]
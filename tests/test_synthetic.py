@@ -0,0 +1,42 @@
+"""Test the synthetic Model generator."""
+import json
+
+import pytest
+from honeybee_schema.model import Model
+from honeybee_schema.checks import check_model
+from honeybee_schema.synthetic import write_synthetic_model
+
+
+def test_write_synthetic_model(tmp_path):
+    file_path = str(tmp_path / 'synthetic.hbjson')
+    counts = write_synthetic_model(
+        file_path, rooms=10, faces_per_room=10, apertures_per_face=2,
+        shades_per_aperture=3, sensor_grids=4, schedules=3, program_types=2)
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    model = Model.model_validate(model_dict)
+    assert check_model(model_dict).valid
+
+    assert len(model.rooms) == counts['Room'] == 10
+    assert all(len(room.faces) == 10 for room in model.rooms)
+    faces = [face for room in model.rooms for face in room.faces]
+    apertures = [ap for face in faces for ap in face.apertures or ()]
+    assert len(faces) == counts['Face']
+    assert len(apertures) == counts['Aperture']
+    assert all(len(ap.outdoor_shades) == 3 for ap in apertures)
+    assert len(apertures) * 3 == counts['Shade']
+    assert any(face.boundary_condition.type == 'Surface' for face in faces)
+
+    energy = model.properties.energy
+    assert len(energy.schedules) == 3 + 2  # with the heating and cooling setpoints
+    assert len(energy.program_types) == 2
+    assert len(model.properties.radiance.sensor_grids) == 4
+
+
+def test_write_synthetic_model_invalid(tmp_path):
+    file_path = str(tmp_path / 'synthetic.hbjson')
+    with pytest.raises(ValueError):
+        write_synthetic_model(file_path, faces_per_room=7)
+    with pytest.raises(ValueError):
+        write_synthetic_model(file_path, rooms=2, sensor_grids=3)
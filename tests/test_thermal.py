@@ -0,0 +1,105 @@
+"""Test the thermal properties of opaque constructions."""
+import os
+import json
+
+import pytest
+from honeybee_schema.model import Model
+from honeybee_schema.energy.thermal import ThermalCalculator, material_properties, \
+    opaque_construction_properties, interior_film_coefficient
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+CONCRETE = {
+    'type': 'EnergyMaterial', 'identifier': 'Concrete', 'thickness': 0.2,
+    'conductivity': 2.0, 'density': 2400, 'specific_heat': 900
+}
+INSULATION = {
+    'type': 'EnergyMaterialNoMass', 'identifier': 'Insulation', 'r_value': 3.0,
+    'thermal_absorptance': 0.84
+}
+GLASS = {
+    'type': 'EnergyWindowMaterialSimpleGlazSys', 'identifier': 'Glass',
+    'u_factor': 2.0, 'shgc': 0.4
+}
+
+
+def test_material_properties():
+    assert material_properties(CONCRETE) == (0.1, 0.2 * 2400 * 900, 0.9)
+    assert material_properties(INSULATION) == (3.0, 0.0, 0.84)
+    r_value, capacity, emissivity = material_properties(
+        {'type': 'EnergyMaterialVegetation', 'identifier': 'Roof Soil'})
+    assert r_value == pytest.approx(0.1 / 0.35)
+    assert capacity == pytest.approx(0.1 * 1100 * 1200)
+    with pytest.raises(ValueError):
+        material_properties(GLASS)
+
+
+def test_thermal_calculator():
+    calculator = ThermalCalculator([CONCRETE, INSULATION, GLASS])
+    construction = {'type': 'OpaqueConstructionAbridged', 'identifier': 'Wall',
+                    'materials': ['Concrete', 'Insulation']}
+    result = calculator.construction(construction)
+    assert result['r_value'] == pytest.approx(3.1)
+    assert result['u_value'] == pytest.approx(1 / 3.1)
+    assert result['u_factor'] == pytest.approx(1 / (3.1 + 1 / 23 + 1 / 8.0))
+    assert result['heat_capacity'] == pytest.approx(432000)
+    assert interior_film_coefficient(0.84) == pytest.approx(8.0)
+
+    # full constructions use the materials within them
+    full = {'type': 'OpaqueConstruction', 'identifier': 'Full Wall',
+            'materials': [CONCRETE, dict(INSULATION, identifier='Other')]}
+    assert calculator.construction(full) == result
+    custom = ThermalCalculator([CONCRETE], exterior_film=25, interior_film=7.7)
+    assert custom.construction({'materials': ['Concrete']})['u_factor'] == \
+        pytest.approx(1 / (0.1 + 1 / 25 + 1 / 7.7))
+
+    with pytest.raises(ValueError):
+        calculator.construction({'materials': ['Missing']})
+    with pytest.raises(ValueError):
+        calculator.construction({'materials': ['Glass']})
+
+
+def test_thermal_calculator_memo():
+    calculator = ThermalCalculator([CONCRETE])
+    first = calculator.material('Concrete')
+    assert calculator.material('Concrete') is first
+    assert calculator.material(CONCRETE) is first
+
+
+def test_thermal_calculator_update():
+    calculator = ThermalCalculator([CONCRETE, INSULATION])
+    wall = {'type': 'OpaqueConstructionAbridged', 'identifier': 'Wall',
+            'materials': ['Concrete', 'Insulation']}
+    first = opaque_construction_properties(
+        {'materials': [CONCRETE, INSULATION], 'constructions': [wall]}, calculator)
+
+    # a second Model with a different material under the same identifier
+    thin = dict(CONCRETE, thickness=0.1)
+    second = opaque_construction_properties(
+        {'materials': [thin, INSULATION], 'constructions': [wall]}, calculator)
+    assert second['Wall']['r_value'] == pytest.approx(3.05)
+    assert second['Wall']['r_value'] < first['Wall']['r_value']
+    assert calculator.update([thin, dict(INSULATION)]) == []
+    assert sorted(calculator.update([CONCRETE])) == ['Concrete', 'Insulation']
+
+    # material objects that are not in the calculator are not memoized
+    calculator = ThermalCalculator([CONCRETE])
+    assert calculator.material(thin) == material_properties(thin)
+    assert calculator.material('Concrete') == material_properties(CONCRETE)
+
+
+def test_opaque_construction_properties():
+    with open(os.path.join(target_folder, 'model_complete_multi_zone_office.hbjson'),
+              'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    energy = model_dict['properties']['energy']
+    results = opaque_construction_properties(energy)
+    opaque = [c for c in energy['constructions']
+              if c['type'] == 'OpaqueConstructionAbridged']
+    assert len(results) == len(opaque)
+    for properties in results.values():
+        assert 0 < properties['u_factor'] < properties['u_value']
+
+    model = Model.model_validate(model_dict)
+    assert opaque_construction_properties(model.properties.energy) == results
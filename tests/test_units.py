@@ -0,0 +1,74 @@
+"""Test the conversion of the units of Models."""
+import os
+import json
+import copy
+
+import pytest
+from honeybee_schema.model import Model
+from honeybee_schema.units import convert_units, conversion_factor, scale_geometry
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+
+def load_model(file_name):
+    with open(os.path.join(target_folder, file_name), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_conversion_factor():
+    assert conversion_factor('Meters', 'Millimeters') == pytest.approx(1000)
+    assert conversion_factor('Feet', 'Inches') == pytest.approx(12)
+    with pytest.raises(ValueError):
+        conversion_factor('Meters', 'Furlongs')
+
+
+def test_convert_units_dict():
+    model_dict = load_model('model_radiance_grid_views.hbjson')
+    original = copy.deepcopy(model_dict)
+    assert convert_units(model_dict, 'Millimeters') is model_dict
+    assert model_dict['units'] == 'Millimeters'
+    assert model_dict['tolerance'] == pytest.approx(10)
+
+    face = model_dict['rooms'][0]['faces'][1]
+    orig_face = original['rooms'][0]['faces'][1]
+    assert face['geometry']['boundary'][0] == \
+        pytest.approx([c * 1000 for c in orig_face['geometry']['boundary'][0]])
+    grid = model_dict['properties']['radiance']['sensor_grids'][0]
+    orig_grid = original['properties']['radiance']['sensor_grids'][0]
+    assert grid['sensors'][0]['pos'] == \
+        pytest.approx([c * 1000 for c in orig_grid['sensors'][0]['pos']])
+    assert grid['sensors'][0]['dir'] == orig_grid['sensors'][0]['dir']
+    assert grid['mesh']['vertices'][1] == \
+        pytest.approx([c * 1000 for c in orig_grid['mesh']['vertices'][1]])
+    view = model_dict['properties']['radiance']['views'][0]
+    orig_view = original['properties']['radiance']['views'][0]
+    assert view['position'] == pytest.approx([c * 1000 for c in orig_view['position']])
+    assert view['direction'] == orig_view['direction']
+
+    convert_units(model_dict, 'Meters')
+    assert model_dict['tolerance'] == pytest.approx(0.01)
+    assert model_dict['rooms'][0]['faces'][1]['geometry']['boundary'][0] == \
+        pytest.approx(orig_face['geometry']['boundary'][0])
+
+
+@pytest.mark.parametrize('context', [None, {'compact_geometry': True}])
+def test_convert_units_model(context):
+    model_dict = load_model('model_with_shade_mesh.hbjson')
+    model = Model.model_validate(model_dict, context=context)
+    convert_units(model, 'Feet')
+    convert_units(model_dict, 'Feet')
+    assert model.units == 'Feet'
+    assert model.model_dump(exclude_unset=True) == \
+        Model.model_validate(model_dict).model_dump(exclude_unset=True)
+
+
+def test_scale_geometry_element():
+    model_dict = load_model('model_complete_holes.hbjson')
+    room = model_dict['rooms'][0]
+    geometry = room['faces'][0]['geometry']
+    boundary, holes = copy.deepcopy(geometry['boundary']), \
+        copy.deepcopy(geometry['holes'])
+    scale_geometry(room, 2)
+    assert geometry['boundary'][0] == [c * 2 for c in boundary[0]]
+    assert geometry['holes'][0][0] == [c * 2 for c in holes[0][0]]
@@ -0,0 +1,159 @@
+"""Test the external .hbval files for the values of schedules."""
+import os
+import json
+
+import pytest
+from pydantic import ValidationError
+from honeybee_schema.energy.schedule import ScheduleFixedIntervalAbridged, \
+    ExternalValues
+from honeybee_schema.energy.values_file import ValuesFile, read_header, \
+    write_values_file, model_to_external_values, values_file_path, \
+    close_values_files
+from honeybee_schema.stream import validate_model_elements
+from honeybee_schema.parallel import validate_model_parallel
+from honeybee_schema.model import Model
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+
+def test_values_file(tmp_path):
+    file_path = str(tmp_path / 'values.hbval')
+    positions = write_values_file(file_path, [[1, 2, 3], [4.5] * 24], timestep=4)
+    assert positions == [(0, 3), (3, 24)]
+    assert read_header(file_path) == (4, 27)
+
+    values_file = ValuesFile.open(file_path)
+    assert ValuesFile.open(file_path) is values_file
+    assert values_file.timestep == 4
+    assert values_file.values(0, 3).tolist() == [1, 2, 3]
+    assert values_file.values(3, 24).tolist() == [4.5] * 24
+    with pytest.raises(ValueError):
+        values_file.values(20, 24)
+    close_values_files()
+
+    with open(file_path, 'ab') as f:  # the size no longer matches the header
+        f.write(b'\x00')
+    with pytest.raises(ValueError):
+        read_header(file_path)
+    with pytest.raises(ValueError):
+        read_header(str(tmp_path / 'missing.hbval'))
+
+
+def test_values_file_rewritten(tmp_path):
+    file_path = str(tmp_path / 'values.hbval')
+    write_values_file(file_path, [[1, 2, 3]], timestep=4)
+    values_file = ValuesFile.open(file_path)
+    old_values = values_file.values(0, 3)
+
+    # rewriting the file drops its mapping and the old values remain readable
+    write_values_file(file_path, [[5] * 48], timestep=2)
+    new_file = ValuesFile.open(file_path)
+    assert new_file is not values_file
+    assert (new_file.timestep, len(new_file)) == (2, 48)
+    assert old_values.tolist() == [1, 2, 3]
+    del old_values
+
+    # a file replaced by another writer is mapped again
+    other_path = str(tmp_path / 'other.hbval')
+    write_values_file(other_path, [[7] * 24], timestep=1)
+    os.replace(other_path, file_path)
+    values_file = ValuesFile.open(file_path)
+    assert values_file is not new_file
+    assert (values_file.timestep, values_file.values(0, 1).tolist()) == (1, [7])
+    assert ValuesFile.open(file_path) is values_file
+    close_values_files()
+
+
+def test_schedule_external_values(tmp_path):
+    write_values_file(str(tmp_path / 'values.hbval'),
+                      [[0.0] * 48, [float(i % 24) for i in range(96)]], timestep=2)
+    schedule = {
+        'type': 'ScheduleFixedIntervalAbridged', 'identifier': 'External',
+        'values': {'type': 'ExternalValues', 'path': 'values.hbval',
+                   'offset': 48, 'length': 96},
+        'timestep': 2
+    }
+    context = {'values_folder': str(tmp_path)}
+    obj = ScheduleFixedIntervalAbridged.model_validate(schedule, context=context)
+    assert isinstance(obj.values, ExternalValues)
+    assert len(obj.values) == 96
+    assert obj.values.load().tolist()[:25] == [float(i) for i in range(24)] + [0]
+    assert obj.model_dump()['values'] == schedule['values']
+    assert obj.model_dump(context={'encode_values': 'Float32'})['values'] == \
+        schedule['values']
+
+    # the file is not checked without a folder but it is needed to load the values
+    obj = ScheduleFixedIntervalAbridged.model_validate(schedule)
+    with pytest.raises(ValueError):
+        obj.values.load()
+    assert obj.values.load(str(tmp_path)).tolist()[0] == 0.0
+    for path in ('../values.hbval', '/values.hbval', 'C:/values.hbval',
+                 'folder\\values.hbval'):  # paths that leave the Model folder
+        with pytest.raises(ValidationError):
+            ScheduleFixedIntervalAbridged.model_validate(
+                dict(schedule, values=dict(schedule['values'], path=path)))
+    with pytest.raises(ValidationError):  # the timestep does not match the file
+        ScheduleFixedIntervalAbridged.model_validate(
+            dict(schedule, timestep=1, values=dict(schedule['values'], length=48)),
+            context=context)
+    with pytest.raises(ValidationError):  # the values are outside of the file
+        ScheduleFixedIntervalAbridged.model_validate(
+            dict(schedule, values=dict(schedule['values'], offset=96)),
+            context=context)
+    close_values_files()
+
+
+def test_external_values_link_outside_folder(tmp_path):
+    write_values_file(str(tmp_path / 'values.hbval'), [[0.0] * 24])
+    sub_folder = tmp_path / 'sub'  # a link within the folder to a file outside of it
+    sub_folder.mkdir()
+    try:
+        os.symlink(str(tmp_path / 'values.hbval'), str(sub_folder / 'link.hbval'))
+    except (OSError, NotImplementedError):
+        pytest.skip('Symbolic links are not supported.')
+    with pytest.raises(ValueError):
+        ExternalValues(path='link.hbval', length=24).file_path(str(sub_folder))
+    assert ExternalValues(path='sub/link.hbval', length=24).file_path(str(tmp_path))
+
+
+def test_model_to_external_values(tmp_path):
+    model_json = os.path.join(target_folder, 'model_energy_fixed_interval.hbjson')
+    hbjson_path = str(tmp_path / 'model.hbjson')
+    count = model_to_external_values(model_json, hbjson_path)
+    assert count > 0
+    assert os.path.isfile(values_file_path(hbjson_path))
+
+    with open(model_json, 'r', encoding='utf-8') as f:
+        original = Model.model_validate_json(f.read())
+    with open(hbjson_path, 'r', encoding='utf-8') as f:
+        model = Model.model_validate_json(
+            f.read(), context={'values_folder': str(tmp_path)})
+    external = [s for s in model.properties.energy.schedules
+                if isinstance(getattr(s, 'values', None), ExternalValues)]
+    assert len(external) == count
+    originals = {s.identifier: s for s in original.properties.energy.schedules}
+    for schedule in external:
+        assert schedule.values.load().tolist() == \
+            pytest.approx(list(originals[schedule.identifier].values))
+
+    assert all(not isinstance(r, ValidationError)
+               for _, r in validate_model_elements(hbjson_path))
+    assert validate_model_parallel(hbjson_path, jobs=1).valid
+    with pytest.raises(ValueError):  # the values file must be in the Model folder
+        model_to_external_values(model_json, hbjson_path,
+                                 str(tmp_path.parent / 'outside.hbval'))
+    close_values_files()
+
+
+def test_external_values_json_round_trip(tmp_path):
+    model_json = os.path.join(target_folder, 'model_energy_fixed_interval.hbjson')
+    hbjson_path = str(tmp_path / 'model.hbjson')
+    model_to_external_values(model_json, hbjson_path)
+    with open(hbjson_path, 'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    model = Model.model_validate(model_dict, context={'values_folder': str(tmp_path)})
+    assert json.loads(model.model_dump_json(exclude_unset=True)) == model_dict
+    model = Model.model_validate(model_dict)  # the files are not checked
+    assert json.loads(model.model_dump_json(exclude_unset=True)) == model_dict
+    close_values_files()
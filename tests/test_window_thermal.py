@@ -0,0 +1,148 @@
+"""Test the U-factor, SHGC and VT of window constructions."""
+import os
+import json
+
+import pytest
+from honeybee_schema.model import Model
+from honeybee_schema.energy.window_thermal import WindowCalculator, \
+    window_construction_properties, gas_coefficients, optical_properties, \
+    GAS_COEFFICIENTS
+
+root = os.path.dirname(os.path.dirname(__file__))
+target_folder = os.path.join(root, 'samples', 'model')
+
+CLEAR = {'type': 'EnergyWindowMaterialGlazing', 'identifier': 'Clear'}
+LOW_E = dict(CLEAR, identifier='Low-E', emissivity_back=0.04, solar_transmittance=0.6)
+AIR = {'type': 'EnergyWindowMaterialGas', 'identifier': 'Air'}
+ARGON = {'type': 'EnergyWindowMaterialGas', 'identifier': 'Argon', 'gas_type': 'Argon'}
+MIXTURE = {
+    'type': 'EnergyWindowMaterialGasMixture', 'identifier': 'Mixture',
+    'thickness': 0.0125, 'gas_types': ['Argon', 'Air'], 'gas_fractions': [0.9, 0.1]
+}
+SIMPLE = {
+    'type': 'EnergyWindowMaterialSimpleGlazSys', 'identifier': 'Simple',
+    'u_factor': 2.0, 'shgc': 0.4
+}
+FRAME = {'type': 'EnergyWindowFrame', 'identifier': 'Frame', 'width': 0.05,
+         'conductance': 5.0}
+MATERIALS = [CLEAR, LOW_E, AIR, ARGON, MIXTURE, SIMPLE, FRAME]
+
+
+def _construction(materials, **kwargs):
+    return dict(type='WindowConstructionAbridged', identifier='Window',
+                materials=materials, **kwargs)
+
+
+def test_gas_coefficients():
+    assert gas_coefficients(AIR) == GAS_COEFFICIENTS['Air']
+    conductivity, _, _, weight = gas_coefficients(MIXTURE)
+    assert weight == pytest.approx(0.9 * 39.948 + 0.1 * 28.97)
+    assert conductivity[0] == pytest.approx(0.9 * 2.285e-3 + 0.1 * 2.873e-3)
+    custom = {'type': 'EnergyWindowMaterialGasCustom', 'identifier': 'Custom',
+              'conductivity_coeff_a': 0.0146, 'viscosity_coeff_a': 8.6e-6,
+              'specific_heat_coeff_a': 2408, 'specific_heat_ratio': 1.1,
+              'molecular_weight': 44}
+    assert gas_coefficients(custom) == \
+        ((0.0146, 0, 0), (8.6e-6, 0, 0), (2408, 0, 0), 44)
+
+
+def test_optical_properties():
+    transmittance, reflectance, absorbed = optical_properties([(0.8, 0.1, 0.1)])
+    assert (transmittance, reflectance) == (0.8, 0.1)
+    assert absorbed == [pytest.approx(0.1)]
+    transmittance, reflectance, absorbed = optical_properties([(0.8, 0.1, 0.1)] * 2)
+    assert transmittance == pytest.approx(0.64 / 0.99)
+    assert transmittance + reflectance + sum(absorbed) == pytest.approx(1)
+
+
+def test_window_calculator():
+    calculator = WindowCalculator(MATERIALS)
+    single = calculator.construction(_construction(['Clear']))
+    assert single['u_factor'] == pytest.approx(5.8, abs=0.1)
+    assert single['shgc'] == pytest.approx(0.87, abs=0.01)
+    assert single['vt'] == 0.9
+    assert single['window_u_factor'] == single['u_factor']
+
+    double = calculator.construction(_construction(['Clear', 'Air', 'Clear']))
+    assert double['u_factor'] == pytest.approx(2.75, abs=0.1)
+    assert double['vt'] == pytest.approx(0.81 / (1 - 0.075 ** 2))
+    low_e = calculator.construction(_construction(['Low-E', 'Argon', 'Clear']))
+    assert low_e['u_factor'] < 1.5
+    assert low_e['shgc'] < double['shgc']
+    mixture = calculator.construction(_construction(['Low-E', 'Mixture', 'Clear']))
+    assert low_e['u_factor'] < mixture['u_factor'] < double['u_factor']
+
+    simple = calculator.construction(_construction(['Simple']))
+    assert (simple['u_factor'], simple['shgc'], simple['vt']) == (2.0, 0.4, 0.54)
+
+    full = {'type': 'WindowConstruction', 'identifier': 'Full Window',
+            'materials': [CLEAR, dict(AIR, identifier='Other Air'), CLEAR]}
+    assert calculator.construction(full) == double
+
+    for materials in (['Clear', 'Clear'], ['Air'], ['Clear', 'Air'], ['Missing']):
+        with pytest.raises(ValueError):
+            calculator.construction(_construction(materials))
+
+
+def test_window_calculator_frame():
+    calculator = WindowCalculator(MATERIALS)
+    double = calculator.construction(_construction(['Clear', 'Air', 'Clear']))
+    framed = calculator.construction(
+        _construction(['Clear', 'Air', 'Clear'], frame='Frame'))
+    for key in ('u_factor', 'shgc', 'vt'):
+        assert framed[key] == double[key]
+    glass_area, total_area = 1.2 * 1.5, 1.3 * 1.6
+    assert framed['window_vt'] == pytest.approx(double['vt'] * glass_area / total_area)
+    assert framed['window_shgc'] < double['shgc']
+    assert framed['window_u_factor'] != double['u_factor']
+
+    # a worse edge of glass increases the U-factor of the window
+    edge = dict(FRAME, identifier='Edge Frame', edge_to_center_ratio=1.5)
+    calculator = WindowCalculator(MATERIALS + [edge])
+    edge_framed = calculator.construction(
+        _construction(['Clear', 'Air', 'Clear'], frame='Edge Frame'))
+    assert edge_framed['window_u_factor'] > framed['window_u_factor']
+
+
+def test_window_calculator_cache():
+    calculator = WindowCalculator(MATERIALS)
+    first = calculator.construction(_construction(['Clear', 'Air', 'Clear']))
+    count = len(calculator._gas_properties)
+    assert calculator.construction(_construction(['Clear', 'Air', 'Clear'])) == first
+    assert len(calculator._gas_properties) == count
+
+
+def test_window_calculator_reuse():
+    calculator = WindowCalculator()
+    construction = _construction(['Clear', 'Air', 'Clear'])
+    first = window_construction_properties(
+        {'materials': MATERIALS, 'constructions': [construction]}, calculator)
+
+    # a second Model with a different gas under the same identifier
+    materials = [CLEAR, dict(ARGON, identifier='Air')]
+    second = window_construction_properties(
+        {'materials': materials, 'constructions': [construction]}, calculator)
+    expected = window_construction_properties(
+        {'materials': materials, 'constructions': [construction]})
+    assert second == expected
+    assert second['Window']['u_factor'] < first['Window']['u_factor']
+    with pytest.raises(ValueError):  # the materials of the first Model are dropped
+        window_construction_properties(
+            {'materials': [], 'constructions': [construction]}, calculator)
+
+
+def test_window_construction_properties():
+    with open(os.path.join(target_folder, 'model_complete_single_zone_office.hbjson'),
+              'r', encoding='utf-8') as f:
+        model_dict = json.load(f)
+    energy = model_dict['properties']['energy']
+    results = window_construction_properties(energy)
+    windows = [c for c in energy['constructions']
+               if c['type'] == 'WindowConstructionAbridged']
+    assert len(results) == len(windows) > 0
+    for properties in results.values():
+        assert 0 < properties['u_factor'] < 6
+        assert 0 < properties['shgc'] < 1 and 0 < properties['vt'] < 1
+
+    model = Model.model_validate(model_dict)
+    assert window_construction_properties(model.properties.energy) == results